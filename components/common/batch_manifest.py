@@ -0,0 +1,355 @@
+import datetime
+import hashlib
+import json
+import os
+import threading
+
+import components.common.integrity as integrity
+import config
+
+VERSION = 1
+SIGNATURE_PERSON = b"JARSIM-batch"
+KEY_CONFIG_NAME = "batch_manifest_key"
+
+class BatchManifest:
+    """
+    Class-level manifest that signs a whole batch of generated reports at once.
+
+    The manifest holds the hash of every file in the batch and a Merkle tree over them. Only the root of the tree
+    is signed, so a whole folder is verified against one signature, and a single file is verified with a short
+    inclusion proof (one hash per tree level) instead of the whole manifest.
+
+    The signature is a blake2b MAC over the root with a secret key (see configured_key). Without a key the root only
+    gets a checksum, which catches accidental changes but can be recomputed by anyone who edits a file and the manifest,
+    so an unkeyed manifest is not called signed.
+
+    Files can be added from several worker threads at once.
+
+    Attributes:
+        key (bytes): The key the root is signed with. None for an unkeyed signature.
+        created (str): When the manifest was created (ISO 8601).
+
+    Methods:
+        add(self, name, file_hash): Adds a file hash to the manifest.
+        add_file(self, file_path, name = None): Hashes a file and adds it to the manifest.
+        names(self): Gets the names of the files in the manifest.
+        root(self): Gets the Merkle root of the manifest.
+        signature(self): Gets the signature (or checksum, without a key) of the Merkle root.
+        proof(self, name): Gets the inclusion proof of a file.
+        verify_folder(self, folder_path): Verifies the files in a folder against the manifest.
+        save(self, file_path): Saves the manifest as a JSON file.
+        save_proofs(self, folder_path): Saves the inclusion proof of every file as a JSON file.
+    """
+
+    def __init__(self, key = None, created = None):
+        """
+        Initialize the manifest instance.
+
+        Args:
+            key (bytes): The key to sign the root with (up to 64 bytes). None for an unkeyed signature.
+            created (str): When the manifest was created (ISO 8601). Defaults to now.
+        """
+        self.key = key
+        self.created = created if created is not None else datetime.datetime.now().isoformat(timespec = "seconds")
+
+        self.__files = {}
+        self.__lock = threading.Lock()
+
+    def add(self, name, file_hash):
+        """
+        Adds a file hash to the manifest. A file that is already in the manifest is replaced.
+
+        Args:
+            name (str): The file name, relative to the batch folder.
+            file_hash (str): The blake2b hash of the file (see integrity.hash_file).
+        """
+        with self.__lock:
+            self.__files[name] = file_hash
+
+    def add_file(self, file_path, name = None):
+        """
+        Hashes a file and adds it to the manifest.
+
+        Args:
+            file_path (str): The path to the file.
+            name (str): The file name to record. Defaults to the base name of the file.
+
+        Returns:
+            str: The hash of the file.
+        """
+        file_hash = integrity.hash_file(file_path)
+        self.add(name if name is not None else os.path.basename(file_path), file_hash)
+        return file_hash
+
+    def names(self):
+        """
+        Gets the names of the files in the manifest.
+
+        Returns:
+            list: The file names in the order they appear in the tree (sorted).
+        """
+        with self.__lock:
+            return sorted(self.__files)
+
+    def root(self):
+        """
+        Gets the Merkle root of the manifest.
+
+        Returns:
+            str: The root hash. The hash of an empty tree if the manifest is empty.
+        """
+        return _levels(self.__leaves())[-1][0].hex()
+
+    def signature(self):
+        """
+        Gets the signature of the Merkle root. Without a key, this is only a checksum.
+
+        Returns:
+            str: The signature.
+        """
+        return _sign(self.root(), len(self.names()), self.created, self.key)
+
+    def proof(self, name):
+        """
+        Gets the inclusion proof of a file. The proof carries the root and its signature, so it is enough to verify the file on its own (see verify_proof).
+
+        Args:
+            name (str): The file name.
+
+        Returns:
+            dict: The proof with the file name, file hash, sibling path ([side, hash] pairs from the leaf up), and the root with its signature.
+
+        Raises:
+            ValueError: If the file is not in the manifest.
+        """
+        names = self.names()
+        index = names.index(name)
+        levels = _levels(self.__leaves())
+
+        path = []
+        for level in levels[:-1]:
+            sibling = index ^ 1
+            if sibling < len(level):
+                path.append(["left" if sibling < index else "right", level[sibling].hex()])
+            index //= 2
+
+        root = levels[-1][0].hex()
+        return dict({"file": name, "hash": self.__files[name], "path": path, "root": root, "count": len(names), "created": self.created},
+                    **_seal(_sign(root, len(names), self.created, self.key), self.key))
+
+    def verify_folder(self, folder_path):
+        """
+        Verifies the files in a folder against the manifest. Each file is hashed once; the embedded JARSIM signatures are not rebuilt.
+        Load the manifest with load_manifest to check its signature first.
+
+        Args:
+            folder_path (str): The path of the folder.
+
+        Returns:
+            bool: Whether every file in the manifest is present and unchanged.
+            dict: The status of each file ("OK", "Changed", or "Missing") keyed by file name.
+        """
+        results = {}
+
+        for name in self.names():
+            file_path = os.path.join(folder_path, name)
+            if not os.path.isfile(file_path):
+                results[name] = "Missing"
+            else:
+                results[name] = "OK" if integrity.hash_file(file_path) == self.__files[name] else "Changed"
+
+        return all(status == "OK" for status in results.values()), results
+
+    def save(self, file_path):
+        """
+        Saves the manifest as a JSON file.
+
+        Args:
+            file_path (str): The path of the JSON file.
+        """
+        with open(file_path, "w", encoding = "utf-8") as json_file:
+            json.dump(self.to_dict(), json_file, indent = 4, ensure_ascii = False)
+
+    def save_proofs(self, folder_path):
+        """
+        Saves the inclusion proof of every file as "<file name>.proof.json" in a folder, e.g. to send a single report with its proof.
+
+        Args:
+            folder_path (str): The path of the folder. It is created if it does not exist.
+
+        Returns:
+            list: The paths of the saved proof files.
+        """
+        file_paths = []
+
+        for name in self.names():
+            file_path = os.path.join(folder_path, f"{name}.proof.json")
+            os.makedirs(os.path.dirname(file_path), exist_ok = True)
+            with open(file_path, "w", encoding = "utf-8") as json_file:
+                json.dump(self.proof(name), json_file, indent = 4, ensure_ascii = False)
+            file_paths.append(file_path)
+
+        return file_paths
+
+    def to_dict(self):
+        """
+        Gets the manifest as a dictionary.
+
+        Returns:
+            dict: The manifest.
+        """
+        names = self.names()
+        return dict({
+            "version": VERSION,
+            "algorithm": "blake2b",
+            "created": self.created,
+            "keyed": self.key is not None,
+            "count": len(names),
+            "files": {name: self.__files[name] for name in names},
+            "root": self.root()
+        }, **_seal(self.signature(), self.key))
+
+    def __leaves(self):
+        """Gets the leaf hashes of the tree in file name order."""
+        with self.__lock:
+            return [_leaf(name, self.__files[name]) for name in sorted(self.__files)]
+
+@staticmethod
+def parse_key(text):
+    """
+    Converts a key given as text (from the configuration or the command line) into a manifest key.
+
+    Args:
+        text (str): The key. Empty for no key.
+
+    Returns:
+        bytes: The key. None if the text is empty.
+
+    Raises:
+        ValueError: If the key is longer than 64 bytes.
+    """
+    if text is None or text == "":
+        return None
+
+    key = text.encode("utf-8")
+    if len(key) > 64:
+        raise ValueError("The batch manifest key must be at most 64 bytes long.")
+    return key
+
+@staticmethod
+def configured_key():
+    """
+    Gets the batch manifest key from the configuration ("batch_manifest_key").
+
+    Returns:
+        bytes: The key. None if no key is configured.
+    """
+    try:
+        return parse_key(config.get_config(KEY_CONFIG_NAME))
+    except (OSError, KeyError):
+        return None
+
+@staticmethod
+def load_manifest(file_path, key = None):
+    """
+    Loads a manifest from a JSON file and checks its signature (or its checksum, for an unkeyed manifest).
+
+    Args:
+        file_path (str): The path of the JSON file.
+        key (bytes): The key the root was signed with. None to load an unkeyed manifest.
+
+    Returns:
+        BatchManifest: The manifest. Its key is None if the manifest is unkeyed.
+
+    Raises:
+        ValueError: If the manifest has been changed, was signed with another key, is signed but no key was given,
+                    or is unkeyed although a key was given.
+    """
+    with open(file_path, encoding = "utf-8") as json_file:
+        data = json.load(json_file)
+
+    _check_keyed(data, key)
+
+    manifest = BatchManifest(key = key, created = data["created"])
+    for name, file_hash in data["files"].items():
+        manifest.add(name, file_hash)
+
+    if manifest.root() != data["root"] or manifest.signature() != data.get("signature", data.get("checksum")):
+        raise ValueError("The batch manifest does not match its signature. It has been changed or was signed with another key.")
+
+    return manifest
+
+@staticmethod
+def load_proof(file_path):
+    """
+    Loads an inclusion proof from a JSON file (see BatchManifest.save_proofs).
+
+    Args:
+        file_path (str): The path of the JSON file.
+
+    Returns:
+        dict: The proof.
+    """
+    with open(file_path, encoding = "utf-8") as json_file:
+        return json.load(json_file)
+
+@staticmethod
+def verify_proof(file_path, proof, key = None):
+    """
+    Verifies a single file with its inclusion proof: the file must lead up to the root in the proof, and the root
+    must match its signature (or its checksum, for an unkeyed batch).
+
+    Args:
+        file_path (str): The path to the file.
+        proof (dict): The inclusion proof of the file (see BatchManifest.proof).
+        key (bytes): The key the batch was signed with. None to verify a proof of an unkeyed batch.
+
+    Returns:
+        bool: Whether the file is unchanged and part of the batch.
+
+    Raises:
+        ValueError: If the batch is signed but no key was given, or is unkeyed although a key was given.
+    """
+    _check_keyed(proof, key)
+
+    node = _leaf(proof["file"], integrity.hash_file(file_path))
+    for side, sibling in proof["path"]:
+        node = _node(bytes.fromhex(sibling), node) if side == "left" else _node(node, bytes.fromhex(sibling))
+
+    signature = _sign(proof["root"], proof["count"], proof["created"], key)
+    return node.hex() == proof["root"] and signature == proof.get("signature", proof.get("checksum"))
+
+def _seal(value, key):
+    """Names the seal of a root: a signature with a key, or only a checksum without one."""
+    return {"signature": value} if key is not None else {"checksum": value}
+
+def _check_keyed(data, key):
+    """Checks that a manifest or proof is signed exactly when a key is given, so that a signed batch cannot be passed off as an unkeyed one."""
+    if data.get("keyed", "signature" in data) and key is None:
+        raise ValueError("The batch manifest is signed with a key. Please provide the key to verify it.")
+    if not data.get("keyed", "signature" in data) and key is not None:
+        raise ValueError("The batch manifest is not signed with a key, so it cannot prove that the reports are authentic.")
+
+def _leaf(name, file_hash):
+    """Gets the leaf hash of a file. Leaves and nodes are domain-separated so that a node cannot pass as a leaf."""
+    return hashlib.blake2b(b"\x00" + name.encode("utf-8") + b"\x00" + bytes.fromhex(file_hash)).digest()
+
+def _node(left, right):
+    """Gets the hash of an inner node."""
+    return hashlib.blake2b(b"\x01" + left + right).digest()
+
+def _levels(leaves):
+    """
+    Builds the levels of a Merkle tree from the leaves up. An odd node at the end of a level is carried up unchanged
+    rather than paired with itself, so that no two different batches share a root.
+    """
+    levels = [leaves if len(leaves) > 0 else [hashlib.blake2b(b"").digest()]]
+    while len(levels[-1]) > 1:
+        level = levels[-1]
+        levels.append([_node(level[i], level[i + 1]) if i + 1 < len(level) else level[i] for i in range(0, len(level), 2)])
+    return levels
+
+def _sign(root, count, created, key):
+    """Signs the root of a batch together with its size and creation time."""
+    message = f"{VERSION}|{created}|{count}|{root}".encode("utf-8")
+    return hashlib.blake2b(message, key = key or b"", person = SIGNATURE_PERSON).hexdigest()
@@ -0,0 +1,185 @@
+import contextlib
+import io
+import os
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+import components.common.integrity as integrity
+import components.common.metadata as metadata
+import components.common.verification_cache as verification_cache
+from components.common.ledger import SigningLedger
+
+COLUMNS = ["File", "Result", "Reason", "Serial Number", "Signed By", "Signed On"]
+
+# Ledgers opened by this (worker) process, keyed by path
+_ledgers = {}
+
+# Not a staticmethod, so that it can be sent to worker processes
+def verify_file(file_path, ledger_path = None):
+    """
+    Verifies a single PDF file without printing the verification steps.
+
+    Args:
+        file_path (str): The path to the file to be verified.
+        ledger_path (str): The path of a signing ledger. Files recorded in the ledger are verified with a lookup instead of rebuilding them.
+
+    Returns:
+        dict: The verification result with the keys in COLUMNS. The result is "Pass", "Fail", or "Error" (the file could not be read).
+    """
+    result = dict.fromkeys(COLUMNS, "")
+    result["File"] = file_path
+
+    try:
+        with open(file_path, "rb") as file:
+            data = file.read()
+
+        passed = None
+        if ledger_path is not None:
+            passed, result["Reason"] = _ledger(ledger_path).verify_by_ledger(data = data)
+
+        if passed is None:
+            with contextlib.redirect_stdout(io.StringIO()):
+                passed, result["Reason"] = integrity.verify_pdf_data(data)
+        result["Result"] = "Pass" if passed else "Fail"
+
+        pdf_metadata = metadata.read_pdf_metadata(io.BytesIO(data)) or {}
+        result["Serial Number"] = str(pdf_metadata.get("/Serial Number", ""))
+        result["Signed By"] = str(pdf_metadata.get("/Signed By", ""))
+        result["Signed On"] = str(pdf_metadata.get("/Signed On", ""))
+    except Exception as e:
+        result["Result"] = "Error"
+        result["Reason"] = f"The file could not be read. Details: {e}"
+
+    return result
+
+@staticmethod
+def find_pdfs(folder_path):
+    """
+    Finds every PDF file under a folder, including its subfolders.
+
+    Args:
+        folder_path (str): The path of the folder.
+
+    Returns:
+        list: The paths of the PDF files in alphabetical order.
+    """
+    return sorted(os.path.join(root, file) for root, _, files in os.walk(folder_path) for file in files if file.lower().endswith(".pdf"))
+
+@staticmethod
+def verify_files(file_paths, workers = None, callback = None, ledger_path = None, cache = None):
+    """
+    Verifies PDF files on a pool of worker processes. A file that fails or cannot be read does not stop the others.
+
+    Args:
+        file_paths (list): The paths of the files to be verified.
+        workers (int): The number of worker processes. Defaults to the number of CPU cores.
+        callback (function): The callback function to be called after each file is verified.
+        ledger_path (str): The path of a signing ledger to look the files up in first (see verify_file).
+        cache (VerificationCache): The cache of previous results. Files that are unchanged since they were verified in the same mode
+                                   (with or without the same ledger) are not verified again, and the new results are stored in it.
+
+    Returns:
+        list: The verification results (see verify_file) in the order of the given paths.
+    """
+    results = {}
+    total = len(file_paths)
+    done = 0
+
+    if total == 0:
+        return []
+
+    # The identity of each file is read before it is verified, so that a file changed in the meantime is verified again next time
+    identities = {}
+    mode = verification_cache.verification_mode(ledger_path) if cache is not None else None
+
+    pending = []
+    for file_path in file_paths:
+        result = None
+        if cache is not None:
+            identities[file_path] = verification_cache.identify(file_path)
+            result = cache.get(file_path, identities[file_path], mode)
+        if result is None:
+            pending.append(file_path)
+            continue
+
+        result["File"] = file_path
+        results[file_path] = result
+        done += 1
+        if callback is not None:
+            callback(done, total, f"{result['Result']}: {result['File']}")
+
+    def record(file_path, result):
+        nonlocal done
+        results[file_path] = result
+        # Files that could not be read are tried again on the next scan
+        if cache is not None and result["Result"] != "Error":
+            cache.put(file_path, identities[file_path], result, mode)
+        done += 1
+        if callback is not None:
+            callback(done, total, f"{result['Result']}: {result['File']}")
+
+    # A worker process that dies (e.g. on a file that crashes pypdf) breaks the whole pool and every file still in it.
+    # Those files are verified again one at a time, where the first file that breaks the pool is the one that crashed it.
+    isolate = False
+    while len(pending) > 0:
+        broken = {}
+        with ProcessPoolExecutor(max_workers = 1 if isolate else min(workers or os.cpu_count() or 1, len(pending))) as executor:
+            futures = {executor.submit(verify_file, file_path, ledger_path): file_path for file_path in pending}
+            for future in as_completed(futures):
+                try:
+                    record(futures[future], future.result())
+                except BrokenExecutor as e:
+                    broken[futures[future]] = e
+                except Exception as e:
+                    record(futures[future], error_result(futures[future], e))
+
+        pending = [file_path for file_path in pending if file_path in broken]
+        if isolate and len(pending) > 0:
+            record(pending[0], error_result(pending[0], broken[pending[0]]))
+            pending = pending[1:]
+        isolate = True
+
+    return [results[file_path] for file_path in file_paths]
+
+@staticmethod
+def error_result(file_path, error):
+    """
+    Builds the result of a file that could not be verified, e.g. because its worker process died.
+
+    Args:
+        file_path (str): The path to the file.
+        error (Exception): The error.
+
+    Returns:
+        dict: The verification result (see verify_file) with the result "Error".
+    """
+    result = dict.fromkeys(COLUMNS, "")
+    result["File"] = file_path
+    result["Result"] = "Error"
+    result["Reason"] = f"The file could not be verified. Details: {error}"
+    return result
+
+@staticmethod
+def export_results(results, file_path):
+    """
+    Saves verification results as a summary table. The format follows the file extension (.csv or .xlsx).
+
+    Args:
+        results (list): The verification results (see verify_file).
+        file_path (str): The path of the summary file.
+    """
+    table = pd.DataFrame(results, columns = COLUMNS)
+
+    if file_path.lower().endswith(".csv"):
+        table.to_csv(file_path, index = False, encoding = "utf-8-sig")
+    elif file_path.lower().endswith(".xlsx"):
+        table.to_excel(file_path, sheet_name = "Verification Summary", index = False)
+    else:
+        raise ValueError(f"Unsupported summary format: {file_path}. Use a .csv or .xlsx file.")
+
+def _ledger(ledger_path):
+    """Gets the existing ledger at a path, opening it once per process."""
+    if ledger_path not in _ledgers:
+        _ledgers[ledger_path] = SigningLedger(ledger_path)
+    return _ledgers[ledger_path]
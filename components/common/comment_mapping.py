@@ -0,0 +1,72 @@
+class CommentMappingIndex:
+    """
+    Comment mapping compiled into nested dictionaries.
+
+    The comment mapping sheet is read once per grader report into an intro and closing sentence per letter grade,
+    and a sentence per goal and grade with a flag for negative ("However…") sentences. Generating a comment then
+    only does dictionary lookups instead of copying and indexing the data frame for every student.
+    The index is never changed after it is built, so all students (and worker threads) share it.
+
+    Attributes:
+        intro (dict): The intro sentence keyed by letter grade.
+        closing (dict): The closing sentence keyed by letter grade.
+        goals (dict): The sentence of each goal and grade, keyed by goal and then grade. Each sentence is a
+                      (sentence, negative) tuple, or None if the cell is empty.
+
+    Methods:
+        sentence(self, goal, grade): Gets the sentence of a goal and grade.
+        has(self, goal, grade): Checks whether a goal and grade are in the mapping.
+    """
+
+    def __init__(self, comment_mapping):
+        """
+        Initialize the index instance.
+
+        Args:
+            comment_mapping (pandas.DataFrame): The comment mapping with the goals as the index and the grades as the columns.
+        """
+        mapping = comment_mapping.fillna("")
+
+        # Blank rows of the sheet share an empty label, so only the first row or column of a label is used
+        rows = {}
+        for goal, values in zip(mapping.index, mapping.itertuples(index = False, name = None)):
+            if goal not in rows:
+                rows[goal] = {}
+                for grade, sentence in zip(mapping.columns, values):
+                    rows[goal].setdefault(grade, sentence)
+
+        self.intro = dict(rows.get("Intro", {}))
+        self.closing = dict(rows.get("Closing", {}))
+        self.goals = {goal: {grade: _compile(sentence) for grade, sentence in sentences.items()} for goal, sentences in rows.items()}
+
+    def has(self, goal, grade):
+        """
+        Checks whether a goal and grade are in the mapping (even if the sentence is empty).
+
+        Args:
+            goal (str): The goal.
+            grade (str): The grade.
+
+        Returns:
+            bool: Whether the goal and grade are in the mapping.
+        """
+        return goal in self.goals and grade in self.goals[goal]
+
+    def sentence(self, goal, grade):
+        """
+        Gets the sentence of a goal and grade.
+
+        Args:
+            goal (str): The goal.
+            grade (str): The grade.
+
+        Returns:
+            tuple: The sentence and whether it is negative. None if the goal or grade is not in the mapping or the sentence is empty.
+        """
+        return self.goals.get(goal, {}).get(grade)
+
+def _compile(sentence):
+    """Gets the (sentence, negative) entry of a mapping cell. Empty cells (including the "nan" text of a missing value) are None."""
+    if not isinstance(sentence, str) or len(sentence) == 0 or sentence == "nan":
+        return None
+    return sentence, sentence.startswith("However")
@@ -4,14 +4,18 @@ import pandas as pd
 from termcolor import colored
 from openpyxl import load_workbook
 
+from components.common.comment_mapping import CommentMappingIndex
+from components.common.profiler import Profiler
+
 class GraderReport:
-    def __init__(self, grader_report_path, skip_validation = False, callback = None):
+    def __init__(self, grader_report_path, skip_validation = False, callback = None, profiler: Profiler = None):
         """
         Initialize the grader report instance.
 
         Args:
             grader_report_path (str): The path of the grader report.
             output_path (str): The path of the output file.
+            profiler (Profiler): The profiler to record the loading and validation time with.
 
         Returns:
             Generator: The initialized grader report instance.
@@ -20,8 +24,33 @@ class GraderReport:
         print("[  ] Initializing generator...")
 
         self.grader_report_path = grader_report_path
+        self.profiler = profiler if profiler is not None else Profiler()
         self.__data_broken = False
 
+        with self.profiler.span("load"):
+            self.__load(callback)
+
+        if self.__data_broken:
+            return
+        
+        self.__prepare_data()
+
+        if not skip_validation:
+            self.validate()
+            if not self.data_valid:
+                print(colored("\n"
+                    f"Attention: There are missing values in the grader report! Please check the grader report again and make sure all data is filled.",
+                    "white", "on_red"), "\n")
+
+        print("[OK] Report generator initialized!")
+
+    def __load(self, callback = None):
+        """
+        Reads the grader report sheets into data frames.
+
+        Args:
+            callback (function): The callback function to report warnings and errors to.
+        """
         # Get the file version from the status property
         props = load_workbook(self.grader_report_path).properties
         self._version = props.version if props.version is not None else "1.0"
@@ -46,18 +75,6 @@ class GraderReport:
             print(colored(f"Details: {e}", "red"))
             if callback is not None:
                 callback(output_text)
-            return
-        
-        self.__prepare_data()
-
-        if not skip_validation:
-            self.validate()
-            if not self.data_valid:
-                print(colored("\n"
-                    f"Attention: There are missing values in the grader report! Please check the grader report again and make sure all data is filled.",
-                    "white", "on_red"), "\n")
-
-        print("[OK] Report generator initialized!")
 
     # Getters
     def get_course_info(self, item):
@@ -211,6 +228,13 @@ class GraderReport:
         Returns:
             bool: Whether the data is valid or not.
         """
+        with self.profiler.span("validation"):
+            return self.__validate(callback)
+
+    def __validate(self, callback = None):
+        """
+        Validates the data in the grader report. See validate().
+        """
         if self.__data_broken:
             output_text = "Error: Unable to validate the grader report due to data corruption or template incompliance. Please make sure to use the base template designed for JARS."
             print(colored(output_text, "white", "on_red"))
@@ -377,6 +401,9 @@ class GraderReport:
         unwanted_columns = ["Normalized Grade", "Student Final Grade", "Sanity Check", "Add item…"]
         unwanted_columns += [column for column in self.data_sna.columns if column.startswith("Unnamed")]
         self.data_sna = self.data_sna.drop(columns = unwanted_columns)
+
+        # Compiled once and shared by the comment generator of every student
+        self.comment_mapping_index = CommentMappingIndex(self.data_comment_mapping)
                         
     def _load_sna_rules(self):
         """Load SNA compliance rules from JSON file."""
@@ -1,5 +1,6 @@
 import datetime
 import hashlib
+import io
 
 from termcolor import colored
 
@@ -14,20 +15,22 @@ def hash_file(path):
     Returns:
         str: The hash of the file.
     """
-    # Make a hash object
-    hash = hashlib.blake2b()
-    
-    # Open file for reading in binary mode
+    # Read the file in large blocks straight into the hash object
     with open(path, "rb") as file:
-        # Loop till the end of the file
-        chunk = 0
-        while chunk != b'':
-            # Read only 1024 bytes at a time
-            chunk = file.read(1024)
-            hash.update(chunk)
-    
-    # return the hex representation of digest
-    return hash.hexdigest()
+        return hashlib.file_digest(file, hashlib.blake2b).hexdigest()
+
+@staticmethod
+def hash_bytes(data):
+    """
+    Hashes in-memory data using blake2b algorithm. Gives the same hash as hash_file for a file with the same content.
+
+    Args:
+        data (bytes): The data to be hashed.
+
+    Returns:
+        str: The hash of the data.
+    """
+    return hashlib.blake2b(data).hexdigest()
 
 @staticmethod
 def generate_serial_number(file_path):
@@ -42,13 +45,11 @@ def generate_serial_number(file_path):
     Returns:
         str: The serial number.
     """
-    # Get the current date
+    return _serial_number(hash_file(file_path))
+
+def _serial_number(hash):
+    """Builds a serial number from the current date and a file hash."""
     date = datetime.datetime.now().strftime("%Y%m%d")
-    
-    # Get the hash of the file
-    hash = hash_file(file_path)
-    
-    # Return the serial number
     return f"{date}-{hash[:8]}-{hash[-8:]}"
 
 @staticmethod
@@ -71,39 +72,61 @@ def sign_pdf(file_path, verbose = False):
     Returns:
         str: The hash of the file.
     """
-    
+    if verbose:
+        print(f"Signing file: {file_path}")
+
+    # The intermediate revisions are hashed in memory and the file is written once
+    return finalize_pdf(file_path, verbose = verbose)
+
+# Not a staticmethod, so that it can be sent to worker processes
+def finalize_pdf(file_path, metadata = None, optimize = False, verbose = False):
+    """
+    Injects metadata into a PDF file and signs it using the JARSIM Digital Signature in a single pass.
+
+    The file is read and parsed once and written once. The intermediate revisions (with the metadata, then with
+    the serial number) are only serialized in memory to be hashed, so the result is verified by verify_pdf exactly
+    like a file that was injected and signed in separate steps.
+
+    Args:
+        file_path (str): The path to the file to be finalized.
+        metadata (dict): The metadata to inject (see metadata.build_metadata). The existing metadata of the file is kept if not given.
+        optimize (bool): Whether to optimize the size of the file before signing it (see optimizer.optimize_pdf_data).
+        verbose (bool): Whether to print verbose output or not.
+
+    Returns:
+        str: The hash of the file.
+    """
     from pypdf import PdfWriter, PdfReader
 
     if verbose:
-        print(f"Signing file: {file_path}")
+        print(f"Finalizing file: {file_path}")
 
-    reader = PdfReader(file_path)
+    with open(file_path, "rb") as file:
+        data = file.read()
+
+    if optimize:
+        from components.common.optimizer import optimize_pdf_data
+        data = optimize_pdf_data(data)
+
+    reader = PdfReader(io.BytesIO(data))
     writer = PdfWriter()
 
     for page in reader.pages:
         writer.add_page(page)
 
-    metadata = reader.metadata
+    if metadata is None:
+        metadata = reader.metadata or {}
     writer.add_metadata(metadata)
+
+    # 1. Serial number from the revision with the metadata
     writer.add_metadata(
         {
-            "/Serial Number": generate_serial_number(file_path)
+            "/Serial Number": _serial_number(hash_bytes(_serialize(writer)))
         }
     )
 
-    with open(file_path, "wb") as file:
-        writer.write(file)
-
-    hash = hash_file(file_path)
-
-    reader = PdfReader(file_path)
-    writer = PdfWriter()
-
-    for page in reader.pages:
-        writer.add_page(page)
-
-    metadata = reader.metadata
-    writer.add_metadata(metadata)
+    # 2. Hash of the revision with the serial number
+    hash = hash_bytes(_serialize(writer))
     writer.add_metadata(
         {
             "/Signed By": "JARS InManage",
@@ -121,6 +144,12 @@ def sign_pdf(file_path, verbose = False):
 
     return hash
 
+def _serialize(writer):
+    """Writes a PDF writer into memory and returns the bytes."""
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
 @staticmethod
 def verify_pdf(file_path, verbose = False):
     """
@@ -131,6 +160,9 @@ def verify_pdf(file_path, verbose = False):
     2. Check if the serial number matches
     The file is considered integrous if both checks pass.
 
+    The file is only read; nothing is written to disk, so files on read-only media can be verified
+    and several files in the same folder can be verified at once.
+
     Note: This function only verifies the JARSIM Digital Signature and does not verify the authenticity of the signer.
 
     Args:
@@ -141,14 +173,32 @@ def verify_pdf(file_path, verbose = False):
         bool: Whether the file is integrous or not.
         str: The log texts from the process.
     """
-    import os
-    from pypdf import PdfReader, PdfWriter
-
     print(colored(f"\nv^ Verifying file: {file_path}", "white", "on_magenta"))
 
-    # 1. Check if the hash matches
-    print(colored("v^ Step 1 > Checking Hash", "magenta"))
-    reader = PdfReader(file_path)
+    with open(file_path, "rb") as file:
+        data = file.read()
+
+    return verify_pdf_data(data, verbose = verbose)
+
+@staticmethod
+def verify_pdf_data(data, verbose = False):
+    """
+    Verifies the integrity of a PDF file in memory. See verify_pdf for the verification process.
+
+    The PDF is parsed once. Both unsigned revisions (without the signature, and without the serial number)
+    are rebuilt from the same parse in memory and each is hashed once.
+
+    Args:
+        data (bytes): The PDF file data.
+        verbose (bool): Whether to print verbose output or not.
+
+    Returns:
+        bool: Whether the file is integrous or not.
+        str: The log texts from the process.
+    """
+    from pypdf import PdfReader, PdfWriter
+
+    reader = PdfReader(io.BytesIO(data))
     writer = PdfWriter()
 
     for page in reader.pages:
@@ -156,6 +206,8 @@ def verify_pdf(file_path, verbose = False):
 
     metadata = reader.metadata
 
+    # 1. Check if the hash matches
+    print(colored("v^ Step 1 > Checking Hash", "magenta"))
     try:
         stored_hash = metadata.pop("/Hash")
         metadata.pop("/Signed By")
@@ -167,13 +219,16 @@ def verify_pdf(file_path, verbose = False):
               colored(output_text, "white", "on_red"))
         return False, output_text
 
+    # The serial number was the last entry added before signing, so the revision without it is built first
+    # and the serial number is added on top for the signed revision
+    sn = metadata.pop("/Serial Number", None)
     writer.add_metadata(metadata)
+    unserialized_data = _serialize(writer)
 
-    temp_file = os.path.splitext(file_path)[0]
-    writer.write(f"{temp_file}.temp.pdf")
+    if sn is not None:
+        writer.add_metadata({"/Serial Number": sn})
+    computed_hash = hash_bytes(_serialize(writer)) if sn is not None else hash_bytes(unserialized_data)
 
-    computed_hash = hash_file(f"{temp_file}.temp.pdf")
-    
     if verbose:
         print(f"Stored hash: {stored_hash[:8]} vs Computed hash: {computed_hash[:8]}")
     
@@ -181,7 +236,6 @@ def verify_pdf(file_path, verbose = False):
         output_text = "The file is signed but the hash does not match. It is very likely that it has been tampered with."
         print(colored("(!)", "red"),
               colored(output_text, "white", "on_red"))
-        os.remove(f"{temp_file}.temp.pdf")
         return False, output_text
     else:
         print(colored("v^", "green"), 
@@ -189,31 +243,18 @@ def verify_pdf(file_path, verbose = False):
     
     # 2. Check if the serial number matches
     print(colored("v^ Step 2 > Checking Serial number", "magenta"))
-    tf_reader = PdfReader(f"{temp_file}.temp.pdf")
-    tf_writer = PdfWriter()
-
-    for page in tf_reader.pages:
-        tf_writer.add_page(page)
-    
-    tf_metadata = tf_reader.metadata
-    try:
-        sn = tf_metadata.pop("/Serial Number")
-    except:
+    if sn is None:
         output_text = "The file is signed but the serial number is missing. It is very likely that it has been tampered with."
         print(colored("(!)", "red"),
               colored(output_text, "white", "on_red"))
         return False, output_text
 
-    tf_writer.add_metadata(tf_metadata)
-    tf_writer.write(f"{temp_file}.temp.pdf")
-
     sn_split = sn.split("-")
     sn_hash_start = sn_split[1]
     sn_hash_end = sn_split[2]
-    sn_computed_hash_start = hash_file(f"{temp_file}.temp.pdf")[:8]
-    sn_computed_hash_end = hash_file(f"{temp_file}.temp.pdf")[-8:]
-
-    os.remove(f"{temp_file}.temp.pdf")
+    sn_computed_hash = hash_bytes(unserialized_data)
+    sn_computed_hash_start = sn_computed_hash[:8]
+    sn_computed_hash_end = sn_computed_hash[-8:]
 
     if verbose:
         print(f"Stored serial number: {sn_hash_start}...{sn_hash_end} vs Computed serial number: {sn_computed_hash_start}...{sn_computed_hash_end}")
@@ -227,4 +268,4 @@ def verify_pdf(file_path, verbose = False):
         output_text = "The file is signed, the hash matches, and the serial number matches. This file is integrous and is highly unlikely to have been tampered with."
         print(colored("v^", "green"), 
               colored(output_text, "white", "on_green"))
-        return True, output_text
\ No newline at end of file
+        return True, output_text
@@ -0,0 +1,218 @@
+import datetime
+import io
+import os
+import pathlib
+import sqlite3
+import threading
+
+import components.common.integrity as integrity
+import components.common.metadata as metadata
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS signatures (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    serial_number TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    file_hash TEXT NOT NULL,
+    file_name TEXT,
+    student TEXT,
+    subject TEXT,
+    grade TEXT,
+    semester TEXT,
+    school_year TEXT,
+    signed_on TEXT NOT NULL,
+    superseded_by TEXT
+);
+CREATE INDEX IF NOT EXISTS signatures_serial_number ON signatures (serial_number);
+CREATE INDEX IF NOT EXISTS signatures_hash ON signatures (hash);
+CREATE INDEX IF NOT EXISTS signatures_file_hash ON signatures (file_hash);
+CREATE INDEX IF NOT EXISTS signatures_report ON signatures (student, subject, grade, semester, school_year);
+"""
+
+class SigningLedger:
+    """
+    Local SQLite ledger of every signed report.
+
+    Each signed PDF is recorded with its serial number, JARSIM hash, whole-file hash, student, and course. A file can then
+    be verified with one indexed lookup of its file hash instead of rebuilding its unsigned revisions (see verify_by_ledger).
+    When a report of the same student and course is signed again, the earlier entries are marked as superseded.
+
+    Entries can be recorded from several worker threads at once.
+
+    Attributes:
+        file_path (str): The path of the ledger database.
+
+    Methods:
+        record(self, file_path, ...): Records a signed PDF file.
+        lookup_serial(self, serial_number): Gets the entries with a serial number.
+        lookup_hash(self, hash): Gets the entries with a JARSIM hash or file hash.
+        duplicates(self): Gets the serial numbers that were recorded for more than one file.
+        verify_by_ledger(self, file_path): Verifies a file against the ledger.
+        close(self): Closes the ledger database.
+    """
+
+    def __init__(self, file_path, create = False):
+        """
+        Initialize the ledger instance.
+
+        Args:
+            file_path (str): The path of the ledger database.
+            create (bool): Whether to create the database if it does not exist (when signing). Otherwise, an existing
+                           ledger is opened, so that a mistyped path is reported instead of creating an empty ledger.
+
+        Raises:
+            FileNotFoundError: The ledger does not exist and create is False.
+            ValueError: The file is not a signing ledger.
+        """
+        self.file_path = file_path
+
+        self.__lock = threading.Lock()
+
+        if create:
+            self.__connection = sqlite3.connect(file_path, check_same_thread = False, timeout = 30)
+        else:
+            if not os.path.isfile(file_path):
+                raise FileNotFoundError(f"The signing ledger {file_path} does not exist.")
+            # mode=rw never creates the database, even if the file is removed in the meantime
+            self.__connection = sqlite3.connect(f"{pathlib.Path(os.path.abspath(file_path)).as_uri()}?mode=rw", uri = True, check_same_thread = False, timeout = 30)
+
+        self.__connection.row_factory = sqlite3.Row
+        try:
+            if create:
+                with self.__connection:
+                    self.__connection.executescript(SCHEMA)
+            elif self.__connection.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'signatures'").fetchone() is None:
+                raise ValueError(f"{file_path} is not a signing ledger.")
+        except sqlite3.DatabaseError as e:
+            self.__connection.close()
+            raise ValueError(f"{file_path} is not a signing ledger ({e}).")
+        except ValueError:
+            self.__connection.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def record(self, file_path, student = None, subject = None, grade = None, semester = None, school_year = None, data = None):
+        """
+        Records a signed PDF file. The serial number, hash, and signing time are read from the file's metadata.
+        Earlier entries of the same student and course are marked as superseded by this one.
+
+        Args:
+            file_path (str): The path to the signed file.
+            student (str): The name of the student.
+            subject (str): The subject of the report.
+            grade (str): The grade (class) of the report.
+            semester (str): The semester of the report.
+            school_year (str): The school year of the report.
+            data (bytes): The content of the file, if it has already been read.
+
+        Returns:
+            str: The serial number of the file.
+        """
+        if data is None:
+            with open(file_path, "rb") as file:
+                data = file.read()
+
+        pdf_metadata = metadata.read_pdf_metadata(io.BytesIO(data)) or {}
+        serial_number = str(pdf_metadata["/Serial Number"])
+        report = [_text(student), _text(subject), _text(grade), _text(semester), _text(school_year)]
+
+        with self.__lock, self.__connection:
+            if student is not None:
+                self.__connection.execute("UPDATE signatures SET superseded_by = ? WHERE student IS ? AND subject IS ? AND grade IS ? "
+                                          "AND semester IS ? AND school_year IS ? AND superseded_by IS NULL", [serial_number] + report)
+
+            self.__connection.execute("INSERT INTO signatures (serial_number, hash, file_hash, file_name, student, subject, grade, semester, school_year, signed_on) "
+                                      "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                      [serial_number, str(pdf_metadata["/Hash"]), integrity.hash_bytes(data), file_path] + report
+                                      + [str(pdf_metadata.get("/Signed On", datetime.datetime.now().strftime("%Y/%m/%d @ %H:%M:%S")))])
+
+        return serial_number
+
+    def lookup_serial(self, serial_number):
+        """
+        Gets the entries with a serial number.
+
+        Args:
+            serial_number (str): The serial number.
+
+        Returns:
+            list: The entries (dict) in the order they were recorded.
+        """
+        return self.__query("SELECT * FROM signatures WHERE serial_number = ? ORDER BY id", [serial_number])
+
+    def lookup_hash(self, hash):
+        """
+        Gets the entries with a JARSIM hash or whole-file hash.
+
+        Args:
+            hash (str): The hash.
+
+        Returns:
+            list: The entries (dict) in the order they were recorded.
+        """
+        return self.__query("SELECT * FROM signatures WHERE file_hash = ? UNION SELECT * FROM signatures WHERE hash = ? ORDER BY id", [hash, hash])
+
+    def duplicates(self):
+        """
+        Gets the serial numbers that were recorded for more than one distinct file.
+
+        Returns:
+            dict: The number of distinct files keyed by serial number.
+        """
+        rows = self.__query("SELECT serial_number, COUNT(DISTINCT file_hash) AS count FROM signatures GROUP BY serial_number HAVING count > 1")
+        return {row["serial_number"]: row["count"] for row in rows}
+
+    def verify_by_ledger(self, file_path = None, data = None):
+        """
+        Verifies a file against the ledger. The whole file is hashed once and looked up; the PDF is not rewritten.
+
+        Args:
+            file_path (str): The path to the file to be verified.
+            data (bytes): The content of the file, if it has already been read.
+
+        Returns:
+            bool: Whether the file is integrous or not. None if the file is not in the ledger (verify it with integrity.verify_pdf instead).
+            str: The log texts from the process.
+        """
+        if data is None:
+            with open(file_path, "rb") as file:
+                data = file.read()
+
+        entries = self.__query("SELECT * FROM signatures WHERE file_hash = ? ORDER BY id", [integrity.hash_bytes(data)])
+
+        if len(entries) > 0:
+            entry = entries[-1]
+            output_text = f"The file matches the ledger entry {entry['serial_number']} signed on {entry['signed_on']}. This file is integrous and is highly unlikely to have been tampered with."
+            if entry["superseded_by"] is not None:
+                output_text += f" Note: This report has been superseded by {entry['superseded_by']}."
+            return True, output_text
+
+        # Not a recorded file. If its serial number is recorded, the file was changed after signing.
+        try:
+            serial_number = (metadata.read_pdf_metadata(io.BytesIO(data)) or {}).get("/Serial Number")
+        except Exception:
+            serial_number = None
+
+        if serial_number is not None and len(self.lookup_serial(str(serial_number))) > 0:
+            return False, f"The serial number {serial_number} is recorded in the ledger for a different file. It is very likely that this file has been tampered with."
+
+        return None, "The file is not recorded in the ledger."
+
+    def close(self):
+        """Closes the ledger database."""
+        with self.__lock:
+            self.__connection.close()
+
+    def __query(self, query, parameters = ()):
+        """Runs a query and returns the rows as dictionaries."""
+        with self.__lock:
+            return [dict(row) for row in self.__connection.execute(query, parameters).fetchall()]
+
+def _text(value):
+    """Converts a value to text for the ledger. None stays None."""
+    return str(value) if value is not None else None
@@ -1,6 +1,37 @@
+import os
+import re
 from datetime import datetime
 
-from pypdf import PdfWriter, PdfReader
+from pypdf import DocumentInformation, PdfWriter, PdfReader
+from pypdf.generic import read_object
+
+TAIL_SIZE = 1024
+XREF_ENTRY_SIZE = 20
+
+@staticmethod
+def build_metadata(student_name, grader_report, time_docsaved = datetime.now()):
+    """
+    Builds the generic metadata of a report card PDF file.
+
+    Args:
+        student_name (str): The name of the student.
+        grader_report (GraderReport): The GraderReport object to be used.
+        time_docsaved (datetime.datetime): The time the document was saved.
+
+    Returns:
+        dict: The metadata keyed by PDF name (e.g. "/Title").
+    """
+    return {
+        "/Author": "JAC Academic Reporting System",
+        "/Title": f"{student_name} - {grader_report.get_course_info('Subject')} - S{grader_report.get_course_info('Semester')} AY{grader_report.get_course_info('School Year')} Report Card",
+        "/Category": "Semester Report Card",
+        "/Revision": 1,
+        "/Keywords": "JAC; JARS; Report Card; Semester Report Card",
+        "/Generated Time": time_docsaved.strftime(f"%Y/%m/%d @ %H:%M:%S"),
+        "/CreationDate": datetime.now().strftime(f"D\072%Y%m%d%H%M%S%z"),
+        "/Creator": "JARS/CReP 1.0.0",
+        "/Producer": "pypdf2 @ JARS/CReP 1.0.0",
+    }
 
 @staticmethod
 def pdf_inject(file_path, student_name, grader_report, time_docsaved = datetime.now()):
@@ -20,26 +51,14 @@ def pdf_inject(file_path, student_name, grader_report, time_docsaved = datetime.
     for page in reader.pages:
         writer.add_page(page)
 
-    writer.add_metadata(
-        {
-            "/Author": "JAC Academic Reporting System",
-            "/Title": f"{student_name} - {grader_report.get_course_info('Subject')} - S{grader_report.get_course_info('Semester')} AY{grader_report.get_course_info('School Year')} Report Card",
-            "/Category": "Semester Report Card",
-            "/Revision": 1,
-            "/Keywords": "JAC; JARS; Report Card; Semester Report Card",
-            "/Generated Time": time_docsaved.strftime(f"%Y/%m/%d @ %H:%M:%S"),
-            "/CreationDate": datetime.now().strftime(f"D\072%Y%m%d%H%M%S%z"),
-            "/Creator": "JARS/CReP 1.0.0",
-            "/Producer": "pypdf2 @ JARS/CReP 1.0.0",
-        }
-    )
+    writer.add_metadata(build_metadata(student_name, grader_report, time_docsaved))
 
     with open(file_path, "wb") as output:
         writer.write(output)
 
 def get_pdf_metadata(file_path):
     """
-    Gets the metadata of a PDF file.
+    Gets the metadata of a PDF file. Only the end of the file and the metadata object are read (see read_pdf_metadata).
 
     Args:
         file_path (str): The path to the file to be signed.
@@ -47,5 +66,115 @@ def get_pdf_metadata(file_path):
     Returns:
         dict: The metadata of the file.
     """
-    reader = PdfReader(file_path)
-    return reader.metadata
\ No newline at end of file
+    with open(file_path, "rb") as file:
+        return read_pdf_metadata(file)
+
+def read_pdf_metadata(stream):
+    """
+    Gets the metadata of a PDF file from a binary stream.
+
+    The trailer is found from the end of the file, and only the cross-reference entry of the document information
+    dictionary and the dictionary itself are read, instead of loading the whole file and its cross-reference table.
+    Files this does not cover (cross-reference streams, encrypted files, or damaged files) are read with PdfReader instead.
+
+    Args:
+        stream (BinaryIO): The seekable binary stream of the PDF file.
+
+    Returns:
+        dict: The metadata of the file. None if the file has no metadata.
+    """
+    try:
+        return _read_info(stream)
+    except Exception:
+        stream.seek(0)
+        return PdfReader(stream).metadata
+
+def _read_info(stream):
+    """
+    Reads the document information dictionary through the trailer and the cross-reference table.
+
+    Raises:
+        ValueError: If the file cannot be read this way.
+    """
+    stream.seek(0, os.SEEK_END)
+    size = stream.tell()
+    stream.seek(max(0, size - TAIL_SIZE))
+    matches = list(re.finditer(rb"startxref\s+(\d+)", stream.read()))
+    if len(matches) == 0:
+        raise ValueError("startxref not found")
+
+    # Follow the cross-reference sections from the newest one (incremental updates point at the previous one)
+    sections = []
+    info = None
+    offset = int(matches[-1].group(1))
+    while offset is not None and offset not in [section_offset for section_offset, _ in sections]:
+        subsections, trailer = _read_xref_table(stream, offset)
+        sections.append((offset, subsections))
+
+        if re.search(rb"/Encrypt\b", trailer):
+            raise ValueError("encrypted file")
+        if info is None and re.search(rb"/Info\b", trailer):
+            info = re.search(rb"/Info\s+(\d+)\s+\d+\s+R", trailer)
+            if info is None:
+                raise ValueError("direct document information dictionary")
+        prev = re.search(rb"/Prev\s+(\d+)", trailer)
+        offset = int(prev.group(1)) if prev is not None else None
+
+    if info is None:
+        return None
+    object_number = int(info.group(1))
+
+    for _, subsections in sections:
+        for first, count, position in subsections:
+            if first <= object_number < first + count:
+                stream.seek(position + (object_number - first) * XREF_ENTRY_SIZE)
+                entry = re.match(rb"(\d{10}) (\d{5}) ([nf])", stream.read(XREF_ENTRY_SIZE))
+                if entry is None or entry.group(3) != b"n":
+                    raise ValueError("document information dictionary not in use")
+
+                stream.seek(int(entry.group(1)))
+                header = re.match(rb"\s*(\d+)\s+(\d+)\s+obj\s*", stream.read(32))
+                if header is None or int(header.group(1)) != object_number:
+                    raise ValueError("document information dictionary not found")
+
+                # pypdf stops at values it cannot read without a PdfReader (indirect references), so the
+                # dictionary is only complete if the object ends right after it
+                stream.seek(int(entry.group(1)) + header.end())
+                dictionary = read_object(stream, None)
+                if re.match(rb"\s*endobj", stream.read(32)) is None:
+                    raise ValueError("indirect metadata values")
+
+                metadata = DocumentInformation()
+                metadata.update(dictionary)
+                return metadata
+
+    raise ValueError("document information dictionary not in the cross-reference table")
+
+def _read_xref_table(stream, offset):
+    """
+    Reads the subsection headers and the trailer of a cross-reference table. The entries themselves are skipped.
+
+    Returns:
+        list: The first object number, object count, and entry position of each subsection.
+        bytes: The trailer dictionary source.
+
+    Raises:
+        ValueError: If there is no cross-reference table at the offset (e.g. a cross-reference stream).
+    """
+    stream.seek(offset)
+    if stream.read(4) != b"xref":
+        raise ValueError("not a cross-reference table")
+
+    subsections = []
+    while True:
+        position = stream.tell()
+        line = re.match(rb"\s*(?:(\d+) (\d+)[ \t]*\r?\n|trailer\s*)", stream.read(64))
+        if line is None:
+            raise ValueError("damaged cross-reference table")
+        if line.group(1) is None:
+            stream.seek(position + line.end())
+            return subsections, stream.read(TAIL_SIZE).split(b"startxref")[0]
+
+        first, count = int(line.group(1)), int(line.group(2))
+        subsections.append((first, count, position + line.end()))
+        stream.seek(position + line.end() + count * XREF_ENTRY_SIZE)
\ No newline at end of file
@@ -0,0 +1,86 @@
+import hashlib
+import io
+
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import IndirectObject
+
+@staticmethod
+def optimize_pdf_data(data):
+    """
+    Optimizes the size of a PDF file in memory.
+
+    Most of the savings come from recompressing the page content streams with the highest compression level.
+    Images that are embedded more than once (e.g. a converter that embeds the same image once per use) are also
+    stored once and shared. Fonts are left as they are, since MS Word already embeds only the used glyphs.
+
+    The optimization is best effort: if the file cannot be optimized (e.g. an image uses a filter pypdf cannot decode),
+    the original data is returned unchanged.
+
+    Args:
+        data (bytes): The PDF file data.
+
+    Returns:
+        bytes: The optimized PDF file data, or the original data if it could not be optimized.
+    """
+    try:
+        return _optimize(data)
+    except Exception as e:
+        print(f"[!!] The PDF file could not be optimized and is kept as it is. Details: {e}")
+        return data
+
+def _optimize(data):
+    """Deduplicates the images and recompresses the page content streams of a PDF file (see optimize_pdf_data)."""
+    reader = PdfReader(io.BytesIO(data))
+
+    # Images are deduplicated in the source, so that each one is only copied once into the writer
+    images = {}
+    for page in reader.pages:
+        _deduplicate_images(page.get("/Resources"), images)
+
+    writer = PdfWriter()
+    for page in reader.pages:
+        writer.add_page(page)
+    for page in writer.pages:
+        page.compress_content_streams(level = 9)
+    writer.add_metadata(reader.metadata or {})
+
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+def _deduplicate_images(resources, images):
+    """
+    Points the image XObjects of a resource dictionary (and of the forms it uses) at the first identical image found.
+
+    Args:
+        resources (DictionaryObject): The resource dictionary of a page or form.
+        images (dict): The first reference to each image, keyed by the image fingerprint. Updated in place.
+    """
+    if resources is None:
+        return
+
+    xobjects = resources.get_object().get("/XObject")
+    if xobjects is None:
+        return
+    xobjects = xobjects.get_object()
+
+    for name, reference in list(xobjects.items()):
+        if not isinstance(reference, IndirectObject):
+            continue
+
+        xobject = reference.get_object()
+        if xobject.get("/Subtype") == "/Form":
+            _deduplicate_images(xobject.get("/Resources"), images)
+        elif xobject.get("/Subtype") == "/Image":
+            xobjects[name] = images.setdefault(_fingerprint(xobject), reference)
+
+def _fingerprint(image):
+    """Gets a fingerprint of an image XObject from its data, its dictionary, and the fingerprint of its soft mask."""
+    fingerprint = hashlib.blake2b(image.get_data())
+    for key in sorted(key for key in image.keys() if key not in ("/SMask", "/Length")):
+        fingerprint.update(f"{key}={image[key]!r};".encode())
+
+    if "/SMask" in image:
+        fingerprint.update(_fingerprint(image["/SMask"].get_object()).encode())
+
+    return fingerprint.hexdigest()
@@ -0,0 +1,293 @@
+import contextlib
+import csv
+import datetime
+import json
+import threading
+import time
+
+class Profiler:
+    """
+    Records timing spans of a report generation job.
+
+    A span is a named, timed section of work (e.g. "comment" or "render/sna") that optionally belongs to
+    a job item (e.g. a student). Spans can be recorded from several threads at once. The recorded spans can be
+    summarized with percentiles and exported as JSON or CSV to find out which stage makes a run slow.
+
+    Span names containing a slash (e.g. "render/sna") are treated as sub-spans of the part before the slash
+    and are not counted twice in the job totals.
+
+    Attributes:
+        started_at (datetime.datetime): The time when the profiler was created.
+        spans (list): The recorded spans. Each span is a dictionary with the job, name, start (seconds since creation) and duration (seconds).
+
+    Methods:
+        span(self, name, job = None): Context manager that records a span.
+        record(self, name, start, duration, job = None): Records a span that was timed by the caller.
+        stopwatch(self, prefix, job = None): Creates a stopwatch that records consecutive sub-spans.
+        elapsed(self): Gets the number of seconds since the profiler was created.
+        eta(self, done, total): Estimates the remaining time of a job.
+        summary(self): Summarizes the spans by name with percentiles.
+        jobs(self): Groups the spans by job item.
+        report(self): Prints the summary to the console.
+        export(self, file_path): Exports the profile as JSON or CSV based on the file extension.
+    """
+
+    def __init__(self):
+        """Initialize the profiler instance."""
+        self.started_at = datetime.datetime.now()
+        self.spans = []
+
+        self.__origin = time.perf_counter()
+        self.__lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def span(self, name, job = None):
+        """
+        Records the time taken by the enclosed block. The span is recorded even if the block raises an exception.
+
+        Args:
+            name (str): The name of the span.
+            job (str): The job item the span belongs to (e.g. the student name).
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.record(name, start - self.__origin, end - start, job = job)
+
+    def record(self, name, start, duration, job = None):
+        """
+        Records a span that was timed by the caller.
+
+        Args:
+            name (str): The name of the span.
+            start (float): The start of the span in seconds since the profiler was created.
+            duration (float): The duration of the span in seconds.
+            job (str): The job item the span belongs to.
+        """
+        with self.__lock:
+            self.spans.append({"job": job, "name": name, "start": start, "duration": duration})
+
+    def stopwatch(self, prefix, job = None):
+        """
+        Creates a stopwatch that records consecutive sub-spans (e.g. the sections of a document)
+        without having to wrap each of them in a with block.
+
+        Args:
+            prefix (str): The name of the parent span. Sub-spans are named "<prefix>/<name>".
+            job (str): The job item the spans belong to.
+
+        Returns:
+            Stopwatch: The started stopwatch.
+        """
+        return Stopwatch(self, prefix, job)
+
+    def elapsed(self):
+        """
+        Gets the number of seconds since the profiler was created.
+
+        Returns:
+            float: The elapsed time in seconds.
+        """
+        return time.perf_counter() - self.__origin
+
+    def eta(self, done, total, since = 0.0):
+        """
+        Estimates the remaining time of a job based on the average time per finished item.
+
+        Args:
+            done (int): The number of finished items.
+            total (int): The total number of items.
+            since (float): The start of the job in seconds since the profiler was created.
+
+        Returns:
+            float: The estimated remaining time in seconds. None if no item has finished yet.
+        """
+        if done <= 0:
+            return None
+
+        return (self.elapsed() - since) / done * (total - done)
+
+    def summary(self):
+        """
+        Summarizes the recorded spans by name.
+
+        Returns:
+            dict: The statistics (count, total, mean, p50, p90, p95, max) of each span name, in seconds.
+        """
+        durations = {}
+        with self.__lock:
+            for span in self.spans:
+                durations.setdefault(span["name"], []).append(span["duration"])
+
+        return {name: _statistics(values) for name, values in durations.items()}
+
+    def jobs(self):
+        """
+        Groups the recorded spans by job item. Spans without a job item are left out.
+
+        Returns:
+            dict: For each job item, the total duration of each span name and the job total, in seconds.
+        """
+        jobs = {}
+        with self.__lock:
+            for span in self.spans:
+                if span["job"] is None:
+                    continue
+                job = jobs.setdefault(span["job"], {"total": 0.0})
+                job[span["name"]] = job.get(span["name"], 0.0) + span["duration"]
+                if "/" not in span["name"]:
+                    job["total"] += span["duration"]
+
+        return jobs
+
+    def report(self):
+        """Prints the span summary to the console."""
+        print(f"\n{'Span':<28}{'Count':>7}{'Total':>10}{'Mean':>9}{'p50':>9}{'p90':>9}{'p95':>9}{'Max':>9}")
+        for name, stats in sorted(self.summary().items()):
+            print(f"{name:<28}{stats['count']:>7}{stats['total']:>10.3f}{stats['mean']:>9.3f}"
+                  f"{stats['p50']:>9.3f}{stats['p90']:>9.3f}{stats['p95']:>9.3f}{stats['max']:>9.3f}")
+
+    def export(self, file_path):
+        """
+        Exports the profile. The format is chosen based on the file extension (.json or .csv).
+
+        Args:
+            file_path (str): The path of the output file.
+
+        Raises:
+            ValueError: When the file extension is not supported.
+        """
+        if file_path.lower().endswith(".json"):
+            self.export_json(file_path)
+        elif file_path.lower().endswith(".csv"):
+            self.export_csv(file_path)
+        else:
+            raise ValueError(f"Unsupported profile format: {file_path}. Use a .json or .csv file.")
+
+    def export_json(self, file_path):
+        """
+        Exports the profile as a JSON file containing the span summary, the per-job results and the raw spans.
+
+        Args:
+            file_path (str): The path of the output file.
+        """
+        with self.__lock:
+            spans = list(self.spans)
+
+        profile = {
+            "started_at": self.started_at.strftime("%Y-%m-%d %H:%M:%S"),
+            "elapsed": self.elapsed(),
+            "summary": self.summary(),
+            "jobs": self.jobs(),
+            "spans": spans
+        }
+
+        with open(file_path, "w", encoding = "utf-8") as json_file:
+            json.dump(profile, json_file, indent = 4, ensure_ascii = False)
+
+    def export_csv(self, file_path):
+        """
+        Exports the per-job results as a CSV file. Each row is a job item and each column is a span name.
+        The last rows contain the percentiles of each column.
+
+        Args:
+            file_path (str): The path of the output file.
+        """
+        jobs = self.jobs()
+        names = sorted({name for job in jobs.values() for name in job if name != "total"}) + ["total"]
+
+        with open(file_path, "w", newline = "", encoding = "utf-8") as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(["Job"] + names)
+
+            for job, durations in jobs.items():
+                writer.writerow([job] + [round(durations[name], 6) if name in durations else "" for name in names])
+
+            columns = {name: [durations[name] for durations in jobs.values() if name in durations] for name in names}
+            for statistic in ["p50", "p90", "p95", "max"]:
+                writer.writerow([statistic] + [round(_statistics(columns[name])[statistic], 6) if columns[name] else "" for name in names])
+
+class Stopwatch:
+    """
+    Records consecutive sub-spans into a profiler. Each lap records the time since the previous lap.
+
+    Methods:
+        lap(self, name): Records the time since the previous lap (or since the stopwatch was created).
+    """
+
+    def __init__(self, profiler: Profiler, prefix, job = None):
+        """
+        Initialize and start the stopwatch.
+
+        Args:
+            profiler (Profiler): The profiler to record the spans into.
+            prefix (str): The name of the parent span.
+            job (str): The job item the spans belong to.
+        """
+        self.__profiler = profiler
+        self.__prefix = prefix
+        self.__job = job
+        self.__last = profiler.elapsed()
+
+    def lap(self, name):
+        """
+        Records the time since the previous lap as the "<prefix>/<name>" span.
+
+        Args:
+            name (str): The name of the sub-span.
+        """
+        now = self.__profiler.elapsed()
+        self.__profiler.record(f"{self.__prefix}/{name}", self.__last, now - self.__last, job = self.__job)
+        self.__last = now
+
+def format_duration(seconds):
+    """
+    Formats a number of seconds for progress messages.
+
+    Args:
+        seconds (float): The number of seconds.
+
+    Returns:
+        str: The formatted duration (e.g. "3 minutes 12 seconds").
+    """
+    seconds = int(round(seconds))
+    return f"{seconds // 60} minutes {seconds % 60} seconds"
+
+def _percentile(values, percent):
+    """
+    Gets a percentile of a sorted list using linear interpolation.
+
+    Args:
+        values (list): The sorted values.
+        percent (float): The percentile to get (0 to 100).
+
+    Returns:
+        float: The percentile value.
+    """
+    position = (len(values) - 1) * percent / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+def _statistics(values):
+    """
+    Computes the summary statistics of a list of durations.
+
+    Args:
+        values (list): The durations in seconds. Must not be empty.
+
+    Returns:
+        dict: The count, total, mean, p50, p90, p95 and max of the durations.
+    """
+    values = sorted(values)
+    return {
+        "count": len(values),
+        "total": sum(values),
+        "mean": sum(values) / len(values),
+        "p50": _percentile(values, 50),
+        "p90": _percentile(values, 90),
+        "p95": _percentile(values, 95),
+        "max": values[-1]
+    }
@@ -0,0 +1,120 @@
+import os
+
+from termcolor import colored
+
+from components.common.grader_report import GraderReport
+from components.common.profiler import Profiler
+
+class ReportIndex:
+    """
+    Index over a set of loaded grader reports (one per subject) that maps each student to their reports.
+
+    Every grader report is loaded once. Looking up a student then only reads from the loaded data frames
+    instead of reopening every workbook. Student names are matched case-insensitively and ignoring surrounding spaces.
+
+    Attributes:
+        grader_reports (list): The indexed GraderReport instances in the order they were added.
+
+    Methods:
+        add(self, grader_report): Adds a grader report to the index.
+        load_folder(self, folder_path, callback = None): Loads and indexes every grader report in a folder.
+        students(self): Gets the names of all indexed students.
+        lookup(self, student_name): Gets the grader reports that contain a student.
+        count_students(self): Gets the number of indexed students.
+    """
+
+    def __init__(self, grader_reports = None, profiler: Profiler = None):
+        """
+        Initialize the index instance.
+
+        Args:
+            grader_reports (list): The GraderReport instances to index.
+            profiler (Profiler): The profiler to record the loading time with.
+        """
+        self.grader_reports = []
+        self.profiler = profiler if profiler is not None else Profiler()
+
+        self.__entries = {}
+
+        for grader_report in grader_reports or []:
+            self.add(grader_report)
+
+    def add(self, grader_report: GraderReport):
+        """
+        Adds a grader report to the index.
+
+        Args:
+            grader_report (GraderReport): The grader report to add.
+        """
+        self.grader_reports.append(grader_report)
+
+        for student_name in grader_report.students.index:
+            entry = self.__entries.setdefault(_key(student_name), {"name": student_name, "reports": []})
+            entry["reports"].append((student_name, grader_report))
+
+    def load_folder(self, folder_path, callback = None):
+        """
+        Loads and indexes every grader report (.xlsx and .xlsm files) in a folder.
+        Files that cannot be read or are invalid are skipped with a warning.
+
+        Args:
+            folder_path (str): The path of the folder.
+            callback (function): The callback function to be called after each file is loaded.
+
+        Returns:
+            int: The number of grader reports added to the index.
+        """
+        files = sorted(file for file in os.listdir(folder_path) if file.lower().endswith((".xlsx", ".xlsm")) and not file.startswith("~$"))
+        added = 0
+
+        for i, file in enumerate(files):
+            if callback is not None:
+                callback(i, len(files), f"Loading {file}…")
+
+            grader_report = GraderReport(os.path.join(folder_path, file), skip_validation = True, callback = lambda message: None, profiler = self.profiler)
+            if not hasattr(grader_report, "students") or not grader_report.validate(callback = lambda message: None):
+                print(colored(f"Warning: {file} is not a valid grader report. Skipping…", "yellow"))
+                continue
+
+            self.add(grader_report)
+            added += 1
+
+        if callback is not None:
+            callback(len(files), len(files), f"Indexed {added} grader report(s) with {self.count_students()} student(s).")
+
+        return added
+
+    def students(self):
+        """
+        Gets the names of all indexed students. The name from the first report a student appears in is used.
+
+        Returns:
+            list: The student names in alphabetical order.
+        """
+        return sorted(entry["name"] for entry in self.__entries.values())
+
+    def lookup(self, student_name):
+        """
+        Gets the grader reports that contain a student.
+
+        Args:
+            student_name (str): The name of the student.
+
+        Returns:
+            list: The (name in report, GraderReport) pairs of the student, in the order the reports were added. Empty if the student is not indexed.
+        """
+        entry = self.__entries.get(_key(student_name))
+        return list(entry["reports"]) if entry is not None else []
+
+    def count_students(self):
+        """
+        Gets the number of indexed students.
+
+        Returns:
+            int: The number of students.
+        """
+        return len(self.__entries)
+
+def _key(student_name):
+    """Gets the lookup key of a student name."""
+    return " ".join(str(student_name).split()).casefold()
@@ -0,0 +1,194 @@
+import hashlib
+import json
+import os
+import threading
+
+VERSION = 3
+DEFAULT_CACHE_PATH = "verification_cache.json"
+PARTIAL_HASH_BLOCK = 64 * 1024
+FULL_MODE = "full"
+MAX_FILES = 200000
+
+class VerificationCache:
+    """
+    Cache of verification results keyed by file and verification mode, checked against the file identity.
+
+    A file is identified by its path, size, modification time, and a partial hash of its first and last 64 KiB.
+    While all of them are unchanged, the previous result of the file is returned instead of verifying it again,
+    so re-scanning an archive folder only verifies the new and changed files. The partial hash catches files that
+    were replaced by a copy tool that keeps the modification time.
+
+    Results are only reused in the mode they were verified in (see verification_mode), so a verdict from a signing ledger is not
+    returned for a full verification or after the ledger has changed. Each file keeps its full verification result and only its
+    latest ledger result, since a result from an older state of a ledger can never be returned again.
+
+    The cache holds up to max_files files. When it is full, the files that were least recently used are dropped first.
+
+    Results can be read and stored from several worker threads at once.
+
+    Attributes:
+        file_path (str): The path of the JSON file the cache is saved in. None for an in-memory cache.
+        max_files (int): The maximum number of files to keep results for.
+
+    Methods:
+        get(self, file_path, identity, mode): Gets the cached result of a file.
+        put(self, file_path, identity, result, mode): Stores the result of a file.
+        save(self): Saves the cache to its JSON file.
+        clear(self): Removes every cached result.
+    """
+
+    def __init__(self, file_path = None, max_files = MAX_FILES):
+        """
+        Initialize the cache instance. The results saved in the JSON file are loaded if it exists.
+
+        Args:
+            file_path (str): The path of the JSON file to load from and save to. None for an in-memory cache.
+            max_files (int): The maximum number of files to keep results for.
+        """
+        self.file_path = file_path
+        self.max_files = max_files
+
+        self.__entries = {}
+        self.__lock = threading.Lock()
+
+        if file_path is not None and os.path.isfile(file_path):
+            try:
+                with open(file_path, encoding = "utf-8") as json_file:
+                    data = json.load(json_file)
+                if data.get("version") == VERSION:
+                    self.__entries = data["entries"]
+                    self.__trim()
+            except (OSError, ValueError, KeyError):
+                # A damaged cache is only a slower scan
+                self.__entries = {}
+
+    def __len__(self):
+        with self.__lock:
+            return len(self.__entries)
+
+    def get(self, file_path, identity, mode = FULL_MODE):
+        """
+        Gets the cached result of a file.
+
+        Args:
+            file_path (str): The path to the file.
+            identity (dict): The current identity of the file (see identify).
+            mode (str): The verification mode (see verification_mode).
+
+        Returns:
+            dict: The cached result. None if the file is not cached in this mode or has changed since.
+        """
+        key = _key(file_path)
+
+        with self.__lock:
+            modes = self.__entries.pop(key, None)
+            if modes is None:
+                return None
+            # Re-inserted at the end, so the least recently used files come first
+            self.__entries[key] = modes
+
+            entry = modes.get(mode)
+            if entry is None:
+                return None
+            if identity is None or entry["identity"] != identity:
+                del modes[mode]
+                return None
+
+            return dict(entry["result"])
+
+    def put(self, file_path, identity, result, mode = FULL_MODE):
+        """
+        Stores the result of a file.
+
+        Args:
+            file_path (str): The path to the file.
+            identity (dict): The identity of the file read before it was verified (see identify). If the file changes
+                             while it is being verified, the result is then not returned for the changed file.
+            result (dict): The verification result. It must be serializable as JSON.
+            mode (str): The verification mode (see verification_mode).
+        """
+        if identity is None:
+            return
+
+        key = _key(file_path)
+
+        with self.__lock:
+            modes = self.__entries.pop(key, {})
+            if mode != FULL_MODE:
+                # Results from other ledger states can never be returned again
+                modes = {other_mode: entry for other_mode, entry in modes.items() if other_mode == FULL_MODE}
+            modes[mode] = {"identity": dict(identity), "result": dict(result)}
+            self.__entries[key] = modes
+            self.__trim()
+
+    def save(self):
+        """Saves the cache to its JSON file. Does nothing for an in-memory cache."""
+        if self.file_path is None:
+            return
+
+        with self.__lock:
+            data = {"version": VERSION, "entries": {key: dict(modes) for key, modes in self.__entries.items() if len(modes) > 0}}
+
+        with open(self.file_path, "w", encoding = "utf-8") as json_file:
+            json.dump(data, json_file, ensure_ascii = False)
+
+    def clear(self):
+        """Removes every cached result."""
+        with self.__lock:
+            self.__entries = {}
+
+    def __trim(self):
+        """Drops the least recently used files until the cache holds at most max_files files. The lock must be held."""
+        while len(self.__entries) > self.max_files:
+            del self.__entries[next(iter(self.__entries))]
+
+@staticmethod
+def identify(file_path):
+    """
+    Reads the identity of a file: its size, modification time, and a partial hash. Read it before verifying the file.
+
+    Args:
+        file_path (str): The path to the file.
+
+    Returns:
+        dict: The identity of the file. None if the file cannot be read.
+    """
+    try:
+        stat = os.stat(file_path)
+        return {"size": stat.st_size, "mtime": stat.st_mtime_ns, "partial_hash": _partial_hash(file_path, stat.st_size)}
+    except OSError:
+        return None
+
+@staticmethod
+def verification_mode(ledger_path = None):
+    """
+    Gets the verification mode of a scan. Results verified with a signing ledger depend on the ledger's content,
+    so the mode of a ledger scan changes whenever the ledger is written to.
+
+    Args:
+        ledger_path (str): The path of the signing ledger the files are looked up in. None for a full verification.
+
+    Returns:
+        str: The verification mode.
+    """
+    if ledger_path is None:
+        return FULL_MODE
+
+    stat = os.stat(ledger_path)
+    return f"ledger:{os.path.normcase(os.path.abspath(ledger_path))}:{stat.st_size}:{stat.st_mtime_ns}"
+
+def _key(file_path):
+    """Gets the cache key of a path. Different spellings of the same path share a key."""
+    return os.path.normcase(os.path.abspath(file_path))
+
+def _partial_hash(file_path, size):
+    """Hashes the first and last blocks of a file together with its size."""
+    file_hash = hashlib.blake2b(str(size).encode())
+
+    with open(file_path, "rb") as file:
+        file_hash.update(file.read(PARTIAL_HASH_BLOCK))
+        if size > PARTIAL_HASH_BLOCK:
+            file.seek(max(PARTIAL_HASH_BLOCK, size - PARTIAL_HASH_BLOCK))
+            file_hash.update(file.read(PARTIAL_HASH_BLOCK))
+
+    return file_hash.hexdigest()
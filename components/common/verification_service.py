@@ -0,0 +1,175 @@
+import collections
+import io
+import threading
+
+import flask
+
+import components.common.integrity as integrity
+import components.common.metadata as metadata
+from components.common.ledger import SigningLedger
+
+CACHE_SIZE = 4096
+MAX_UPLOAD_SIZE = 64 * 1024 * 1024
+
+@staticmethod
+def create_app(ledger_path = None, cache_size = CACHE_SIZE):
+    """
+    Creates the verification HTTP service.
+
+    Routes:
+        POST /verify: Verifies an uploaded PDF file (a multipart "file" field, or the request body as application/pdf).
+        GET /verify/hash/<hash>: Looks up a report by its whole-file hash or JARSIM hash.
+        GET /verify/serial/<serial_number>: Looks up a report by its serial number.
+
+    Every response is a JSON object with the "result" and the "reason". Uploaded files are "Pass" or "Fail".
+    With a ledger, an uploaded file that has a valid JARSIM signature but is not recorded in the ledger is
+    "Signature Valid" instead of "Pass", since the ledger does not vouch for it.
+    Hash and serial number lookups only find the ledger entry and do not check a file, so they are "Recorded"
+    (or "Superseded" if the report was signed again later). Anything not found is "Unknown".
+    Uploaded files are hashed first, and the verdict of a file that was already verified is answered from an in-memory
+    cache keyed by that hash. Files recorded in the signing ledger are verified with a ledger lookup.
+    The service handles requests concurrently (see serve).
+
+    Args:
+        ledger_path (str): The path of a signing ledger. With a ledger, hash and serial number lookups are only answered
+                           from the ledger. Without one, they only find files that were uploaded to this service before.
+        cache_size (int): The number of verdicts to keep in the cache.
+
+    Returns:
+        Flask: The service application.
+    """
+    app = flask.Flask(__name__)
+    app.config["MAX_CONTENT_LENGTH"] = MAX_UPLOAD_SIZE
+
+    ledger = SigningLedger(ledger_path) if ledger_path is not None else None
+    cache = _ResultCache(cache_size)
+
+    @app.post("/verify")
+    def verify():
+        upload = flask.request.files.get("file")
+        data = upload.read() if upload is not None else flask.request.get_data()
+        if len(data) == 0:
+            return _response("Unknown", "No file was uploaded. Send the PDF file as the \"file\" field or as the request body.", status = 400)
+
+        file_hash = integrity.hash_bytes(data)
+        verdict = cache.get(file_hash)
+        if verdict is not None:
+            return flask.jsonify(dict(verdict, cached = True))
+
+        try:
+            passed = None
+            recorded = ledger is None
+            if ledger is not None:
+                passed, reason = ledger.verify_by_ledger(data = data)
+                recorded = passed is not None
+            if passed is None:
+                passed, reason = integrity.verify_pdf_data(data)
+            pdf_metadata = metadata.read_pdf_metadata(io.BytesIO(data)) or {}
+        except Exception as e:
+            return _response("Fail", f"The file could not be read as a PDF file. Details: {e}", status = 422)
+
+        if passed and not recorded:
+            reason += " However, the report is not recorded in the signing ledger."
+
+        verdict = {
+            "result": ("Pass" if recorded else "Signature Valid") if passed else "Fail",
+            "reason": reason,
+            "serial_number": str(pdf_metadata.get("/Serial Number", "")),
+            "signed_by": str(pdf_metadata.get("/Signed By", "")),
+            "signed_on": str(pdf_metadata.get("/Signed On", "")),
+            "file_hash": file_hash
+        }
+        cache.put(file_hash, verdict)
+        return flask.jsonify(dict(verdict, cached = False))
+
+    @app.get("/verify/hash/<file_hash>")
+    def verify_hash(file_hash):
+        # With a ledger, lookups are only answered from it, so an upload verdict never stands in for a ledger entry
+        if ledger is not None:
+            return _ledger_response(ledger.lookup_hash(file_hash.lower()), f"No report with the hash {file_hash} is recorded in the signing ledger.")
+
+        verdict = cache.get(file_hash.lower())
+        if verdict is not None:
+            return flask.jsonify(dict(verdict, cached = True))
+        return _ledger_response([], f"No report with the hash {file_hash} has been verified here.")
+
+    @app.get("/verify/serial/<serial_number>")
+    def verify_serial(serial_number):
+        if ledger is not None:
+            return _ledger_response(ledger.lookup_serial(serial_number), f"No report with the serial number {serial_number} is recorded in the signing ledger.")
+
+        verdict = cache.find(lambda verdict: verdict["serial_number"] == serial_number)
+        if verdict is not None:
+            return flask.jsonify(dict(verdict, cached = True))
+        return _ledger_response([], f"No report with the serial number {serial_number} has been verified here.")
+
+    @app.errorhandler(413)
+    def too_large(error):
+        return _response("Unknown", f"The file is too large. The limit is {MAX_UPLOAD_SIZE // (1024 * 1024)} MiB.", status = 413)
+
+    return app
+
+@staticmethod
+def serve(host = "127.0.0.1", port = 8080, ledger_path = None):
+    """
+    Runs the verification HTTP service until it is stopped. Each request is handled on its own thread.
+
+    This uses Flask's development server, which is meant for this computer or a trusted local network only.
+    To serve other computers, run create_app with a production WSGI server such as waitress instead.
+
+    Args:
+        host (str): The address to listen on.
+        port (int): The port to listen on.
+        ledger_path (str): The path of a signing ledger (see create_app).
+    """
+    create_app(ledger_path).run(host = host, port = port, threaded = True)
+
+def _response(result, reason, status = 200, **fields):
+    """Builds a JSON verdict response."""
+    return flask.jsonify(dict(result = result, reason = reason, **fields)), status
+
+def _ledger_response(entries, unknown_reason):
+    """
+    Builds the answer of a lookup from its ledger entries (the newest entry is used). A lookup does not check a file,
+    so the result is "Recorded" or "Superseded" rather than "Pass".
+    """
+    if len(entries) == 0:
+        return _response("Unknown", unknown_reason, status = 404)
+
+    entry = entries[-1]
+    reason = f"The report {entry['serial_number']} was signed on {entry['signed_on']} and is recorded in the signing ledger."
+    if entry["superseded_by"] is not None:
+        reason += f" This report has been superseded by {entry['superseded_by']}."
+
+    return _response("Recorded" if entry["superseded_by"] is None else "Superseded", reason, serial_number = entry["serial_number"], student = entry["student"], subject = entry["subject"],
+                     signed_on = entry["signed_on"], superseded_by = entry["superseded_by"], file_hash = entry["file_hash"])
+
+class _ResultCache:
+    """Least-recently-used cache of verdicts keyed by whole-file hash. Safe to use from several request threads."""
+
+    def __init__(self, size):
+        self.size = size
+
+        self.__verdicts = collections.OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get(self, file_hash):
+        """Gets the verdict of a file hash. None if it is not cached."""
+        with self.__lock:
+            if file_hash not in self.__verdicts:
+                return None
+            self.__verdicts.move_to_end(file_hash)
+            return self.__verdicts[file_hash]
+
+    def put(self, file_hash, verdict):
+        """Stores the verdict of a file hash, dropping the least recently used verdict if the cache is full."""
+        with self.__lock:
+            self.__verdicts[file_hash] = verdict
+            self.__verdicts.move_to_end(file_hash)
+            while len(self.__verdicts) > self.size:
+                self.__verdicts.popitem(last = False)
+
+    def find(self, predicate):
+        """Gets the most recently used verdict that matches a predicate. None if there is none."""
+        with self.__lock:
+            return next((verdict for verdict in reversed(self.__verdicts.values()) if predicate(verdict)), None)
@@ -0,0 +1,100 @@
+import re
+import threading
+import zipfile
+
+class ReportArchive:
+    """
+    A zip archive that collects the generated reports of a class.
+
+    Reports are added as in-memory buffers so that the output folder receives a single sequential write
+    instead of one file create (and several rewrites) per report. This is much faster on network shares.
+    Entries are stored without compression since DOCX and PDF files are already compressed.
+    Entries can be added from several threads at once.
+
+    Attributes:
+        file_path (str): The path of the zip archive.
+        names (list): The names of the entries added to the archive.
+
+    Methods:
+        add(self, name, data): Adds an entry to the archive.
+        close(self): Finalizes the archive.
+    """
+
+    def __init__(self, file_path):
+        """
+        Initialize the archive instance. The archive file is created (or overwritten) immediately.
+
+        Args:
+            file_path (str): The path of the zip archive.
+        """
+        self.file_path = file_path
+        self.names = []
+
+        self.__lock = threading.Lock()
+        self.__zip_file = zipfile.ZipFile(file_path, "w", compression = zipfile.ZIP_STORED)
+
+    def add(self, name, data):
+        """
+        Adds an entry to the archive.
+
+        Args:
+            name (str): The name of the entry (e.g. "Student Name.docx").
+            data (bytes): The content of the entry.
+        """
+        with self.__lock:
+            self.__zip_file.writestr(name, data)
+            self.names.append(name)
+
+    def close(self):
+        """Finalizes the archive by writing its central directory."""
+        with self.__lock:
+            self.__zip_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+@staticmethod
+def batch_name(grader_report):
+    """
+    Gets the name of a class batch (e.g. "Art P1A S1 AY2024-2025"), used to name the files of a batch so that
+    classes sharing an output folder do not overwrite each other's files.
+    Characters that are not allowed in file names are replaced with a hyphen.
+
+    Args:
+        grader_report (GraderReport): The grader report of the class.
+
+    Returns:
+        str: The batch name.
+    """
+    name = (f"{grader_report.get_course_info('Subject')} {grader_report.get_course_info('Grade')} "
+            f"S{grader_report.get_course_info('Semester')} AY{grader_report.get_course_info('School Year')}")
+    return re.sub(r'[\\/:*?"<>|]', "-", name)
+
+@staticmethod
+def archive_name(grader_report):
+    """
+    Gets the archive file name for a class (e.g. "Art P1A S1 AY2024-2025 Reports.zip").
+
+    Args:
+        grader_report (GraderReport): The grader report of the class.
+
+    Returns:
+        str: The archive file name.
+    """
+    return f"{batch_name(grader_report)} Reports.zip"
+
+@staticmethod
+def manifest_name(grader_report):
+    """
+    Gets the batch manifest file name for a class (e.g. "Art P1A S1 AY2024-2025 Batch Manifest.json").
+
+    Args:
+        grader_report (GraderReport): The grader report of the class.
+
+    Returns:
+        str: The batch manifest file name.
+    """
+    return f"{batch_name(grader_report)} Batch Manifest.json"
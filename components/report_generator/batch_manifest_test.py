@@ -0,0 +1,138 @@
+# TEST
+import getopt
+import os
+import sys
+import tempfile
+
+help_text = """
+HELP PAGE
+=========
+This script builds batch manifests over sample files, verifies them with their Merkle inclusion proofs,
+and checks that changed files, missing files, and manifests with the wrong key fail.
+
+=========
+USAGE
+=========
+Format:
+batch_manifest_test.py -o <output_folder_path>
+
+Options:
+-h, --help
+    Displays this help page.
+-o, --output <output_folder_path>
+    Specifies the folder to write the sample files to. Defaults to a new temporary folder.
+    Example:
+        C:/Users/John Doe/Desktop/Batch Manifest Test
+
+Example:
+batch_manifest_test.py -o C:/Users/John Doe/Desktop/Batch Manifest Test
+
+Note:
+The script exits with 1 if any check fails.
+"""
+
+def run(output_folder_path, batch_manifest):
+    failures = []
+
+    def check(name, condition):
+        print(f"[OK] {name}" if condition else f"[!!] {name}")
+        if not condition:
+            failures.append(name)
+
+    def raises(function):
+        try:
+            function()
+        except ValueError:
+            return True
+        return False
+
+    # Every tree shape up to a few levels (odd counts leave an unpaired node on a level)
+    for count in [1, 2, 3, 5, 8]:
+        for key in [None, b"secret"]:
+            print(f"[  ] Checking a batch of {count} file(s) {'with' if key is not None else 'without'} a key…")
+            folder_path = f"{output_folder_path}/{count} {'Keyed' if key is not None else 'Unkeyed'}"
+            os.makedirs(folder_path, exist_ok = True)
+
+            manifest = batch_manifest.BatchManifest(key = key)
+            for i in range(count):
+                with open(f"{folder_path}/Student {i}.pdf", "wb") as file:
+                    file.write(f"Report of student {i}".encode() * (i + 1))
+                manifest.add_file(f"{folder_path}/Student {i}.pdf")
+            manifest_path = f"{folder_path}/Batch Manifest.json"
+            manifest.save(manifest_path)
+
+            # Manifest round trip
+            loaded = batch_manifest.load_manifest(manifest_path, key = key)
+            check("Loaded manifest has the same root", loaded.root() == manifest.root())
+            check("Unchanged folder passes", loaded.verify_folder(folder_path)[0])
+            check("Manifest with the wrong key is rejected", raises(lambda: batch_manifest.load_manifest(manifest_path, key = b"other")))
+            if key is not None:
+                check("Keyed manifest without a key is rejected", raises(lambda: batch_manifest.load_manifest(manifest_path)))
+
+            # Inclusion proofs
+            proof_paths = manifest.save_proofs(f"{folder_path}/Proofs")
+            check("Every file has a proof", len(proof_paths) == count)
+            check("Every file passes with its proof",
+                  all(batch_manifest.verify_proof(f"{folder_path}/Student {i}.pdf", batch_manifest.load_proof(f"{folder_path}/Proofs/Student {i}.pdf.proof.json"), key = key)
+                      for i in range(count)))
+            if count > 1:
+                check("Another file fails with the proof",
+                      not batch_manifest.verify_proof(f"{folder_path}/Student 1.pdf", batch_manifest.load_proof(f"{folder_path}/Proofs/Student 0.pdf.proof.json"), key = key))
+
+            # Changed and missing files
+            with open(f"{folder_path}/Student 0.pdf", "ab") as file:
+                file.write(b"changed")
+            proof = batch_manifest.load_proof(f"{folder_path}/Proofs/Student 0.pdf.proof.json")
+            check("Changed file fails with its proof", not batch_manifest.verify_proof(f"{folder_path}/Student 0.pdf", proof, key = key))
+            passed, statuses = loaded.verify_folder(folder_path)
+            check("Changed file is reported", not passed and statuses["Student 0.pdf"] == "Changed")
+
+            if count > 1:
+                os.remove(f"{folder_path}/Student 1.pdf")
+                passed, statuses = loaded.verify_folder(folder_path)
+                check("Missing file is reported", not passed and statuses["Student 1.pdf"] == "Missing")
+
+    # Forged proofs: a changed path does not lead to the root, and a changed root does not match its signature
+    print(f"[  ] Checking forged proofs…")
+    proof_path = f"{output_folder_path}/3 Keyed/Proofs/Student 2.pdf.proof.json"
+    file_path = f"{output_folder_path}/3 Keyed/Student 2.pdf"
+    check("Original proof passes", batch_manifest.verify_proof(file_path, batch_manifest.load_proof(proof_path), key = b"secret"))
+
+    proof = batch_manifest.load_proof(proof_path)
+    proof["path"][0][1] = "0" * len(proof["path"][0][1])
+    check("Proof with a changed path fails", not batch_manifest.verify_proof(file_path, proof, key = b"secret"))
+
+    proof = batch_manifest.load_proof(proof_path)
+    proof["root"] = "0" * len(proof["root"])
+    check("Proof with a changed root fails", not batch_manifest.verify_proof(file_path, proof, key = b"secret"))
+
+    print(f"[  ] Done. {len(failures)} check(s) failed.")
+    return len(failures)
+
+def main(argv):
+    import components.common.batch_manifest as batch_manifest
+
+    output_folder_path = ""
+
+    try:
+        opts, args = getopt.getopt(argv, "ho:", ["help", "output="])
+    except getopt.GetoptError:
+        print("Error! Invalid argument(s).")
+        print("batch_manifest_test.py -o <output_folder_path> --help")
+        sys.exit(2)
+
+    for opt, arg in opts:
+        if opt in ("-h", "--help"):
+            print(help_text)
+            sys.exit()
+        elif opt in ("-o", "--output"):
+            output_folder_path = arg
+
+    if output_folder_path == "":
+        output_folder_path = tempfile.mkdtemp(prefix = "jars_batch_manifest_test_")
+    os.makedirs(output_folder_path, exist_ok = True)
+
+    sys.exit(1 if run(output_folder_path, batch_manifest) > 0 else 0)
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -11,6 +11,7 @@ from google.genai.errors import ClientError
 
 import components.report_generator.manifest as manifest
 import config
+from components.common.comment_mapping import CommentMappingIndex
 
 class CommentGenerator:
     """
@@ -20,7 +21,7 @@ class CommentGenerator:
         student_name (str): The student's name.
         short_name (str): The student's short name.
         gender (str): The student's gender.
-        comment_mapping (pandas.DataFrame): The comment mapping.
+        comment_mapping (CommentMappingIndex): The compiled comment mapping (a pandas.DataFrame is compiled on initialization).
         student_result (dict): The student's result.
         letter_grade (str): The student's letter grade.
     
@@ -49,7 +50,9 @@ class CommentGenerator:
         self._student_result = student_result
         self._letter_grade = letter_grade
 
-        self._comment_mapping = self._comment_mapping.fillna("")
+        # Prefer passing the grader report's shared index; compiling a data frame here is done for every student
+        if not isinstance(self._comment_mapping, CommentMappingIndex):
+            self._comment_mapping = CommentMappingIndex(self._comment_mapping)
 
     # TODO: Change return type to proper dictionary type ?
     def generate_comment(self, probe = False, autocorrect = False):
@@ -71,8 +74,8 @@ class CommentGenerator:
         pronoun = "he" if self._gender == "M" else "she"
         adjective = "his" if self._gender == "M" else "her"
 
-        sentence_intro = self._comment_mapping.loc["Intro", self._letter_grade] if self._letter_grade != " " else ""
-        sentence_closing = self._comment_mapping.loc["Closing", self._letter_grade] if self._letter_grade != " " else ""
+        sentence_intro = self._comment_mapping.intro[self._letter_grade] if self._letter_grade != " " else ""
+        sentence_closing = self._comment_mapping.closing[self._letter_grade] if self._letter_grade != " " else ""
 
         positive_sentences, negative_sentences = self.__collect_comments()
         positive_text = self.__assemble_positive_comments(positive_sentences)
@@ -144,10 +147,11 @@ class CommentGenerator:
         negative_count = 0
 
         for key, value in self._student_result.items():
-            if key in self._comment_mapping.index and value in self._comment_mapping.columns:
-                comment = self._comment_mapping.loc[key, value]
-                if len(comment) > 0 and comment != "nan":
-                    if comment.startswith("However"):
+            if self._comment_mapping.has(key, value):
+                entry = self._comment_mapping.sentence(key, value)
+                if entry is not None:
+                    comment, negative = entry
+                    if negative:
                         if negative_count == 0:
                             negative_sentences.append(comment)
                             negative_count += 1
@@ -0,0 +1,119 @@
+# TEST
+import getopt
+import random
+import sys
+
+import numpy as np
+import pandas as pd
+
+help_text = """
+HELP PAGE
+=========
+This script compiles comment mappings into a CommentMappingIndex and checks that every lookup gives the same sentence
+as looking it up in the comment mapping data frame, and that comments generated from the data frame and from the index are identical.
+
+=========
+USAGE
+=========
+Format:
+comment_mapping_test.py -s <source_file_path>
+
+Options:
+-h, --help
+    Displays this help page.
+-s, --source <source_file_path>
+    Specifies a grader report to also check its 'Comment Mapping' sheet. Optional; a built-in sample mapping is always checked.
+    Example:
+        C:/Users/John Doe/Desktop/Grader Report P1A Art Sample.xlsx
+
+Example:
+comment_mapping_test.py -s C:/Users/John Doe/Desktop/Grader Report P1A Art Sample.xlsx
+
+Note:
+The script exits with 1 if any check fails.
+"""
+
+def run(source_file_path, CommentMappingIndex, CommentGenerator):
+    failures = []
+
+    def check(name, condition):
+        print(f"[OK] {name}" if condition else f"[!!] {name}")
+        if not condition:
+            failures.append(name)
+
+    mappings = {"sample": _sample_mapping()}
+    if source_file_path != "":
+        mappings["grader report"] = pd.read_excel(source_file_path, sheet_name = "Comment Mapping", index_col = 0, header = 0).astype(str)
+
+    for name, comment_mapping in mappings.items():
+        print(f"[  ] Checking the {name} comment mapping…")
+        index = CommentMappingIndex(comment_mapping)
+
+        # The data frame lookup that the index replaces (blank rows share a label, and the first one is used)
+        frame = comment_mapping.fillna("")
+        frame = frame.loc[~frame.index.duplicated(), ~frame.columns.duplicated()]
+
+        def expected(goal, grade):
+            sentence = frame.loc[goal, grade]
+            if len(sentence) == 0 or sentence == "nan":
+                return None
+            return sentence, sentence.startswith("However")
+
+        goals = list(frame.index) + ["Unknown Goal"]
+        grades = list(frame.columns) + ["Z", " "]
+        pairs = [(goal, grade) for goal in goals for grade in grades]
+
+        check("Every goal and grade is found the same way", all(index.has(goal, grade) == (goal in frame.index and grade in frame.columns) for goal, grade in pairs))
+        check("Every sentence is the same", all(index.sentence(goal, grade) == (expected(goal, grade) if index.has(goal, grade) else None) for goal, grade in pairs))
+        check("Intro and closing sentences are the same", all(index.intro[grade] == frame.loc["Intro", grade] and index.closing[grade] == frame.loc["Closing", grade]
+                                                              for grade in frame.columns))
+
+        # Comments generated from the data frame and from a shared index
+        criteria = [goal for goal in frame.index if goal not in ("Intro", "Closing") and goal != ""]
+        letter_grades = [grade for grade in frame.columns if grade in ("A", "B", "C", "D")]
+        randomizer = random.Random(0)
+        same = True
+        for _ in range(50):
+            student_result = {goal: randomizer.choice(list(frame.columns) + [" "]) for goal in criteria}
+            letter_grade = randomizer.choice(letter_grades)
+            from_frame = CommentGenerator("Yabushita Fu", "Fu", "F", comment_mapping, student_result, letter_grade).generate_comment(probe = True, autocorrect = False)
+            from_index = CommentGenerator("Yabushita Fu", "Fu", "F", index, student_result, letter_grade).generate_comment(probe = True, autocorrect = False)
+            same = same and from_frame == from_index
+        check("Comments from the data frame and the index are identical", same)
+
+    print(f"[  ] Done. {len(failures)} check(s) failed.")
+    return len(failures)
+
+def _sample_mapping():
+    """Builds a small comment mapping with empty cells, "nan" text, negative sentences, and a duplicated blank row."""
+    return pd.DataFrame({
+        "A": ["{short_name} had an excellent semester", "{pronoun} excels at drawing", "{pronoun} excels at painting", "", np.nan, np.nan, "Keep it up {short_name}!"],
+        "B": ["{short_name} had a good semester", "{pronoun} is good at drawing", "However, {pronoun} needs to practise painting", "nan", np.nan, "stray text", "Well done {short_name}!"],
+        "C": ["{short_name} had a fair semester", "However, {pronoun} needs to practise drawing", "However, {pronoun} needs to practise painting", np.nan, np.nan, np.nan, "Keep trying {short_name}!"],
+        "D": ["{short_name} had a difficult semester", "However, {pronoun} needs to practise drawing", "", "However, {pronoun} needs to practise sculpting", np.nan, np.nan, "Do not give up {short_name}!"]
+    }, index = ["Intro", "Drawing", "Painting", "Sculpting", "", "", "Closing"])
+
+def main(argv):
+    from components.common.comment_mapping import CommentMappingIndex
+    from components.report_generator.comment_generator import CommentGenerator
+
+    source_file_path = ""
+
+    try:
+        opts, args = getopt.getopt(argv, "hs:", ["help", "source="])
+    except getopt.GetoptError:
+        print("Error! Invalid argument(s).")
+        print("comment_mapping_test.py -s <source_file_path> --help")
+        sys.exit(2)
+
+    for opt, arg in opts:
+        if opt in ("-h", "--help"):
+            print(help_text)
+            sys.exit()
+        elif opt in ("-s", "--source"):
+            source_file_path = arg
+
+    sys.exit(1 if run(source_file_path, CommentMappingIndex, CommentGenerator) > 0 else 0)
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,214 @@
+import datetime
+import re
+
+from docx import Document
+from docx.shared import Cm, Pt
+from docx.enum.table import WD_TABLE_ALIGNMENT
+
+import config
+import components.report_generator.document as document_helper
+from components.common.profiler import Profiler, format_duration
+from components.common.report_index import ReportIndex
+from components.report_generator.report_card import PD_SCALE, ReportCardBuilder
+
+class ConsolidatedGenerator:
+    """
+    Generates one consolidated report card per student across all subjects.
+
+    The subject reports of each student are looked up in a ReportIndex, so every grader report is only loaded once
+    and the whole class is produced in a single pass. Comments are generated from the comment map of each subject.
+    """
+
+    def __init__(self, output_path,
+                 report_index: ReportIndex,
+                 date: datetime = None,
+                 signature_path = None,
+                 use_watermark = True,
+                 profiler: Profiler = None):
+        """
+        Initialize the consolidated generator instance.
+
+        Args:
+            output_path (str): The path of the output folder.
+            report_index (ReportIndex): The index over the grader reports of all subjects.
+            date (datetime): The date for the report.
+            signature_path (str): The path to the homeroom teacher's signature image.
+            use_watermark (bool): Whether to use a watermark in the generated reports.
+            profiler (Profiler): The profiler to record the timing spans with. A new profiler is created if not given.
+        """
+        self.output_path = output_path
+        self.report_index = report_index
+        self.date = date
+        self.signature_path = signature_path
+        self.use_watermark = use_watermark
+        self.profiler = profiler if profiler is not None else Profiler()
+
+        # One builder per subject, shared by all students
+        self.__builders = {id(grader_report): ReportCardBuilder(grader_report = grader_report, date = date)
+                           for grader_report in report_index.grader_reports}
+
+    def build(self, student_name, autocorrect = False):
+        """
+        Builds the report cards of a student in every indexed subject.
+
+        Args:
+            student_name (str): The name of the student.
+            autocorrect (bool): Whether to autocorrect the generated comments or not.
+
+        Returns:
+            list: The ReportCard instances of the student, one per subject.
+        """
+        return [self.__builders[id(grader_report)].build(name, autocorrect = autocorrect)
+                for name, grader_report in self.report_index.lookup(student_name)]
+
+    def generate_all(self, autocorrect = False, callback = None):
+        """
+        Generates a consolidated report card for every indexed student.
+
+        Args:
+            autocorrect (bool): Whether to autocorrect the generated comments or not.
+            callback (function): The callback function to be called after each student is processed.
+
+        Returns:
+            list: The paths of the generated documents.
+        """
+        students = self.report_index.students()
+        job_count = len(students)
+        job_start = self.profiler.elapsed()
+        paths = []
+
+        print(f"[  ] Generating consolidated reports for {job_count} students across {len(self.report_index.grader_reports)} subjects…")
+
+        for i, student_name in enumerate(students):
+            if callback is not None:
+                callback(i, job_count, f"Generating consolidated report for {student_name}…")
+
+            try:
+                paths.append(self.generate_for_student(student_name, autocorrect = autocorrect))
+                print(f"[OK] Consolidated report for {student_name} generated.")
+            except Exception as e:
+                print(f"[!!] Error: Consolidated report for {student_name} failed. Details: {e}")
+                if callback is not None:
+                    callback(i + 1, job_count, f"Error: Consolidated report for {student_name} failed. Details: {e}")
+
+        time_taken_formatted = format_duration(self.profiler.elapsed() - job_start)
+        print(f"[OK] {len(paths)} of {job_count} consolidated reports generated. Time taken: {time_taken_formatted}")
+        if callback is not None:
+            callback(job_count, job_count, f"{len(paths)} of {job_count} consolidated reports generated. Time taken: {time_taken_formatted}")
+
+        return paths
+
+    def generate_for_student(self, student_name, autocorrect = False):
+        """
+        Generates the consolidated report card of a student.
+
+        Args:
+            student_name (str): The name of the student.
+            autocorrect (bool): Whether to autocorrect the generated comments or not.
+
+        Returns:
+            str: The path of the generated document.
+        """
+        with self.profiler.span("preparation", job = student_name):
+            report_cards = self.build(student_name, autocorrect = autocorrect)
+
+        if len(report_cards) == 0:
+            raise ValueError(f"{student_name} is not found in any of the grader reports.")
+
+        with self.profiler.span("render", job = student_name):
+            document = self.render(student_name, report_cards)
+
+        file_name = re.sub(r'[\\/:*?"<>|]', "-", student_name)
+        file_path = f"{self.output_path}/{file_name} - Consolidated.docx"
+        with self.profiler.span("save", job = student_name):
+            document_helper.save_deterministic(document, file_path)
+
+        return file_path
+
+    def render(self, student_name, report_cards):
+        """
+        Renders the consolidated report card of a student.
+
+        Args:
+            student_name (str): The name of the student.
+            report_cards (list): The ReportCard instances of the student, one per subject.
+
+        Returns:
+            Document: The rendered document. The document is not saved.
+        """
+        course_info = report_cards[0].course_info
+
+        document = Document()
+        document = document_helper.setup_page(document, 'a4')
+
+        doc_prop = document.core_properties
+        doc_prop.author = "JAC Academic Reporting System"
+        doc_prop.title = f"{student_name} - S{course_info['Semester']} AY{course_info['School Year']} Consolidated Report Card"
+        doc_prop.subject = f"S{course_info['Semester']} AY{course_info['School Year']} Consolidated Report Card"
+        doc_prop.category = "Consolidated Report Card"
+        doc_prop.keywords = "JAC; JARS; Report Card; Consolidated Report Card"
+        doc_prop.language = "en-GB"
+
+        section = document.sections[0]
+        header_content = section.header.paragraphs[0]
+        header_content.alignment = WD_TABLE_ALIGNMENT.CENTER
+        header_content.add_run().add_picture(config.get_config("logo_path"), width = Cm(5.56))
+
+        style = document.styles["Normal"]
+        style.font.name = "Calibri"
+        style.font.size = Pt(11)
+
+        # Student Information Section
+        document_helper.build_table(document, [
+            [{"text": "Student", "bold": True}, student_name, {"text": "School Year", "bold": True}, course_info["School Year"]],
+            [{"text": "Grade", "bold": True}, course_info["Grade"], {"text": "Semester", "bold": True}, course_info["Semester"]]
+        ], widths = [Cm(3), Cm(6), Cm(3), Cm(5)])
+
+        # Summary Section
+        self.__add_header(document, "SUMMARY")
+        summary_rows = [[{"text": heading, "bold": True} for heading in ["Subject", "Teacher", "Score", "Grade"]]]
+        for report_card in report_cards:
+            summary_rows.append([report_card.course_info["Subject"], report_card.course_info["Teacher"],
+                                 {"text": report_card.final_score, "align": "center"}, {"text": report_card.letter_grade, "align": "center"}])
+        document_helper.build_table(document, summary_rows, widths = [Cm(5), Cm(8), Cm(2), Cm(2)])
+
+        # Subject Sections
+        for report_card in report_cards:
+            self.__add_header(document, str(report_card.course_info["Subject"]).upper())
+
+            sna_rows = [[assessment, {"text": grade, "align": "center"}] for assessment, grade in report_card.sna.items()]
+            sna_rows.append([{"text": report_card.comment, "align": "both", "span": 2}])
+            document_helper.build_table(document, sna_rows, widths = [Cm(15), Cm(2)])
+
+            pd_rows = [[{"text": label, "bold": True, "align": "center"} for label in ["Personal Development"] + PD_SCALE]]
+            for item, pd_grade in report_card.pd.items():
+                pd_rows.append([{"text": item, "align": "left"}] +
+                               [{"text": "✔", "font": "Segoe UI Symbol", "align": "center"} if grade == pd_grade else None for grade in range(1, len(PD_SCALE) + 1)])
+            if len(pd_rows) > 1:
+                document_helper.build_table(document, pd_rows, widths = [Cm(12)] + [Cm(1)] * len(PD_SCALE))
+
+        # Acknowledgement Section
+        self.__add_header(document, "ACKNOWLEDGEMENT")
+        date_paragraphs = ["Date"]
+        if self.date is not None:
+            date_paragraphs.append(self.date.strftime("%B %d, %Y"))
+
+        ak_table = document_helper.build_table(document, [
+            [{"text": "Homeroom Teacher:", "bold": True}, "Signature", {"paragraphs": date_paragraphs}],
+            [{"text": "Parent:", "bold": True}, "Signature", "Date"]
+        ], widths = [Cm(6.5), Cm(6.5), Cm(4)], heights = [Cm(1.5), Cm(1.5)])
+
+        if self.signature_path is not None:
+            ak_table.cell(0, 1).add_paragraph().add_run().add_picture(self.signature_path, height = Cm(1.5))
+
+        if self.use_watermark:
+            document_helper.add_image_watermark(document, config.get_config("watermark_path"), opacity = 0.1, width_pt = 600, height_pt = 600)
+
+        return document
+
+    def __add_header(self, document, title):
+        """Adds a section header to the document."""
+        header = document.add_paragraph()
+        header.add_run(title).bold = True
+        header.paragraph_format.space_before = Pt(12)
+        header.paragraph_format.space_after = Pt(0)
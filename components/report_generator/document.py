@@ -1,13 +1,21 @@
+import io
 import json
+import zipfile
+
+from xml.sax.saxutils import escape, quoteattr
 
 from docx import Document
-from docx.shared import Mm, Pt
+from docx.shared import Emu, Mm, Pt
 from docx.oxml import OxmlElement, parse_xml
-from docx.oxml.ns import qn
+from docx.oxml.ns import nsdecls, qn
+from docx.table import Table
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 
 import config
 
+# Fixed timestamp for the entries of deterministic DOCX files (the earliest date a zip file can store)
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+
 @staticmethod
 def setup_page(document: Document, page_size: str = 'a4'):
     """
@@ -208,4 +216,213 @@ def add_image_watermark(doc, image_path, opacity=0.5, width_pt=350, height_pt=35
         parent.replace(inline, anchor)
         
         # Center alignment
-        paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
\ No newline at end of file
+        paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+@staticmethod
+def build_table(document: Document, rows, widths = None, heights = None, style = "Table Grid", alignment = "center"):
+    """
+    Builds a whole table from a specification and appends it to the document.
+
+    The table XML is generated in one go and parsed once, which is much faster than building a table
+    cell by cell with python-docx (every .cell() call walks the whole table grid). The result is the same
+    as building the table with add_table(), setting the cell properties one by one, and disabling autofit.
+
+    Each row is a list of cells in XML order: a merged cell spanning several columns is listed once with "span",
+    and a vertically merged cell is listed in every row it covers ("restart" in the first row, "continue" below).
+    A cell is either None (empty cell), a string (the cell text), or a dictionary with the following keys:
+        text (str): The text of the cell. Use paragraphs instead for more than one paragraph.
+        paragraphs (list): The paragraphs of the cell. Each paragraph is a string or a dictionary with the text, bold, align, font, and size keys.
+        bold (bool): Whether the text is bold.
+        align (str): The paragraph alignment ("left", "center", "right", or "both").
+        font (str): The font name of the text.
+        size (Length): The font size of the text.
+        width (Length): The width of the cell. Defaults to the width of its column.
+        span (int): The number of grid columns the cell spans.
+        merge (str): The vertical merge state of the cell ("restart" or "continue").
+        borders (dict): The cell borders. Follows the keyword arguments of set_cell_border().
+        margins (dict): The cell margins. Follows the keyword arguments of set_cell_margin().
+        valign (str): The vertical alignment of the cell ("top", "center", or "bottom").
+
+    Usage example:
+    >>> build_table(document, [
+    >>>     [{"text": "Student", "bold": True}, "John Doe"],
+    >>>     [{"text": "Comment", "span": 2, "align": "both"}]
+    >>> ], widths = [Cm(3), Cm(14)])
+
+    Args:
+        document (Document): The document to add the table to.
+        rows (list): The rows of the table.
+        widths (list): The default width (Length) of each grid column. Defaults to the page width split evenly.
+        heights (list): The height (Length) of each row. None leaves the row height automatic.
+        style (str): The name of the table style.
+        alignment (str): The horizontal alignment of the table.
+
+    Returns:
+        Table: The table, which can still be edited with python-docx (e.g. to add pictures).
+    """
+    columns = max(sum(cell.get("span", 1) if isinstance(cell, dict) else 1 for cell in row) for row in rows)
+    grid_width = Emu(int(document._block_width / columns)).twips
+    widths = [width.twips for width in widths] if widths is not None else [grid_width] * columns
+
+    parts = [f"<w:tbl {nsdecls('w')}><w:tblPr>"]
+    if style is not None:
+        parts.append(f'<w:tblStyle w:val={quoteattr(document.styles[style].style_id)}/>')
+    parts.append('<w:tblW w:type="auto" w:w="0"/>')
+    if alignment is not None:
+        parts.append(f'<w:jc w:val="{alignment}"/>')
+    parts.append('<w:tblLayout w:type="fixed"/>'
+                 '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" w:noHBand="0" w:noVBand="1" w:val="04A0"/>'
+                 '</w:tblPr><w:tblGrid>')
+    parts.append(f'<w:gridCol w:w="{grid_width}"/>' * columns)
+    parts.append("</w:tblGrid>")
+
+    for i, row in enumerate(rows):
+        parts.append("<w:tr>")
+        if heights is not None and heights[i] is not None:
+            parts.append(f'<w:trPr><w:trHeight w:val="{heights[i].twips}"/></w:trPr>')
+
+        column = 0
+        for cell in row:
+            cell = cell if isinstance(cell, dict) else {"text": cell}
+            parts.append(_cell_xml(cell, widths[column]))
+            column += cell.get("span", 1)
+
+        parts.append("</w:tr>")
+
+    parts.append("</w:tbl>")
+
+    tbl = parse_xml("".join(parts))
+    document.element.body._insert_tbl(tbl)
+    return Table(tbl, document._body)
+
+@staticmethod
+def save_deterministic(document: Document, target):
+    """
+    Saves a document so that identical documents produce byte-identical files.
+
+    python-docx already generates the same XML parts, relationship IDs and drawing IDs for the same sequence of edits,
+    but stamps every zip entry with the current time. This rewrites the package with a fixed entry timestamp,
+    fixed entry attributes, and a stable entry order ([Content_Types].xml first, then by name).
+
+    Args:
+        document (Document): The document to save.
+        target (str | file): The path of the output file or a writable binary file object (e.g. io.BytesIO).
+    """
+    buffer = io.BytesIO()
+    document.save(buffer)
+
+    with zipfile.ZipFile(buffer) as source:
+        entries = sorted(source.infolist(), key = lambda entry: (entry.filename != "[Content_Types].xml", entry.filename))
+        contents = [(entry.filename, source.read(entry.filename)) for entry in entries]
+
+    with zipfile.ZipFile(target, "w", compression = zipfile.ZIP_DEFLATED) as package:
+        for name, data in contents:
+            entry = zipfile.ZipInfo(name, date_time = ZIP_EPOCH)
+            entry.compress_type = zipfile.ZIP_DEFLATED
+            entry.create_system = 0
+            entry.external_attr = 0
+            package.writestr(entry, data, compresslevel = 6)
+
+def _cell_xml(cell, default_width):
+    """
+    Gets the XML of a table cell. See build_table() for the cell specification.
+
+    Args:
+        cell (dict): The cell specification.
+        default_width (int): The width of the cell column in twips.
+
+    Returns:
+        str: The w:tc element.
+    """
+    width = cell["width"].twips if "width" in cell else default_width
+    parts = [f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{width}"/>']
+
+    if cell.get("span", 1) > 1:
+        parts.append(f'<w:gridSpan w:val="{cell["span"]}"/>')
+    if cell.get("merge") == "restart":
+        parts.append('<w:vMerge w:val="restart"/>')
+    elif cell.get("merge") == "continue":
+        parts.append("<w:vMerge/>")
+
+    if "borders" in cell:
+        parts.append("<w:tcBorders>")
+        for edge in ("start", "top", "end", "bottom", "insideH", "insideV"):
+            if cell["borders"].get(edge):
+                attributes = "".join(f' w:{key}={quoteattr(str(cell["borders"][edge][key]))}'
+                                     for key in ["sz", "val", "color", "space"] if key in cell["borders"][edge])
+                parts.append(f"<w:{edge}{attributes}/>")
+        parts.append("</w:tcBorders>")
+
+    if "margins" in cell:
+        parts.append("<w:tcMar>")
+        for side in ("top", "bottom", "left", "right"):
+            # Convert mm to twips (1 mm = 56.7 twips)
+            parts.append(f'<w:{side} w:w="{int(cell["margins"].get(f"margin_{side}_mm", 0) * 56.7)}" w:type="dxa"/>')
+        parts.append("</w:tcMar>")
+
+    if "valign" in cell:
+        parts.append(f'<w:vAlign w:val="{cell["valign"]}"/>')
+    parts.append("</w:tcPr>")
+
+    paragraphs = cell.get("paragraphs", [cell.get("text")])
+    for paragraph in paragraphs:
+        paragraph = paragraph if isinstance(paragraph, dict) else {"text": paragraph}
+        # Cell level formatting applies to every paragraph unless the paragraph overrides it
+        parts.append(_paragraph_xml({**{key: cell[key] for key in ("bold", "align", "font", "size") if key in cell}, **paragraph}))
+
+    parts.append("</w:tc>")
+    return "".join(parts)
+
+def _paragraph_xml(paragraph):
+    """
+    Gets the XML of a paragraph with a single run. A paragraph with no text (None) has no run.
+
+    Args:
+        paragraph (dict): The paragraph specification with the text, bold, align, font, and size keys.
+
+    Returns:
+        str: The w:p element.
+    """
+    parts = ["<w:p>"]
+    if "align" in paragraph:
+        parts.append(f'<w:pPr><w:jc w:val="{paragraph["align"]}"/></w:pPr>')
+
+    if paragraph.get("text") is not None:
+        properties = ""
+        if "font" in paragraph:
+            properties += f'<w:rFonts w:ascii={quoteattr(paragraph["font"])} w:hAnsi={quoteattr(paragraph["font"])}/>'
+        if paragraph.get("bold"):
+            properties += "<w:b/>"
+        if "size" in paragraph:
+            properties += f'<w:sz w:val="{int(paragraph["size"].pt * 2)}"/>'
+
+        parts.append("<w:r>")
+        if properties != "":
+            parts.append(f"<w:rPr>{properties}</w:rPr>")
+        parts.append(_text_xml(str(paragraph["text"])))
+        parts.append("</w:r>")
+
+    parts.append("</w:p>")
+    return "".join(parts)
+
+def _text_xml(text):
+    """
+    Gets the run content XML of a text. Like python-docx, line breaks and tabs become w:br and w:tab elements.
+
+    Args:
+        text (str): The text.
+
+    Returns:
+        str: The run content.
+    """
+    parts = []
+    for i, line in enumerate(text.replace("\r\n", "\n").replace("\r", "\n").split("\n")):
+        if i > 0:
+            parts.append("<w:br/>")
+        for j, chunk in enumerate(line.split("\t")):
+            if j > 0:
+                parts.append("<w:tab/>")
+            if chunk != "":
+                preserve = ' xml:space="preserve"' if chunk != chunk.strip() else ""
+                parts.append(f"<w:t{preserve}>{escape(chunk)}</w:t>")
+    return "".join(parts)
@@ -0,0 +1,113 @@
+# TEST
+import datetime
+import getopt
+import hashlib
+import io
+import sys
+import tempfile
+import time
+import zipfile
+
+help_text = """
+HELP PAGE
+=========
+This script saves the same documents twice, a few seconds apart, and checks that the saved DOCX files are byte-identical
+(see document.save_deterministic). A changed document must still give a different file.
+
+=========
+USAGE
+=========
+Format:
+document_test.py -s <source_file_path>
+
+Options:
+-h, --help
+    Displays this help page.
+-s, --source <source_file_path>
+    Specifies a grader report to also render the report card of its first student twice. Optional.
+    Example:
+        C:/Users/John Doe/Desktop/Grader Report P1A Art Sample.xlsx
+
+Example:
+document_test.py -s C:/Users/John Doe/Desktop/Grader Report P1A Art Sample.xlsx
+
+Note:
+The script exits with 1 if any check fails.
+"""
+
+def run(source_file_path, Document, document_helper, GraderReport, Generator):
+    failures = []
+
+    def check(name, condition):
+        print(f"[OK] {name}" if condition else f"[!!] {name}")
+        if not condition:
+            failures.append(name)
+
+    def save(document):
+        buffer = io.BytesIO()
+        document_helper.save_deterministic(document, buffer)
+        return buffer.getvalue()
+
+    def build(text):
+        document = Document()
+        document_helper.setup_page(document, 'a4')
+        document.add_paragraph(text)
+        document_helper.build_table(document, [["Assessment", {"text": "A", "align": "center"}]])
+        return document
+
+    # Zip entry timestamps have a resolution of two seconds, so the saves are further apart than that
+    print("[  ] Saving a sample document twice…")
+    first = save(build("Sample report"))
+    time.sleep(2.5)
+    second = save(build("Sample report"))
+    check("The same document gives the same bytes", hashlib.sha256(first).hexdigest() == hashlib.sha256(second).hexdigest())
+    check("A changed document gives different bytes", save(build("Changed report")) != first)
+
+    with zipfile.ZipFile(io.BytesIO(first)) as package:
+        entries = package.infolist()
+    check("[Content_Types].xml is the first entry", entries[0].filename == "[Content_Types].xml")
+    check("The other entries are sorted by name", [entry.filename for entry in entries[1:]] == sorted(entry.filename for entry in entries[1:]))
+    check("Every entry has the fixed timestamp", all(entry.date_time == document_helper.ZIP_EPOCH for entry in entries))
+
+    if source_file_path != "":
+        print("[  ] Rendering a report card twice…")
+        grader_report = GraderReport(source_file_path, skip_validation = True)
+        grader_report.validate(callback = print)
+        generator = Generator(tempfile.mkdtemp(prefix = "jars_document_test_"), grader_report, date = datetime.datetime(2025, 1, 1))
+        report_card = generator.plan_for_student(grader_report.students.index[0], autocorrect = False, force = True)
+
+        first = save(generator.render(report_card))
+        time.sleep(2.5)
+        second = save(generator.render(report_card))
+        check("The same report card gives the same bytes", first == second)
+
+    print(f"[  ] Done. {len(failures)} check(s) failed.")
+    return len(failures)
+
+def main(argv):
+    from docx import Document
+
+    import components.report_generator.document as document_helper
+    from components.common.grader_report import GraderReport
+    from components.report_generator.semester_report import Generator
+
+    source_file_path = ""
+
+    try:
+        opts, args = getopt.getopt(argv, "hs:", ["help", "source="])
+    except getopt.GetoptError:
+        print("Error! Invalid argument(s).")
+        print("document_test.py -s <source_file_path> --help")
+        sys.exit(2)
+
+    for opt, arg in opts:
+        if opt in ("-h", "--help"):
+            print(help_text)
+            sys.exit()
+        elif opt in ("-s", "--source"):
+            source_file_path = arg
+
+    sys.exit(1 if run(source_file_path, Document, document_helper, GraderReport, Generator) > 0 else 0)
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,212 @@
+import base64
+import html
+import mimetypes
+
+import config
+from components.report_generator.report_card import PD_SCALE, ReportCard
+
+STYLESHEET = """
+body { font-family: Calibri, Carlito, Arial, sans-serif; font-size: 11pt; margin: 0; background: #f2f2f2; }
+.page { position: relative; width: 17cm; margin: 1cm auto; padding: 1cm 2cm; background: #ffffff; overflow: hidden; }
+.header { text-align: center; }
+.header img { width: 5.56cm; }
+.watermark { position: absolute; top: 50%; left: 50%; width: 600pt; height: 600pt; transform: translate(-50%, -50%); opacity: 0.1; pointer-events: none; }
+h2 { font-size: 11pt; margin: 0; }
+table { width: 100%; border-collapse: collapse; }
+td, th { border: 1px solid #000000; padding: 2pt 5pt; vertical-align: top; }
+th { text-align: center; }
+.label { font-weight: bold; }
+.center { text-align: center; }
+.justify { text-align: justify; }
+.description { height: 1.5cm; }
+.comment { height: 2cm; }
+.acknowledgement td { height: 1.5cm; }
+.acknowledgement img { height: 1.5cm; }
+.no-start { border-left: none; }
+.no-end { border-right: none; }
+.legend td { font-size: 9pt; text-align: center; vertical-align: middle; }
+.legend .spacer { border-top: none; border-bottom: none; padding: 0; width: 0.2cm; }
+.index td, .index th { padding: 4pt 8pt; }
+@media print { body { background: none; } .page { margin: 0; } }
+"""
+
+SNA_LEGEND = [("A", "95-100"), ("B", "85-94"), ("C", "75-84"), ("D", "40-74"), ("E", "Below 40")]
+PD_LEGEND = [("E", "Excellent"), ("VG", "Very Good"), ("G", "Good"), ("S", "Satisfactory"), ("NI", "Needs Improvement")]
+
+class HTMLRenderer:
+    """
+    Renders report cards as self-contained HTML pages for publishing to the parent portal.
+
+    The pages follow the layout of the DOCX report card. Images (logo, watermark, and signature) are embedded
+    as data URIs so that each page is a single file with no external references.
+
+    Attributes:
+        use_watermark (bool): Whether to add the watermark to the pages.
+
+    Methods:
+        render(self, report_card): Renders a report card as an HTML page.
+        render_index(self, report_cards): Renders the class index page.
+    """
+
+    def __init__(self, use_watermark = True):
+        """
+        Initialize the renderer instance. The logo and watermark images are read once and reused for every page.
+
+        Args:
+            use_watermark (bool): Whether to add the watermark to the pages.
+        """
+        self.use_watermark = use_watermark
+
+        self.__images = {}
+        self.__logo = self.__image(config.get_config("logo_path"))
+        self.__watermark = self.__image(config.get_config("watermark_path")) if use_watermark else None
+
+    def render(self, report_card: ReportCard):
+        """
+        Renders a report card as an HTML page.
+
+        Args:
+            report_card (ReportCard): The report card to render.
+
+        Returns:
+            str: The HTML page.
+        """
+        course_info = report_card.course_info
+        section_spacing = f"{report_card.spacing['section']}pt"
+        subject_description_spacing = f"{report_card.spacing['subject_description']}pt"
+
+        parts = [_page_start(report_card.metadata["title"]), '<div class="page">']
+
+        if self.__watermark is not None:
+            parts.append(f'<img class="watermark" src="{self.__watermark}" alt="">')
+        parts.append(f'<div class="header"><img src="{self.__logo}" alt="Logo"></div>')
+
+        # Course Information Section
+        parts.append(f"""
+<table>
+<colgroup><col style="width: 3cm"><col style="width: 8cm"><col style="width: 3cm"><col style="width: 1.5cm"><col style="width: 1.5cm"></colgroup>
+<tr><td class="label">Student</td><td>{_text(report_card.student_name)}</td><td class="label">Semester</td><td class="center" colspan="2">{_text(course_info["Semester"])}</td></tr>
+<tr><td class="label">Grade</td><td>{_text(course_info["Grade"])}</td><td class="label">Subject</td><td class="center" colspan="2">{_text(course_info["Subject"])}</td></tr>
+<tr><td class="label">School Year</td><td>{_text(course_info["School Year"])}</td><td class="label">Assessment</td><td class="center">{_text(report_card.final_score)}</td><td class="center">{_text(report_card.letter_grade)}</td></tr>
+</table>""")
+
+        # Subject Description Section
+        parts.append(_section_header("SUBJECT DESCRIPTION", subject_description_spacing))
+        parts.append(f'<table><tr><td class="description">{_text(course_info["Subject Description"])}</td></tr></table>')
+
+        # Skills and Assessment Section
+        parts.append(_section_header("SKILLS AND ASSESSMENT", section_spacing))
+        parts.append('<table><colgroup><col style="width: 15cm"><col style="width: 2cm"></colgroup>')
+        for assessment, grade in report_card.sna.items():
+            parts.append(f'<tr><td>{_text(assessment)}</td><td class="center">{_text(grade)}</td></tr>')
+        parts.append("</table>")
+
+        # Personal Development Section
+        parts.append(_section_header("PERSONAL DEVELOPMENT", section_spacing))
+        parts.append('<table><colgroup><col style="width: 12cm">' + '<col style="width: 1cm">' * len(PD_SCALE) + "</colgroup>")
+        parts.append("<tr><th>Item</th>" + "".join(f"<th>{label}</th>" for label in PD_SCALE) + "</tr>")
+        for item, pd_grade in report_card.pd.items():
+            marks = "".join(f'<td class="center">{"&#10004;" if grade == pd_grade else ""}</td>' for grade in range(1, len(PD_SCALE) + 1))
+            parts.append(f"<tr><td>{_text(item)}</td>{marks}</tr>")
+        parts.append("</table>")
+
+        # Teacher's Comments Section
+        parts.append(_section_header("TEACHER'S COMMENTS", section_spacing))
+        parts.append(f'<table><tr><td class="comment justify">{_text(report_card.comment)}</td></tr></table>')
+
+        # Acknowledgement Section
+        signature = ""
+        if report_card.signature_path is not None:
+            signature = f'<img src="{self.__image(report_card.signature_path)}" alt="Signature">'
+        date = report_card.date.strftime("%B %d, %Y") if report_card.date is not None else ""
+
+        parts.append(_section_header("ACKNOWLEDGEMENT", section_spacing))
+        parts.append(f"""
+<table class="acknowledgement">
+<colgroup><col style="width: 6.5cm"><col style="width: 2cm"><col style="width: 4.5cm"><col style="width: 4cm"></colgroup>
+<tr><td><span class="label">Teacher:</span><br>{_text(course_info["Teacher"])}</td><td class="no-end">Signature</td><td class="no-start">{signature}</td><td>Date<br>{_text(date)}</td></tr>
+<tr><td class="label">Parent:</td><td colspan="2">Signature</td><td>Date</td></tr>
+</table>""")
+
+        # Legend Section
+        parts.append(_section_header("GRADING SYSTEM", section_spacing))
+        parts.append('<table class="legend">')
+        parts.append('<tr><td class="label" colspan="6">Skills and Assessment</td><td class="spacer"></td><td class="label" colspan="6">Personal Development</td></tr>')
+        parts.append("<tr>" + _legend_cells(SNA_LEGEND[0:4:2], SNA_LEGEND[4]) + '<td class="spacer"></td>' + _legend_cells(PD_LEGEND[0:4:2], PD_LEGEND[4]) + "</tr>")
+        parts.append("<tr>" + _legend_cells(SNA_LEGEND[1:4:2]) + '<td class="spacer"></td>' + _legend_cells(PD_LEGEND[1:4:2]) + "</tr>")
+        parts.append("</table>")
+
+        parts.append("</div>")
+        parts.append(_page_end())
+
+        return "\n".join(parts)
+
+    def render_index(self, report_cards, links = None):
+        """
+        Renders the class index page listing every report card.
+
+        Args:
+            report_cards (list): The list of ReportCard instances.
+            links (dict): The link to each student's page keyed by student name. Defaults to "<student name>.html".
+
+        Returns:
+            str: The HTML page.
+        """
+        if len(report_cards) > 0:
+            course_info = report_cards[0].course_info
+            title = f"{course_info['Subject']} {course_info['Grade']} - S{course_info['Semester']} AY{course_info['School Year']} Report Cards"
+        else:
+            title = "Report Cards"
+
+        parts = [_page_start(title), '<div class="page">', f'<div class="header"><img src="{self.__logo}" alt="Logo"></div>']
+        parts.append(f"<h2>{_text(title)}</h2>")
+        parts.append('<table class="index"><tr><th>Student</th><th>Score</th><th>Grade</th></tr>')
+        for report_card in report_cards:
+            link = links[report_card.student_name] if links is not None else f"{report_card.student_name}.html"
+            parts.append(f'<tr><td><a href="{html.escape(link)}">{_text(report_card.student_name)}</a></td>'
+                         f'<td class="center">{_text(report_card.final_score)}</td><td class="center">{_text(report_card.letter_grade)}</td></tr>')
+        parts.append("</table></div>")
+        parts.append(_page_end())
+
+        return "\n".join(parts)
+
+    def __image(self, path):
+        """
+        Gets an image as a data URI. Images are cached by path.
+
+        Args:
+            path (str): The path to the image.
+
+        Returns:
+            str: The data URI of the image.
+        """
+        if path not in self.__images:
+            mime_type = mimetypes.guess_type(path)[0] or "image/png"
+            with open(path, "rb") as image_file:
+                self.__images[path] = f"data:{mime_type};base64,{base64.b64encode(image_file.read()).decode('ascii')}"
+
+        return self.__images[path]
+
+def _text(value):
+    """Escapes a value for use as HTML text. None is rendered as an empty string."""
+    return html.escape(str(value)) if value is not None else ""
+
+def _section_header(title, spacing):
+    """Gets the HTML for a section header with the given spacing above it."""
+    return f'<h2 style="margin-top: {spacing}">{_text(title)}</h2>'
+
+def _legend_cells(pairs, merged = None):
+    """Gets the legend cells of a row. The merged pair spans two rows and is only given for the first row."""
+    cells = "".join(f"<td>{_text(key)}</td><td>{_text(value)}</td>" for key, value in pairs)
+    if merged is not None:
+        cells += f'<td rowspan="2">{_text(merged[0])}</td><td rowspan="2">{_text(merged[1])}</td>'
+    return cells
+
+def _page_start(title):
+    """Gets the start of an HTML page."""
+    return (f'<!DOCTYPE html>\n<html lang="en-GB">\n<head>\n<meta charset="utf-8">\n<title>{_text(title)}</title>\n'
+            f'<meta name="generator" content="JAC Academic Reporting System">\n<style>{STYLESHEET}</style>\n</head>\n<body>')
+
+def _page_end():
+    """Gets the end of an HTML page."""
+    return "</body>\n</html>\n"
@@ -0,0 +1,108 @@
+# TEST
+import getopt
+import os
+import sys
+import tempfile
+
+from pypdf import PdfWriter
+
+help_text = """
+HELP PAGE
+=========
+This script signs sample PDF files with the JARSIM Digital Signature, verifies them, and checks that changed files fail.
+
+=========
+USAGE
+=========
+Format:
+integrity_test.py -o <output_folder_path>
+
+Options:
+-h, --help
+    Displays this help page.
+-o, --output <output_folder_path>
+    Specifies the folder to write the sample files to. Defaults to a new temporary folder.
+    Example:
+        C:/Users/John Doe/Desktop/Integrity Test
+
+Example:
+integrity_test.py -o C:/Users/John Doe/Desktop/Integrity Test
+
+Note:
+The script exits with 1 if any check fails.
+"""
+
+def run(output_folder_path, integrity):
+    failures = []
+
+    def check(name, condition):
+        print(f"[OK] {name}" if condition else f"[!!] {name}")
+        if not condition:
+            failures.append(name)
+
+    # Sign (finalize with metadata) → verify
+    print(f"[  ] Signing a sample file with metadata…")
+    file_path = f"{output_folder_path}/Finalized.pdf"
+    _blank_pdf(file_path)
+    file_hash = integrity.finalize_pdf(file_path, {"/Title": "Yabushita Fu - Art - S1 AY2024/2025 Report Card", "/Author": "JAC Academic Reporting System"})
+
+    with open(file_path, "rb") as file:
+        data = file.read()
+    passed, reason = integrity.verify_pdf_data(data)
+    check("Finalized file passes", passed is True)
+    check("Hash is embedded in the file", file_hash.encode() in data)
+
+    # Sign without metadata → verify
+    print(f"[  ] Signing a sample file without metadata…")
+    signed_path = f"{output_folder_path}/Signed.pdf"
+    _blank_pdf(signed_path)
+    integrity.sign_pdf(signed_path)
+    passed, reason = integrity.verify_pdf(signed_path)
+    check("Signed file passes", passed is True)
+
+    # Changed metadata (same length, so the file structure stays intact)
+    print(f"[  ] Verifying a changed file…")
+    passed, reason = integrity.verify_pdf_data(data.replace(b"Yabushita", b"Yabushite"))
+    check("File with changed metadata fails", passed is False)
+
+    # Changed hash
+    passed, reason = integrity.verify_pdf_data(data.replace(file_hash.encode(), file_hash[::-1].encode()))
+    check("File with changed hash fails", passed is False)
+
+    print(f"[  ] Done. {len(failures)} check(s) failed.")
+    return len(failures)
+
+def _blank_pdf(file_path):
+    """Writes a one-page blank PDF file."""
+    writer = PdfWriter()
+    writer.add_blank_page(width = 595, height = 842)
+    with open(file_path, "wb") as file:
+        writer.write(file)
+
+def main(argv):
+    import components.common.integrity as integrity
+
+    output_folder_path = ""
+
+    try:
+        opts, args = getopt.getopt(argv, "ho:", ["help", "output="])
+    except getopt.GetoptError:
+        print("Error! Invalid argument(s).")
+        print("integrity_test.py -o <output_folder_path> --help")
+        sys.exit(2)
+
+    for opt, arg in opts:
+        if opt in ("-h", "--help"):
+            print(help_text)
+            sys.exit()
+        elif opt in ("-o", "--output"):
+            output_folder_path = arg
+
+    if output_folder_path == "":
+        output_folder_path = tempfile.mkdtemp(prefix = "jars_integrity_test_")
+    os.makedirs(output_folder_path, exist_ok = True)
+
+    sys.exit(1 if run(output_folder_path, integrity) > 0 else 0)
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
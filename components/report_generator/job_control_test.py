@@ -0,0 +1,129 @@
+# TEST
+import getopt
+import sys
+import threading
+import time
+
+help_text = """
+HELP PAGE
+=========
+This script pauses, resumes, and cancels sample pipeline runs with a job control and checks that a paused run
+starts no new stage, that a stage that has started always finishes, and that cancelled jobs are still returned.
+
+=========
+USAGE
+=========
+Format:
+job_control_test.py --help
+
+Options:
+-h, --help
+    Displays this help page.
+
+Example:
+job_control_test.py
+
+Note:
+The script exits with 1 if any check fails.
+"""
+
+def run(pipeline):
+    failures = []
+
+    def check(name, condition):
+        print(f"[OK] {name}" if condition else f"[!!] {name}")
+        if not condition:
+            failures.append(name)
+
+    keys = [f"Student {i}" for i in range(20)]
+    lock = threading.Lock()
+
+    def start(function):
+        result = {}
+        thread = threading.Thread(target = lambda: result.setdefault("jobs", function()), daemon = True)
+        thread.start()
+        return thread, result
+
+    # Control states
+    print("[  ] Checking the control states…")
+    control = pipeline.JobControl()
+    check("A new control is running", not control.paused and not control.cancelled and control.wait())
+    control.pause()
+    check("A paused control is paused", control.paused)
+    control.resume()
+    check("A resumed control runs again", not control.paused and control.wait())
+    control.cancel()
+    control.pause()
+    check("A cancelled control cannot be paused", not control.paused and control.cancelled and not control.wait())
+
+    # Pause and resume: no stage starts while paused, and every job finishes after resuming
+    print("[  ] Checking pause and resume…")
+    control = pipeline.JobControl()
+    processed = []
+    first_started = threading.Event()
+    release = threading.Event()
+
+    def slow(job):
+        first_started.set()
+        release.wait()
+        with lock:
+            processed.append(job.key)
+
+    thread, result = start(lambda: pipeline.Pipeline([pipeline.Stage("rendering", slow)], control = control).run(keys))
+    first_started.wait(5)
+    control.pause()
+    release.set()
+    time.sleep(0.2)
+    check("The running stage finishes after a pause", len(processed) == 1)
+    time.sleep(0.2)
+    check("No stage starts while paused", len(processed) == 1 and thread.is_alive())
+
+    control.resume()
+    thread.join(10)
+    jobs = result.get("jobs", [])
+    check("Every job finishes after resuming", not thread.is_alive() and len(processed) == len(keys))
+    check("No job is cancelled or failed", all(not job.cancelled and not job.failed for job in jobs))
+
+    # Cancel: the remaining jobs are returned as cancelled, including the ones waiting while paused
+    print("[  ] Checking cancel…")
+    control = pipeline.JobControl()
+    processed = []
+    first_started.clear()
+    release.clear()
+
+    thread, result = start(lambda: pipeline.Pipeline([pipeline.Stage("rendering", slow)], control = control).run(keys))
+    first_started.wait(5)
+    control.pause()
+    release.set()
+    time.sleep(0.2)
+    control.cancel()
+    thread.join(10)
+    jobs = result.get("jobs", [])
+
+    check("A paused run winds down after a cancel", not thread.is_alive())
+    check("Every job is returned", [job.key for job in jobs] == keys)
+    check("The job that had started is completed", len(processed) == 1 and jobs[0].key == processed[0] and not jobs[0].cancelled)
+    check("The other jobs are cancelled", all(job.cancelled and not job.failed for job in jobs[1:]))
+
+    print(f"[  ] Done. {len(failures)} check(s) failed.")
+    return len(failures)
+
+def main(argv):
+    import components.report_generator.pipeline as pipeline
+
+    try:
+        opts, args = getopt.getopt(argv, "h", ["help"])
+    except getopt.GetoptError:
+        print("Error! Invalid argument(s).")
+        print("job_control_test.py --help")
+        sys.exit(2)
+
+    for opt, arg in opts:
+        if opt in ("-h", "--help"):
+            print(help_text)
+            sys.exit()
+
+    sys.exit(1 if run(pipeline) > 0 else 0)
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,135 @@
+# TEST
+import getopt
+import os
+import sys
+import tempfile
+
+from pypdf import PdfWriter
+
+help_text = """
+HELP PAGE
+=========
+This script records sample signed PDF files in a new signing ledger and checks the lookups, the ledger verification,
+and that a report signed again for the same student and course supersedes the earlier one.
+
+=========
+USAGE
+=========
+Format:
+ledger_test.py -o <output_folder_path>
+
+Options:
+-h, --help
+    Displays this help page.
+-o, --output <output_folder_path>
+    Specifies the folder to write the sample files and the ledger to. Defaults to a new temporary folder.
+    Example:
+        C:/Users/John Doe/Desktop/Ledger Test
+
+Example:
+ledger_test.py -o C:/Users/John Doe/Desktop/Ledger Test
+
+Note:
+The script exits with 1 if any check fails.
+"""
+
+def run(output_folder_path, integrity, SigningLedger):
+    failures = []
+
+    def check(name, condition):
+        print(f"[OK] {name}" if condition else f"[!!] {name}")
+        if not condition:
+            failures.append(name)
+
+    def sign(name, title):
+        file_path = f"{output_folder_path}/{name}.pdf"
+        writer = PdfWriter()
+        writer.add_blank_page(width = 595, height = 842)
+        with open(file_path, "wb") as file:
+            writer.write(file)
+        integrity.finalize_pdf(file_path, {"/Title": title, "/Author": "JAC Academic Reporting System"})
+        return file_path
+
+    ledger_path = f"{output_folder_path}/Signing Ledger.db"
+    if os.path.isfile(ledger_path):
+        os.remove(ledger_path)
+
+    print("[  ] Checking that a missing ledger is not created when verifying…")
+    try:
+        SigningLedger(ledger_path)
+        check("A missing ledger is reported", False)
+    except FileNotFoundError:
+        check("A missing ledger is reported", not os.path.isfile(ledger_path))
+
+    course = {"subject": "Art", "grade": "P1A", "semester": "1", "school_year": "2024-2025"}
+    with SigningLedger(ledger_path, create = True) as ledger:
+        print("[  ] Recording the first reports…")
+        first_path = sign("Yabushita Fu v1", "Yabushita Fu - Art - S1 AY2024/2025 Report Card")
+        other_path = sign("Hanamura Ko", "Hanamura Ko - Art - S1 AY2024/2025 Report Card")
+        first_serial = ledger.record(first_path, student = "Yabushita Fu", **course)
+        other_serial = ledger.record(other_path, student = "Hanamura Ko", **course)
+
+        check("A recorded file is found by its serial number", [entry["file_name"] for entry in ledger.lookup_serial(first_serial)] == [first_path])
+        with open(first_path, "rb") as file:
+            check("A recorded file is found by its file hash", len(ledger.lookup_hash(integrity.hash_bytes(file.read()))) == 1)
+        passed, reason = ledger.verify_by_ledger(first_path)
+        check("A recorded file passes the ledger verification", passed is True and "superseded" not in reason)
+
+        print("[  ] Signing the report of the same student and course again…")
+        second_path = sign("Yabushita Fu v2", "Yabushita Fu - Art - S1 AY2024/2025 Report Card (Revised)")
+        second_serial = ledger.record(second_path, student = "Yabushita Fu", **course)
+
+        first_entry = ledger.lookup_serial(first_serial)[-1]
+        check("The new report has a new serial number", second_serial != first_serial)
+        check("The earlier report is superseded by the new one", first_entry["superseded_by"] == second_serial)
+        check("The new report is not superseded", ledger.lookup_serial(second_serial)[-1]["superseded_by"] is None)
+        check("Other students are not superseded", ledger.lookup_serial(other_serial)[-1]["superseded_by"] is None)
+
+        passed, reason = ledger.verify_by_ledger(first_path)
+        check("The earlier report still passes, with a note", passed is True and second_serial in reason)
+
+        print("[  ] Signing the report of another course…")
+        third_path = sign("Yabushita Fu S2", "Yabushita Fu - Art - S2 AY2024/2025 Report Card")
+        ledger.record(third_path, student = "Yabushita Fu", **dict(course, semester = "2"))
+        check("Another semester does not supersede the report", ledger.lookup_serial(second_serial)[-1]["superseded_by"] is None)
+
+        print("[  ] Verifying changed and unknown files…")
+        with open(second_path, "rb") as file:
+            data = file.read()
+        passed, reason = ledger.verify_by_ledger(data = data.replace(b"Revised", b"Revisex"))
+        check("A changed recorded file fails", passed is False)
+        passed, reason = ledger.verify_by_ledger(sign("Unknown", "Unknown - Art - S1 AY2024/2025 Report Card"))
+        check("An unrecorded file is not found", passed is None)
+        check("No serial number is recorded for different files", ledger.duplicates() == {})
+
+    print(f"[  ] Done. {len(failures)} check(s) failed.")
+    return len(failures)
+
+def main(argv):
+    import components.common.integrity as integrity
+    from components.common.ledger import SigningLedger
+
+    output_folder_path = ""
+
+    try:
+        opts, args = getopt.getopt(argv, "ho:", ["help", "output="])
+    except getopt.GetoptError:
+        print("Error! Invalid argument(s).")
+        print("ledger_test.py -o <output_folder_path> --help")
+        sys.exit(2)
+
+    for opt, arg in opts:
+        if opt in ("-h", "--help"):
+            print(help_text)
+            sys.exit()
+        elif opt in ("-o", "--output"):
+            output_folder_path = arg
+
+    if output_folder_path == "":
+        output_folder_path = tempfile.mkdtemp(prefix = "jars_ledger_test_")
+    os.makedirs(output_folder_path, exist_ok = True)
+
+    sys.exit(1 if run(output_folder_path, integrity, SigningLedger) > 0 else 0)
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,196 @@
+import os
+import queue
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+
+try:
+    import uno
+    from com.sun.star.beans import PropertyValue
+except ImportError:
+    # The UNO bridge ships with LibreOffice's own Python and is only needed for the LibreOffice backend
+    uno = None
+
+CONNECT_TIMEOUT = 30
+CONVERT_TIMEOUT = 120
+
+class LibreOfficePool:
+    """
+    Pool of persistent headless LibreOffice instances for converting DOCX files to PDF.
+
+    Each instance runs with its own user profile and listens on its own UNO socket, so several
+    conversions can run at once. The instances are started once and reused for every conversion
+    instead of starting a converter per file. An instance that crashes is restarted on its next use.
+    An instance that hangs on a document is killed after the conversion timeout, so it does not hold its slot forever.
+
+    Attributes:
+        instances (int): The number of LibreOffice instances in the pool.
+        soffice_path (str): The path to the soffice executable.
+        timeout (float): The number of seconds a single conversion may take.
+
+    Methods:
+        start(self): Starts the LibreOffice instances.
+        convert(self, docx_path, pdf_path): Converts a DOCX file into a PDF file.
+        close(self): Terminates the LibreOffice instances and removes their profiles.
+    """
+
+    def __init__(self, instances = None, soffice_path = None, timeout = CONVERT_TIMEOUT):
+        """
+        Initialize the pool instance. The LibreOffice instances are not started until start() is called.
+
+        Args:
+            instances (int): The number of LibreOffice instances. Defaults to the number of CPU cores (up to 8).
+            soffice_path (str): The path to the soffice executable. Looked up on the PATH if not given.
+            timeout (float): The number of seconds a single conversion may take before its instance is killed.
+        """
+        self.instances = instances if instances is not None else min(os.cpu_count() or 1, 8)
+        self.soffice_path = soffice_path or shutil.which("soffice") or shutil.which("libreoffice")
+        self.timeout = timeout
+
+        self.__idle = queue.Queue()
+        self.__slots = []
+        self.__lock = threading.Lock()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def start(self):
+        """
+        Starts the LibreOffice instances and waits until all of them accept connections.
+
+        Raises:
+            RuntimeError: If the UNO bridge or LibreOffice is not available.
+        """
+        if uno is None:
+            raise RuntimeError("The LibreOffice PDF backend requires the UNO Python bridge (python3-uno).")
+        if self.soffice_path is None:
+            raise RuntimeError("LibreOffice is not installed or soffice is not on the PATH.")
+
+        print(f"[  ] Starting {self.instances} LibreOffice instance(s)…")
+        with self.__lock:
+            self.__slots = [self.__launch({"profile_path": tempfile.mkdtemp(prefix = "jars-lo-")}) for _ in range(self.instances)]
+
+        # The instances boot in parallel; connect to each once it is up
+        try:
+            for slot in self.__slots:
+                self.__connect(slot)
+                self.__idle.put(slot)
+        except Exception:
+            self.close()
+            raise
+
+        print(f"[OK] {self.instances} LibreOffice instance(s) ready.")
+
+    def convert(self, docx_path, pdf_path):
+        """
+        Converts a DOCX file into a PDF file. Blocks until an instance is free.
+
+        If the conversion takes longer than the timeout, the instance is killed (it is restarted on its next use)
+        and the conversion fails, so a document that hangs LibreOffice only fails its own report.
+
+        Args:
+            docx_path (str): The path to the DOCX file.
+            pdf_path (str): The path of the output PDF file.
+
+        Raises:
+            TimeoutError: If the conversion did not finish within the timeout.
+        """
+        slot = self.__idle.get()
+        try:
+            if slot["process"].poll() is not None:
+                print(f"[!!] LibreOffice instance on port {slot['port']} exited. Restarting…")
+                self.__connect(self.__launch(slot))
+
+            timed_out = threading.Event()
+            def on_timeout(process = slot["process"]):
+                timed_out.set()
+                process.kill()
+            watchdog = threading.Timer(self.timeout, on_timeout)
+            watchdog.daemon = True
+            watchdog.start()
+
+            try:
+                document = slot["desktop"].loadComponentFromURL(uno.systemPathToFileUrl(os.path.abspath(docx_path)), "_blank", 0,
+                                                                (_property("Hidden", True), _property("ReadOnly", True)))
+                try:
+                    document.storeToURL(uno.systemPathToFileUrl(os.path.abspath(pdf_path)), (_property("FilterName", "writer_pdf_Export"),))
+                finally:
+                    document.close(True)
+            except Exception as e:
+                # The killed instance drops its UNO bridge, which surfaces here as a disposed or runtime error
+                if timed_out.is_set():
+                    raise TimeoutError(f"LibreOffice did not convert {docx_path} within {self.timeout} seconds. The instance was stopped.") from e
+                raise
+            finally:
+                watchdog.cancel()
+
+            if timed_out.is_set():
+                raise TimeoutError(f"LibreOffice did not convert {docx_path} within {self.timeout} seconds. The instance was stopped.")
+        finally:
+            self.__idle.put(slot)
+
+    def close(self):
+        """Terminates the LibreOffice instances and removes their profiles."""
+        with self.__lock:
+            slots, self.__slots = self.__slots, []
+
+        for slot in slots:
+            try:
+                slot["desktop"].terminate()
+            except Exception:
+                pass # The bridge is already gone if the instance crashed
+
+            try:
+                slot["process"].wait(timeout = 10)
+            except subprocess.TimeoutExpired:
+                slot["process"].kill()
+
+            shutil.rmtree(slot["profile_path"], ignore_errors = True)
+
+        self.__idle = queue.Queue()
+
+    def __launch(self, slot):
+        """Starts a LibreOffice process for a slot on a free port."""
+        slot["port"] = _free_port()
+        slot["process"] = subprocess.Popen([self.soffice_path, "--headless", "--invisible", "--nologo", "--nodefault", "--norestore", "--nolockcheck",
+                                            f"--accept=socket,host=127.0.0.1,port={slot['port']};urp;StarOffice.ComponentContext",
+                                            f"-env:UserInstallation={uno.systemPathToFileUrl(slot['profile_path'])}"],
+                                           stdout = subprocess.DEVNULL, stderr = subprocess.DEVNULL)
+        return slot
+
+    def __connect(self, slot):
+        """Connects to the UNO socket of a slot's LibreOffice process."""
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext("com.sun.star.bridge.UnoUrlResolver", local_context)
+        deadline = time.monotonic() + CONNECT_TIMEOUT
+
+        while True:
+            try:
+                context = resolver.resolve(f"uno:socket,host=127.0.0.1,port={slot['port']};urp;StarOffice.ComponentContext")
+                break
+            except Exception:
+                if slot["process"].poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError(f"LibreOffice instance on port {slot['port']} did not start.")
+                time.sleep(0.25)
+
+        slot["desktop"] = context.ServiceManager.createInstanceWithContext("com.sun.star.frame.Desktop", context)
+
+def _property(name, value):
+    """Creates a UNO property value."""
+    property_value = PropertyValue()
+    property_value.Name = name
+    property_value.Value = value
+    return property_value
+
+def _free_port():
+    """Gets a free local TCP port."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
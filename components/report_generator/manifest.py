@@ -1,3 +1,5 @@
+import threading
+
 import openpyxl
 import pandas as pd
 
@@ -6,6 +8,7 @@ class Manifest:
     A class to represent a manifest file for the report generator.
     The manifest file contains a timeline of the report generation process as well as the list of students and the comments generated for each student.
     The manifest file is in Excel format.
+    Entries can be added from several worker threads at once.
     """
 
     def __init__(self, file_path):
@@ -16,6 +19,7 @@ class Manifest:
             file_path: The file path of the manifest file.
         """
         self.file_path = file_path
+        self.__lock = threading.Lock()
 
         # Create new pandas dataframe to store the manifest data
         self.table = pd.DataFrame(columns = ["Student", 
@@ -33,6 +37,13 @@ class Manifest:
         """
         Saves the manifest file.
         """
+        with self.__lock:
+            self.__save()
+
+    def __save(self):
+        """
+        Writes the manifest table into the manifest file. The caller must hold the manifest lock.
+        """
         self.table.to_excel(self.file_path, sheet_name = "Report Manifest", index = False)
 
         # Enable word wrap for the "Original Comment" and "Shortened Comment" columns
@@ -80,6 +91,15 @@ class Manifest:
             completed_at: The time when the report generation process was completed.
             error: The error message if the report generation process failed.
         """
+        with self.__lock:
+            self.__add_entry(student, comment_orig, comment_short, length_chars, length_words,
+                             input_tokens, output_tokens, status, completed_at, error)
+
+    def __add_entry(self, student, comment_orig, comment_short, length_chars, length_words,
+                    input_tokens, output_tokens, status, completed_at, error):
+        """
+        Prepends an entry to the manifest table. The caller must hold the manifest lock.
+        """
         self.table = pd.concat(
             [
                 pd.DataFrame(
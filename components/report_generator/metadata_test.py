@@ -0,0 +1,122 @@
+# TEST
+import getopt
+import io
+import os
+import re
+import sys
+import tempfile
+
+from pypdf import PdfReader, PdfWriter
+
+help_text = """
+HELP PAGE
+=========
+This script checks that the metadata read from the end of a PDF file (trailer only) matches the metadata read by pypdf.
+
+=========
+USAGE
+=========
+Format:
+metadata_test.py -o <output_folder_path>
+
+Options:
+-h, --help
+    Displays this help page.
+-o, --output <output_folder_path>
+    Specifies the folder to write the sample files to. Defaults to a new temporary folder.
+    Example:
+        C:/Users/John Doe/Desktop/Metadata Test
+
+Example:
+metadata_test.py -o C:/Users/John Doe/Desktop/Metadata Test
+
+Note:
+The script exits with 1 if any check fails.
+"""
+
+def run(output_folder_path, integrity, metadata):
+    failures = []
+
+    def check(name, condition):
+        print(f"[OK] {name}" if condition else f"[!!] {name}")
+        if not condition:
+            failures.append(name)
+
+    # Signed report card
+    print(f"[  ] Reading the metadata of a signed file…")
+    file_path = f"{output_folder_path}/Signed.pdf"
+    _blank_pdf(file_path)
+    integrity.finalize_pdf(file_path, {"/Title": "Yabushita Fu - Art - S1 AY2024/2025 Report Card", "/Revision": 1})
+
+    with open(file_path, "rb") as file:
+        data = file.read()
+    expected = dict(PdfReader(io.BytesIO(data)).metadata)
+    check("Stream metadata matches pypdf", dict(metadata.read_pdf_metadata(io.BytesIO(data))) == expected)
+    check("File metadata matches pypdf", dict(metadata.get_pdf_metadata(file_path)) == expected)
+    check("Serial number and hash are read", "/Serial Number" in expected and "/Hash" in expected)
+
+    # Incremental update: the newest trailer points to a new information dictionary
+    print(f"[  ] Reading the metadata of an updated file…")
+    updated = _append_info(data, b"<<\n/Title (Updated)\n/Serial#20Number (20250101\\055updated)\n>>")
+    expected = dict(PdfReader(io.BytesIO(updated)).metadata)
+    result = dict(metadata.read_pdf_metadata(io.BytesIO(updated)))
+    check("Updated metadata matches pypdf", result == expected)
+    check("Updated metadata is the newest revision", result.get("/Title") == "Updated" and result.get("/Serial Number") == "20250101-updated")
+
+    # Damaged trailer: read with pypdf instead
+    print(f"[  ] Reading the metadata of a damaged file…")
+    damaged = re.sub(rb"startxref\s+\d+", b"startxref\n999999", data)
+    result = metadata.read_pdf_metadata(io.BytesIO(damaged))
+    check("Damaged file falls back to pypdf", result is not None and result.get("/Hash") == dict(PdfReader(io.BytesIO(data)).metadata)["/Hash"])
+
+    print(f"[  ] Done. {len(failures)} check(s) failed.")
+    return len(failures)
+
+def _blank_pdf(file_path):
+    """Writes a one-page blank PDF file."""
+    writer = PdfWriter()
+    writer.add_blank_page(width = 595, height = 842)
+    with open(file_path, "wb") as file:
+        writer.write(file)
+
+def _append_info(data, info):
+    """Appends an incremental update with a new information dictionary to a PDF file."""
+    root = re.findall(rb"/Root\s+(\d+\s+\d+)\s+R", data)[-1]
+    size = int(re.findall(rb"/Size\s+(\d+)", data)[-1])
+    previous = int(re.findall(rb"startxref\s+(\d+)", data)[-1])
+
+    info_offset = len(data) + 1
+    update = b"\n" + f"{size} 0 obj\n".encode() + info + b"\nendobj\n"
+    xref_offset = len(data) + len(update)
+    update += f"xref\n0 1\n0000000000 65535 f \n{size} 1\n{info_offset:010d} 00000 n \n".encode()
+    update += f"trailer\n<<\n/Size {size + 1}\n/Root {root.decode()} R\n/Info {size} 0 R\n/Prev {previous}\n>>\nstartxref\n{xref_offset}\n%%EOF\n".encode()
+    return data + update
+
+def main(argv):
+    import components.common.integrity as integrity
+    import components.common.metadata as metadata
+
+    output_folder_path = ""
+
+    try:
+        opts, args = getopt.getopt(argv, "ho:", ["help", "output="])
+    except getopt.GetoptError:
+        print("Error! Invalid argument(s).")
+        print("metadata_test.py -o <output_folder_path> --help")
+        sys.exit(2)
+
+    for opt, arg in opts:
+        if opt in ("-h", "--help"):
+            print(help_text)
+            sys.exit()
+        elif opt in ("-o", "--output"):
+            output_folder_path = arg
+
+    if output_folder_path == "":
+        output_folder_path = tempfile.mkdtemp(prefix = "jars_metadata_test_")
+    os.makedirs(output_folder_path, exist_ok = True)
+
+    sys.exit(1 if run(output_folder_path, integrity, metadata) > 0 else 0)
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,228 @@
+import json
+
+from PIL import Image
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.lib.units import cm, mm
+from reportlab.lib.utils import ImageReader
+from reportlab.platypus import Image as PlatypusImage, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+from xml.sax.saxutils import escape
+
+import config
+from components.report_generator.report_card import PD_SCALE, ReportCard
+
+FONT = "Helvetica"
+FONT_BOLD = "Helvetica-Bold"
+TICK_FONT = "ZapfDingbats"
+TICK = "4" # ✔ in the ZapfDingbats encoding
+CELL_PADDING = 1
+
+class PDFRenderer:
+    """
+    Renders report cards straight to PDF without MS Word.
+
+    The layout follows the DOCX report card (same sections, column widths, and spacing) and is drawn with ReportLab,
+    so it runs headless and on any platform. The output is meant to be injected with metadata and signed like
+    a converted DOCX.
+
+    Attributes:
+        use_watermark (bool): Whether to add the watermark to the pages.
+
+    Methods:
+        render(self, report_card, target): Renders a report card into a PDF file.
+    """
+
+    def __init__(self, use_watermark = True):
+        """
+        Initialize the renderer instance. The page preset, logo, and watermark are loaded once and reused for every report.
+
+        Args:
+            use_watermark (bool): Whether to add the watermark to the pages.
+        """
+        self.use_watermark = use_watermark
+
+        with open(f"{config.get_config('page_presets')}/a4.json") as preset_file:
+            self.__page = json.load(preset_file)
+
+        self.__logo = ImageReader(config.get_config("logo_path"))
+        self.__watermark = _faded_image(config.get_config("watermark_path"), opacity = 0.1) if use_watermark else None
+
+        self.__styles = {
+            "normal": ParagraphStyle("normal", fontName = FONT, fontSize = 11, leading = 13.5),
+            "bold": ParagraphStyle("bold", fontName = FONT_BOLD, fontSize = 11, leading = 13.5),
+            "center": ParagraphStyle("center", fontName = FONT, fontSize = 11, leading = 13.5, alignment = TA_CENTER),
+            "bold_center": ParagraphStyle("bold_center", fontName = FONT_BOLD, fontSize = 11, leading = 13.5, alignment = TA_CENTER),
+            "justify": ParagraphStyle("justify", fontName = FONT, fontSize = 11, leading = 13.5, alignment = TA_JUSTIFY),
+            "legend": ParagraphStyle("legend", fontName = FONT, fontSize = 9, leading = 11, alignment = TA_CENTER),
+            "legend_bold": ParagraphStyle("legend_bold", fontName = FONT_BOLD, fontSize = 9, leading = 11, alignment = TA_CENTER),
+            "header": ParagraphStyle("header", fontName = FONT_BOLD, fontSize = 11, leading = 13.5, alignment = TA_LEFT)
+        }
+
+    def render(self, report_card: ReportCard, target):
+        """
+        Renders a report card into a PDF file.
+
+        Args:
+            report_card (ReportCard): The report card to render.
+            target (str | file): The path of the output file or a writable binary file object.
+        """
+        course_info = report_card.course_info
+        section_spacing = report_card.spacing["section"]
+        styles = self.__styles
+
+        document = SimpleDocTemplate(target,
+                                     pagesize = (self.__page["page_width"] * mm, self.__page["page_height"] * mm),
+                                     leftMargin = self.__page["margin_left"] * mm,
+                                     rightMargin = self.__page["margin_right"] * mm,
+                                     topMargin = self.__page["margin_top"] * mm + 2 * cm, # Room for the logo in the header
+                                     bottomMargin = self.__page["margin_bottom"] * mm,
+                                     title = report_card.metadata["title"],
+                                     author = report_card.metadata["author"],
+                                     subject = report_card.metadata["subject"],
+                                     keywords = report_card.metadata["keywords"],
+                                     creator = "JARS/CReP 1.0.0",
+                                     invariant = 1)
+
+        text = lambda value, style = "normal": Paragraph(escape(str(value)), styles[style])
+        story = []
+
+        # Course Information Section
+        story.append(self.__table([
+            [text("Student", "bold"), text(report_card.student_name), text("Semester", "bold"), text(course_info["Semester"], "center"), ""],
+            [text("Grade", "bold"), text(course_info["Grade"]), text("Subject", "bold"), text(course_info["Subject"], "center"), ""],
+            [text("School Year", "bold"), text(course_info["School Year"]), text("Assessment", "bold"), text(report_card.final_score, "center"), text(report_card.letter_grade, "center")]
+        ], [3 * cm, 8 * cm, 3 * cm, 1.5 * cm, 1.5 * cm], [("SPAN", (3, 0), (4, 0)), ("SPAN", (3, 1), (4, 1))]))
+
+        # Subject Description Section
+        story += self.__header("SUBJECT DESCRIPTION", report_card.spacing["subject_description"])
+        story.append(self.__table([[text(course_info["Subject Description"])]], [17 * cm], min_heights = [1.5 * cm]))
+
+        # Skills and Assessment Section
+        story += self.__header("SKILLS AND ASSESSMENT", section_spacing)
+        story.append(self.__table([[text(assessment), text(grade, "center")] for assessment, grade in report_card.sna.items()], [15 * cm, 2 * cm]))
+
+        # Personal Development Section
+        story += self.__header("PERSONAL DEVELOPMENT", section_spacing)
+        pd_rows = [[text(label, "bold_center") for label in ["Item"] + PD_SCALE]]
+        for item, pd_grade in report_card.pd.items():
+            pd_rows.append([text(item)] + [TICK if grade == pd_grade else "" for grade in range(1, len(PD_SCALE) + 1)])
+        story.append(self.__table(pd_rows, [12 * cm] + [1 * cm] * len(PD_SCALE),
+                                  [("FONT", (1, 1), (-1, -1), TICK_FONT, 11), ("ALIGN", (1, 1), (-1, -1), "CENTER")]))
+
+        # Teacher's Comments Section
+        story += self.__header("TEACHER'S COMMENTS", section_spacing)
+        story.append(self.__table([[text(report_card.comment, "justify")]], [17 * cm], min_heights = [2 * cm]))
+
+        # Acknowledgement Section
+        story += self.__header("ACKNOWLEDGEMENT", section_spacing)
+        signature = ""
+        if report_card.signature_path is not None:
+            signature_image = ImageReader(report_card.signature_path)
+            image_width, image_height = signature_image.getSize()
+            signature = PlatypusImage(report_card.signature_path, width = 1.5 * cm * image_width / image_height, height = 1.5 * cm)
+        date = [text("Date"), text(report_card.date.strftime("%B %d, %Y"))] if report_card.date is not None else text("Date")
+
+        story.append(self.__table([
+            [[text("Teacher:", "bold"), text(course_info["Teacher"])], text("Signature"), signature, date],
+            [text("Parent:", "bold"), text("Signature"), "", text("Date")]
+        ], [6.5 * cm, 2 * cm, 4.5 * cm, 4 * cm], [
+            ("SPAN", (1, 1), (2, 1)),
+            ("LINEAFTER", (1, 0), (1, 0), 0.5, colors.white), # Signature label and image share one box
+            ("LINEBEFORE", (2, 0), (2, 0), 0.5, colors.white),
+            ("BOX", (1, 0), (2, 0), 0.5, colors.black)
+        ], min_heights = [1.5 * cm, 1.5 * cm]))
+
+        # Legend Section
+        story += self.__header("GRADING SYSTEM", section_spacing)
+        legend = lambda value: text(value, "legend")
+        story.append(self.__table([
+            [text("Skills and Assessment", "legend_bold"), "", "", "", "", "", "", text("Personal Development", "legend_bold"), "", "", "", "", ""],
+            [legend("A"), legend("95-100"), legend("C"), legend("75-84"), legend("E"), legend("Below 40"), "",
+             legend("E"), legend("Excellent"), legend("G"), legend("Good"), legend("NI"), legend("Needs Improvement")],
+            [legend("B"), legend("85-94"), legend("D"), legend("40-74"), "", "", "",
+             legend("VG"), legend("Very Good"), legend("S"), legend("Satisfactory"), "", ""]
+        ], [0.8 * cm, 1.8 * cm, 0.8 * cm, 1.8 * cm, 0.8 * cm, 2 * cm, 0.2 * cm, 0.8 * cm, 1.8 * cm, 0.8 * cm, 2 * cm, 0.8 * cm, 2.2 * cm], [
+            ("SPAN", (0, 0), (5, 0)), ("SPAN", (7, 0), (12, 0)),
+            ("SPAN", (4, 1), (4, 2)), ("SPAN", (5, 1), (5, 2)), ("SPAN", (11, 1), (11, 2)), ("SPAN", (12, 1), (12, 2)),
+            ("LINEABOVE", (6, 0), (6, -1), 0.5, colors.white), ("LINEBELOW", (6, 0), (6, -1), 0.5, colors.white), # Spacer between two legends
+            ("LEFTPADDING", (0, 0), (-1, -1), 0), ("RIGHTPADDING", (0, 0), (-1, -1), 0),
+            ("VALIGN", (0, 0), (-1, -1), "MIDDLE")
+        ]))
+
+        document.build(story, onFirstPage = self.__draw_page, onLaterPages = self.__draw_page)
+
+    def __table(self, rows, widths, commands = None, min_heights = None):
+        """
+        Creates a bordered table.
+
+        Args:
+            rows (list): The table rows.
+            widths (list): The column widths in points.
+            commands (list): Extra table style commands.
+            min_heights (list): The minimum height of each row in points. The rows still grow to fit their content.
+
+        Returns:
+            Table: The table flowable.
+        """
+        heights = None
+        if min_heights is not None:
+            heights = [max(min_height, _row_height(row, widths)) for row, min_height in zip(rows, min_heights)]
+
+        table = Table(rows, colWidths = widths, rowHeights = heights, hAlign = "CENTER")
+        table.setStyle(TableStyle([
+            ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("TOPPADDING", (0, 0), (-1, -1), CELL_PADDING), # Word tables have no vertical cell margins
+            ("BOTTOMPADDING", (0, 0), (-1, -1), CELL_PADDING)
+        ] + (commands or [])))
+        return table
+
+    def __header(self, title, spacing):
+        """
+        Creates a section header.
+
+        Args:
+            title (str): The section title.
+            spacing (int): The space above the header in points.
+
+        Returns:
+            list: The header flowables.
+        """
+        return [Spacer(1, spacing), Paragraph(escape(title), self.__styles["header"])]
+
+    def __draw_page(self, canvas, document):
+        """Draws the header logo and the watermark of a page."""
+        page_width, page_height = document.pagesize
+
+        logo_width = 5.56 * cm
+        logo_height = logo_width * self.__logo.getSize()[1] / self.__logo.getSize()[0]
+        canvas.drawImage(self.__logo, (page_width - logo_width) / 2, page_height - self.__page["margin_top"] * mm - logo_height,
+                         width = logo_width, height = logo_height, mask = "auto")
+
+        if self.__watermark is not None:
+            canvas.drawImage(self.__watermark, (page_width - 600) / 2, (page_height - 600) / 2, width = 600, height = 600, mask = "auto")
+
+def _faded_image(path, opacity):
+    """
+    Loads an image and scales its transparency, since PDF viewers do not all honour the fill alpha for images.
+
+    Args:
+        path (str): The path to the image.
+        opacity (float): The opacity of the image (0 to 1).
+
+    Returns:
+        ImageReader: The faded image.
+    """
+    image = Image.open(path).convert("RGBA")
+    alpha = image.getchannel("A").point(lambda value: int(value * opacity))
+    image.putalpha(alpha)
+    return ImageReader(image)
+
+def _row_height(row, widths):
+    """Gets the height that the content of a table row needs, including the default cell padding."""
+    height = 0
+    for cell, width in zip(row, widths):
+        cells = cell if isinstance(cell, list) else [cell]
+        height = max(height, sum(item.wrap(width - 12, 10000)[1] for item in cells if hasattr(item, "wrap")) + 2 * CELL_PADDING)
+    return height
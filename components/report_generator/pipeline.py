@@ -0,0 +1,261 @@
+import queue
+import threading
+
+from termcolor import colored
+
+class PipelineJob:
+    """
+    A unit of work flowing through the pipeline.
+
+    Attributes:
+        index (int): The position of the job in the pipeline input.
+        key (str): The identifier of the job (e.g. the student name).
+        payload (object): The data passed from one stage to the next.
+        results (dict): Extra values recorded by the stages (e.g. output paths).
+        error (Exception): The error raised by a stage. None if the job succeeded.
+        failed_stage (str): The name of the stage that raised the error.
+        cancelled (bool): Whether the job was cancelled before it passed every stage.
+    """
+
+    def __init__(self, index, key):
+        """
+        Initialize the pipeline job instance.
+
+        Args:
+            index (int): The position of the job in the pipeline input.
+            key (str): The identifier of the job.
+        """
+        self.index = index
+        self.key = key
+        self.payload = None
+        self.results = {}
+        self.error = None
+        self.failed_stage = None
+        self.cancelled = False
+
+    @property
+    def failed(self):
+        """
+        Whether the job has failed in one of the stages.
+
+        Returns:
+            bool: True if the job has failed, False otherwise.
+        """
+        return self.error is not None
+
+class JobControl:
+    """
+    Lets another thread (e.g. the GUI or a console prompt) pause, resume, or cancel a running pipeline.
+
+    The control is cooperative: the pipeline only checks it between stages, so a stage that has started
+    always finishes and never leaves a half-written file behind.
+
+    Methods:
+        pause(self): Pauses the job after the stages that are currently running.
+        resume(self): Resumes a paused job.
+        cancel(self): Cancels the jobs that have not been processed yet.
+        wait(self): Blocks while the job is paused.
+    """
+
+    def __init__(self):
+        """Initialize the job control instance. The job starts running."""
+        self.__running = threading.Event()
+        self.__running.set()
+        self.__cancelled = threading.Event()
+
+    @property
+    def paused(self):
+        """
+        Whether the job is paused.
+
+        Returns:
+            bool: True if the job is paused, False otherwise.
+        """
+        return not self.__running.is_set()
+
+    @property
+    def cancelled(self):
+        """
+        Whether the job has been cancelled.
+
+        Returns:
+            bool: True if the job has been cancelled, False otherwise.
+        """
+        return self.__cancelled.is_set()
+
+    def pause(self):
+        """Pauses the job. Stages that are running finish first."""
+        if not self.cancelled:
+            self.__running.clear()
+
+    def resume(self):
+        """Resumes a paused job."""
+        self.__running.set()
+
+    def cancel(self):
+        """Cancels the job. A paused job is resumed so that it can wind down."""
+        self.__cancelled.set()
+        self.__running.set()
+
+    def wait(self):
+        """
+        Blocks while the job is paused.
+
+        Returns:
+            bool: True if the job should go on, False if it has been cancelled.
+        """
+        self.__running.wait()
+        return not self.cancelled
+
+class Stage:
+    """
+    A pipeline stage. Each stage has its own pool of worker threads and a bounded input queue.
+
+    Attributes:
+        name (str): The name of the stage.
+        function (function): The function to be called for each job. Takes the PipelineJob as its only argument.
+        workers (int): The number of worker threads of the stage.
+        queue_size (int): The maximum number of jobs waiting in front of the stage.
+        on_start (function): Called once by each worker thread before it processes any job. Its return value is passed to on_stop.
+        on_stop (function): Called once by each worker thread after it has processed its last job.
+    """
+
+    def __init__(self, name, function, workers = 1, queue_size = 4, on_start = None, on_stop = None):
+        """
+        Initialize the stage instance.
+
+        Args:
+            Follows the class attributes.
+        """
+        self.name = name
+        self.function = function
+        self.workers = max(1, workers)
+        self.queue_size = queue_size
+        self.on_start = on_start
+        self.on_stop = on_stop
+
+class Pipeline:
+    """
+    Runs jobs through a sequence of stages concurrently.
+
+    Every stage runs on its own worker pool and is connected to the next stage with a bounded queue,
+    so a slow stage applies back-pressure to the stages in front of it instead of piling up work in memory.
+    A job that fails in a stage is passed through the remaining stages untouched so that the other jobs are not affected.
+    Cancelled jobs are passed through the same way, so every job still reaches the callback.
+
+    Attributes:
+        stages (list): The list of Stage instances in processing order.
+        callback (function): Called after each job leaves the last stage. Takes the job, the number of finished jobs, and the total number of jobs.
+        control (JobControl): The control to pause, resume, or cancel the run with. Checked before every stage of every job.
+    """
+
+    def __init__(self, stages, callback = None, control: JobControl = None):
+        """
+        Initialize the pipeline instance.
+
+        Args:
+            Follows the class attributes.
+        """
+        self.stages = stages
+        self.callback = callback
+        self.control = control
+
+        self.__lock = threading.Lock()
+        self.__finished = []
+        self.__total = 0
+
+    def run(self, keys):
+        """
+        Runs the given keys through the pipeline and waits until every job has passed the last stage.
+
+        Args:
+            keys (list): The identifiers of the jobs to run (e.g. student names).
+
+        Returns:
+            list: The list of PipelineJob instances in input order.
+        """
+        self.__finished = []
+        self.__total = len(keys)
+        queues = [queue.Queue(maxsize = stage.queue_size) for stage in self.stages]
+
+        workers = []
+        for index, stage in enumerate(self.stages):
+            threads = [threading.Thread(target = self.__work, args = (index, queues), name = f"{stage.name}-{i}", daemon = True)
+                       for i in range(stage.workers)]
+            for thread in threads:
+                thread.start()
+            workers.append(threads)
+
+        for index, key in enumerate(keys):
+            queues[0].put(PipelineJob(index, key))
+
+        # Close each stage once the stage in front of it has drained
+        for index, stage in enumerate(self.stages):
+            for _ in range(stage.workers):
+                queues[index].put(None)
+            for thread in workers[index]:
+                thread.join()
+
+        return sorted(self.__finished, key = lambda job: job.index)
+
+    def __work(self, index, queues):
+        """
+        The worker loop of a stage. Takes jobs from the stage queue until it receives the stop signal (None).
+
+        Args:
+            index (int): The index of the stage.
+            queues (list): The queues in front of each stage.
+        """
+        stage = self.stages[index]
+        inbox = queues[index]
+        outbox = queues[index + 1] if index + 1 < len(self.stages) else None
+
+        context = None
+        startup_error = None
+        try:
+            if stage.on_start is not None:
+                context = stage.on_start()
+        except Exception as e:
+            startup_error = e
+            print(colored(f"(!) Error: Unable to start a worker for the {stage.name} stage. Details: {e}", "red"))
+
+        while True:
+            job = inbox.get()
+            if job is None:
+                break
+
+            if not job.failed and not job.cancelled and self.control is not None and not self.control.wait():
+                job.cancelled = True
+
+            if not job.failed and not job.cancelled:
+                try:
+                    if startup_error is not None:
+                        raise startup_error
+                    stage.function(job)
+                except Exception as e:
+                    job.error = e
+                    job.failed_stage = stage.name
+                    print(colored(f"(!) Error: {job.key} failed at the {stage.name} stage. Details: {e}", "red"))
+
+            if outbox is not None:
+                outbox.put(job)
+            else:
+                self.__finish(job)
+
+        if stage.on_stop is not None and startup_error is None:
+            try:
+                stage.on_stop(context)
+            except Exception as e:
+                print(colored(f"(!) Error: Unable to stop a worker for the {stage.name} stage cleanly. Details: {e}", "red"))
+
+    def __finish(self, job):
+        """
+        Records a job that has left the last stage and reports the progress.
+
+        Args:
+            job (PipelineJob): The finished job.
+        """
+        with self.__lock:
+            self.__finished.append(job)
+            if self.callback is not None:
+                self.callback(job, len(self.__finished), self.__total)
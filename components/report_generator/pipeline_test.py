@@ -0,0 +1,125 @@
+# TEST
+import getopt
+import random
+import sys
+import threading
+import time
+
+help_text = """
+HELP PAGE
+=========
+This script runs sample jobs through the report generation pipeline and checks that every job comes out in input order,
+that each stage sees every job in turn, and that a job that fails in one stage skips the remaining stages
+without affecting the other jobs.
+
+=========
+USAGE
+=========
+Format:
+pipeline_test.py --help
+
+Options:
+-h, --help
+    Displays this help page.
+
+Example:
+pipeline_test.py
+
+Note:
+The script exits with 1 if any check fails.
+"""
+
+def run(pipeline):
+    failures = []
+
+    def check(name, condition):
+        print(f"[OK] {name}" if condition else f"[!!] {name}")
+        if not condition:
+            failures.append(name)
+
+    keys = [f"Student {i}" for i in range(40)]
+
+    # Ordering: stages with several workers and random delays still return the jobs in input order
+    print("[  ] Checking job ordering…")
+    lock = threading.Lock()
+    seen = {"first": [], "second": [], "third": []}
+
+    def step(name):
+        def function(job):
+            time.sleep(random.random() / 200)
+            with lock:
+                seen[name].append(job.key)
+            job.payload = (job.payload or []) + [name]
+        return function
+
+    finished = []
+    jobs = pipeline.Pipeline([pipeline.Stage("first", step("first"), workers = 4),
+                              pipeline.Stage("second", step("second"), workers = 3, queue_size = 2),
+                              pipeline.Stage("third", step("third"), workers = 2)],
+                             callback = lambda job, current, total: finished.append((current, total))).run(keys)
+
+    check("Every job is returned", len(jobs) == len(keys))
+    check("Jobs are returned in input order", [job.key for job in jobs] == keys and [job.index for job in jobs] == list(range(len(keys))))
+    check("Every stage processes every job once", all(sorted(names) == sorted(keys) for names in seen.values()))
+    check("Every job passes the stages in order", all(job.payload == ["first", "second", "third"] for job in jobs))
+    check("The callback counts every finished job", [current for current, total in finished] == list(range(1, len(keys) + 1))
+          and all(total == len(keys) for current, total in finished))
+
+    # Failure pass-through: a failed job skips the later stages, and the other jobs are not affected
+    print("[  ] Checking failure pass-through…")
+    later = []
+
+    def fail_some(job):
+        if job.index % 5 == 0:
+            raise ValueError(f"{job.key} is broken")
+        job.payload = "rendered"
+
+    def record_later(job):
+        with lock:
+            later.append(job.key)
+
+    jobs = pipeline.Pipeline([pipeline.Stage("rendering", fail_some, workers = 3),
+                              pipeline.Stage("signing", record_later, workers = 2)]).run(keys)
+
+    failed = [job for job in jobs if job.failed]
+    check("Failed jobs are returned with the others", len(jobs) == len(keys))
+    check("Only the broken jobs fail", [job.index for job in failed] == list(range(0, len(keys), 5)))
+    check("Failed jobs record their stage and error", all(job.failed_stage == "rendering" and isinstance(job.error, ValueError) for job in failed))
+    check("Failed jobs skip the later stages", sorted(later) == sorted(job.key for job in jobs if not job.failed))
+    check("The other jobs finish", all(job.payload == "rendered" for job in jobs if not job.failed))
+
+    # A stage whose worker cannot start fails its jobs instead of stopping the pipeline
+    print("[  ] Checking a stage that cannot start…")
+    stopped = []
+
+    def broken_start():
+        raise RuntimeError("no converter")
+
+    jobs = pipeline.Pipeline([pipeline.Stage("rendering", lambda job: None, workers = 2),
+                              pipeline.Stage("conversion", lambda job: None, on_start = broken_start, on_stop = stopped.append)]).run(keys[:5])
+
+    check("Every job fails at the stage that cannot start", all(job.failed_stage == "conversion" and isinstance(job.error, RuntimeError) for job in jobs))
+    check("A worker that did not start is not stopped", len(stopped) == 0)
+
+    print(f"[  ] Done. {len(failures)} check(s) failed.")
+    return len(failures)
+
+def main(argv):
+    import components.report_generator.pipeline as pipeline
+
+    try:
+        opts, args = getopt.getopt(argv, "h", ["help"])
+    except getopt.GetoptError:
+        print("Error! Invalid argument(s).")
+        print("pipeline_test.py --help")
+        sys.exit(2)
+
+    for opt, arg in opts:
+        if opt in ("-h", "--help"):
+            print(help_text)
+            sys.exit()
+
+    sys.exit(1 if run(pipeline) > 0 else 0)
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
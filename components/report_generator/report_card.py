@@ -0,0 +1,268 @@
+import datetime
+import json
+
+import components.report_generator.comment_generator as cgen
+from components.common.grader_report import GraderReport
+
+COURSE_INFO_ITEMS = ["Subject", "Grade", "School Year", "Semester", "Subject Description", "Teacher"]
+PD_SCALE = ["NI", "S", "G", "VG", "E"]
+
+class ReportCard:
+    """
+    Intermediate representation of a student's semester report card.
+
+    A report card holds every value that a renderer needs to produce the final document.
+    It is computed from the grader report without touching python-docx so that the data can be
+    previewed, diffed, and benchmarked separately from the rendering stage.
+
+    Attributes:
+        student_name (str): The student's full name.
+        short_name (str): The student's short name.
+        gender (str): The student's gender.
+        course_info (dict): The course information items (Subject, Grade, School Year, Semester, Subject Description, Teacher).
+        final_score (str): The student's final score.
+        letter_grade (str): The student's letter grade.
+        sna (dict): The skills and assessment grades keyed by assessment, in grader report order.
+        pd (dict): The personal development grades (1 to 5) keyed by item, in grader report order.
+        spacing (dict): The spacing profile in points. Contains the "section" and "subject_description" keys.
+        comment (str): The teacher's comment. None until the comment is generated.
+        metadata (dict): The document metadata (title, subject, category, etc.).
+        date (datetime): The date for the report.
+        signature_path (str): The path to the signature image.
+    """
+
+    def __init__(self, student_name, short_name, gender, course_info, final_score, letter_grade,
+                 sna, pd, spacing, metadata, comment = None, date = None, signature_path = None):
+        """
+        Initialize the report card instance.
+
+        Args:
+            Follows the class attributes.
+        """
+        self.student_name = student_name
+        self.short_name = short_name
+        self.gender = gender
+        self.course_info = course_info
+        self.final_score = final_score
+        self.letter_grade = letter_grade
+        self.sna = sna
+        self.pd = pd
+        self.spacing = spacing
+        self.metadata = metadata
+        self.comment = comment
+        self.date = date
+        self.signature_path = signature_path
+
+    def to_dict(self):
+        """
+        Converts the report card into a JSON serializable dictionary.
+
+        Returns:
+            dict: The report card data.
+        """
+        return {
+            "student_name": self.student_name,
+            "short_name": self.short_name,
+            "gender": self.gender,
+            "course_info": self.course_info,
+            "final_score": self.final_score,
+            "letter_grade": self.letter_grade,
+            "sna": self.sna,
+            "pd": {item: PD_SCALE[grade - 1] for item, grade in self.pd.items()},
+            "spacing": self.spacing,
+            "comment": self.comment,
+            "metadata": self.metadata,
+            "date": self.date.strftime("%Y-%m-%d") if self.date is not None else None,
+            "signature_path": self.signature_path
+        }
+
+    def __repr__(self):
+        """
+        Returns a string representation of the object.
+
+        Returns:
+            str: A string representation of the object.
+        """
+        return f"ReportCard({self.student_name})"
+
+def spacing_profile(count_sna):
+    """
+    Gets the spacing profile for a report card. The more SNA items a report has, the tighter the spacing
+    so that the report card still fits in a single page.
+
+    Args:
+        count_sna (int): The number of SNA items in the report.
+
+    Returns:
+        dict: The spacing (in points) between sections and before the subject description.
+    """
+    section_spacing = 18
+    subject_description_spacing = 12
+
+    if count_sna > 6:
+        section_spacing = 12
+    if count_sna > 8:
+        section_spacing = 10
+    if count_sna > 9:
+        subject_description_spacing = 8
+        section_spacing = 8
+
+    return {"section": section_spacing, "subject_description": subject_description_spacing}
+
+def export_plan(report_cards, file_path):
+    """
+    Exports a list of report cards into a JSON file. Useful for previewing and diffing comments without rendering.
+
+    Args:
+        report_cards (list): The list of ReportCard instances.
+        file_path (str): The path of the output JSON file.
+    """
+    with open(file_path, "w", encoding = "utf-8") as json_file:
+        json.dump([report_card.to_dict() for report_card in report_cards], json_file, indent = 4, ensure_ascii = False)
+
+class ReportCardBuilder:
+    """
+    Builds ReportCard instances from a grader report.
+
+    The builder is the data stage of the report generator. It prepares the data and generates the comments
+    but does not render anything. Renderers take the resulting ReportCard instances as their input.
+
+    Attributes:
+        grader_report (GraderReport): The grader report instance.
+        cgen_mode (str): The comment generation mode. Can be "map" or "ai".
+        manifest (Manifest): The manifest instance for AI mode logging.
+        date (datetime): The date for the report.
+        signature_path (str): The path to the signature image.
+    """
+
+    def __init__(self, grader_report: GraderReport, cgen_mode = "map", manifest = None, date: datetime = None, signature_path = None):
+        """
+        Initialize the builder instance.
+
+        Args:
+            Follows the class attributes.
+        """
+        self.grader_report = grader_report
+        self.cgen_mode = cgen_mode
+        self.manifest = manifest
+        self.date = date
+        self.signature_path = signature_path
+
+    def prepare(self, student_name):
+        """
+        Prepares the report card data for a student without generating the comment.
+
+        Args:
+            student_name (str): The name of the student.
+
+        Returns:
+            ReportCard: The report card with no comment.
+        """
+        course_info = {item: self.grader_report.get_course_info(item) for item in COURSE_INFO_ITEMS}
+        course_title = f"{course_info['Subject']} - S{course_info['Semester']} AY{course_info['School Year']} Report Card"
+
+        sna = {}
+        for assessment in self.grader_report.data_sna.columns:
+            sna[assessment] = str(self.grader_report.get_grade_sna(student_name, assessment))
+
+        pd = {}
+        for item in self.grader_report.data_pd.columns:
+            pd[item] = int(self.grader_report.get_grade_pd(student_name, item))
+
+        metadata = {
+            "author": "JAC Academic Reporting System",
+            "title": f"{student_name} - {course_title}",
+            "subject": course_title,
+            "category": "Semester Report Card",
+            "revised": 1,
+            "version": "1.0.0",
+            "keywords": "JAC; JARS; Report Card; Semester Report Card",
+            "language": "en-GB",
+            "content_status": "Final"
+        }
+
+        return ReportCard(student_name = student_name,
+                          short_name = self.grader_report.get_student_info(student_name, "Short Name"),
+                          gender = self.grader_report.get_student_info(student_name, "Gender"),
+                          course_info = course_info,
+                          final_score = str(self.grader_report.get_final_grade(student_name, "Final Score")),
+                          letter_grade = str(self.grader_report.get_final_grade(student_name, "Letter Grade")),
+                          sna = sna,
+                          pd = pd,
+                          spacing = spacing_profile(self.grader_report.count_sna()),
+                          metadata = metadata,
+                          date = self.date,
+                          signature_path = self.signature_path)
+
+    def write_comment(self, report_card: ReportCard, autocorrect = True):
+        """
+        Generates the teacher's comment for a prepared report card.
+
+        Args:
+            report_card (ReportCard): The prepared report card.
+            autocorrect (bool): Whether to autocorrect the generated comments or not.
+
+        Returns:
+            ReportCard: The same report card with the comment filled in.
+        """
+        if self.cgen_mode == "map":
+            comment_generator = cgen.CommentGenerator(student_name = report_card.student_name,
+                                                      short_name = report_card.short_name,
+                                                      gender = report_card.gender,
+                                                      comment_mapping = self.grader_report.comment_mapping_index,
+                                                      student_result = report_card.sna,
+                                                      letter_grade = report_card.letter_grade,
+                                                     )
+            report_card.comment = comment_generator.generate_comment(autocorrect = autocorrect)
+        elif self.cgen_mode == "ai":
+            comment_generator = cgen.AICommentGenerator(self.manifest)
+            report_card.comment = comment_generator.generate_comment(nickname = report_card.short_name,
+                                                                     gender = report_card.gender,
+                                                                     final_grade = report_card.letter_grade,
+                                                                     sna_list = report_card.sna,
+                                                                     verbose = True
+                                                                    )
+
+        return report_card
+
+    def build(self, student_name, autocorrect = True):
+        """
+        Builds the complete report card (data and comment) for a student.
+
+        Args:
+            student_name (str): The name of the student.
+            autocorrect (bool): Whether to autocorrect the generated comments or not.
+
+        Returns:
+            ReportCard: The complete report card.
+        """
+        return self.write_comment(self.prepare(student_name), autocorrect = autocorrect)
+
+    def build_all(self, autocorrect = True, callback = None, force = False):
+        """
+        Builds the report cards for all students in the grader report without rendering them.
+
+        Args:
+            autocorrect (bool): Whether to autocorrect the generated comments or not.
+            callback (function): The callback function to be called after each student is processed.
+            force (bool): Whether to force the process or not. This will ignore the data validation errors.
+
+        Returns:
+            list: The list of ReportCard instances. Empty if the grader report is invalid and force is False.
+        """
+        if not self.grader_report.data_valid and not force:
+            print(f"[  ] Grader report incomplete. Aborting process...")
+            return []
+
+        report_cards = []
+        job_count = self.grader_report.count_students()
+
+        for i, student in enumerate(self.grader_report.students.index):
+            if callback is not None:
+                callback(i, job_count, f"Planning report for {student}…")
+            report_cards.append(self.build(student, autocorrect = autocorrect))
+
+        if callback is not None:
+            callback(job_count, job_count, f"Planned {job_count} reports.")
+
+        return report_cards
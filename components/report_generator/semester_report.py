@@ -1,10 +1,16 @@
 import datetime
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor
 
 from docx import Document
 from docx.shared import Cm, Pt
-from docx.enum.table import WD_ALIGN_VERTICAL, WD_TABLE_ALIGNMENT
-from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
+from docx.enum.table import WD_TABLE_ALIGNMENT
 
 import docx2pdf
 
@@ -12,9 +18,17 @@ import config
 import components.common.integrity as integrity
 import components.common.metadata as metadata
 import components.report_generator.document as document_helper
-import components.report_generator.comment_generator as cgen
 import components.report_generator.manifest as manifest
+from components.common.batch_manifest import BatchManifest
 from components.common.grader_report import GraderReport
+from components.common.ledger import SigningLedger
+from components.common.profiler import Profiler, format_duration
+from components.report_generator.archive import ReportArchive, archive_name, manifest_name
+from components.report_generator.html_renderer import HTMLRenderer
+from components.report_generator.libreoffice_pool import LibreOfficePool
+from components.report_generator.pdf_renderer import PDFRenderer
+from components.report_generator.pipeline import JobControl, Pipeline, Stage
+from components.report_generator.report_card import PD_SCALE, ReportCard, ReportCardBuilder
 
 class Generator:
     """
@@ -28,7 +42,11 @@ class Generator:
                  date: datetime = None, 
                  signature_path = None, 
                  cgen_mode = "map", 
-                 use_watermark = True):
+                 use_watermark = True,
+                 profiler: Profiler = None,
+                 pdf_backend = "word",
+                 ledger: SigningLedger = None,
+                 manifest_key = None):
         """
         Initialize the generator instance.
 
@@ -39,6 +57,11 @@ class Generator:
             signature_path (str): The path to the signature image.
             cgen_mode (str): The comment generation mode. Can be "map" or "ai".
             use_watermark (bool): Whether to use a watermark in the generated reports.
+            profiler (Profiler): The profiler to record the timing spans with. A new profiler is created if not given.
+            pdf_backend (str): How PDF copies are created. "word" converts the DOCX file with MS Word, "libreoffice" converts it with a pool of
+                headless LibreOffice instances, and "native" renders the PDF directly without an office suite.
+            ledger (SigningLedger): The ledger to record every signed PDF in. Nothing is recorded if not given.
+            manifest_key (bytes): The key to sign the batch manifest with (see batch_manifest.configured_key). Without a key the manifest only gets a checksum.
 
         Returns:
             Generator: The report initialized generator instance.
@@ -55,71 +78,283 @@ class Generator:
         self.signature_path = signature_path
         self.cgen_mode = cgen_mode
         self.use_watermark = use_watermark
+        self.profiler = profiler if profiler is not None else Profiler()
+        self.pdf_backend = pdf_backend
+        self.ledger = ledger
+        self.manifest_key = manifest_key
         if self.cgen_mode == "ai":
             self.manifest = manifest.Manifest(f"{self.output_path}/Manifest {init_time}.xlsx")
 
+        self.builder = ReportCardBuilder(grader_report = self.grader_report,
+                                         cgen_mode = self.cgen_mode,
+                                         manifest = self.manifest if self.cgen_mode == "ai" else None,
+                                         date = self.date,
+                                         signature_path = self.signature_path)
+
+        self.__request_lock = threading.Lock()
+        self.__next_request_time = 0
+
         print("[OK] Report generator initialized!")
 
-    def generate_all(self, autocorrect = True, callback = None, force = False, convert_to_pdf = False, delay = False):
+    def generate_all(self, autocorrect = True, callback = None, force = False, convert_to_pdf = False, delay = False, comment_workers = 4, archive = False, control: JobControl = None, finalize_workers = None, optimize_pdf = False):
         """
         Generates reports for all students in the grader report.
-        This function basically calls generate_for_student() for each student in the grader report.
+
+        The students are run through a staged pipeline: data preparation, comment generation, DOCX rendering,
+        PDF conversion, and metadata injection plus signing. Each stage has its own worker pool and a bounded queue
+        in front of it, so network-bound comment generation (AI mode) overlaps with rendering and Word-bound conversion.
         
         Args:
             autocorrect (bool): Whether to autocorrect the generated comments or not.
             callback (function): The callback function to be called after each student is processed.
             force (bool): Whether to force the generation process or not. This will ignore the data validation errors.
+            convert_to_pdf (bool): Whether to create a signed PDF copy of each report or not.
+            delay (bool): Whether to space out AI requests by at least 4 seconds to avoid rate limiting or not.
+            comment_workers (int): The number of concurrent AI comment requests. Ignored in map mode and when delay is enabled.
+            archive (bool): Whether to collect the reports into a single zip archive in the output folder instead of writing them one by one.
+                The documents are saved in memory, and PDF conversion and signing are done in a local temporary folder.
+            control (JobControl): The control to pause, resume, or cancel the job from another thread. Students that are being processed
+                finish their current stage first, and the reports completed so far (and the AI manifest) are kept.
+            finalize_workers (int): The number of worker processes that inject the metadata into and sign the PDF files. Defaults to the number of CPU cores (up to 8).
+            optimize_pdf (bool): Whether to shrink the PDF files (recompressed content, shared images) before signing them or not.
+
+        Returns:
+            list: The list of PipelineJob instances, one for each student.
         """
-        job_count = len(self.grader_report.students.index)
+        if not self.grader_report.data_valid and not force:
+            print(f"[  ] Grader report incomplete. Aborting process...")
+            return []
+
+        students = list(self.grader_report.students.index)
+        job_count = len(students)
+        self.__next_request_time = 0
+
+        # The PDF backends and worker pools are started before the archive and the temporary folder are created,
+        # so that a backend that cannot start (e.g. LibreOffice is not installed) does not leave them behind
+        pdf_renderer = None
+        libreoffice_pool = None
+        finalize_pool = None
+        if convert_to_pdf and self.pdf_backend == "native":
+            pdf_renderer = PDFRenderer(use_watermark = self.use_watermark)
+        elif convert_to_pdf and self.pdf_backend == "libreoffice":
+            libreoffice_pool = LibreOfficePool(instances = max(1, min(job_count, os.cpu_count() or 1, 8)))
+            libreoffice_pool.start()
+
+        if convert_to_pdf:
+            # At least one worker, since a class without students would otherwise ask for an empty pool
+            finalize_workers = finalize_workers or max(1, min(job_count, os.cpu_count() or 1, 8))
+            try:
+                # Finalization is CPU-bound pypdf work, so it runs in worker processes instead of threads
+                finalize_pool = ProcessPoolExecutor(max_workers = finalize_workers)
+            except Exception:
+                if libreoffice_pool is not None:
+                    libreoffice_pool.close()
+                raise
+
+        # In archive mode, intermediate files only ever touch a local temporary folder
+        report_archive = None
+        work_path = self.output_path
+        if archive:
+            report_archive = ReportArchive(f"{self.output_path}/{archive_name(self.grader_report)}")
+            if convert_to_pdf:
+                work_path = tempfile.mkdtemp(prefix = "jars-")
         
-        job_start = datetime.datetime.now()
-        print(f"[  ] Job started at {job_start.strftime('%Y-%m-%d %H:%M:%S')}. Generating reports for {job_count} students…")
-        for i, student in enumerate(self.grader_report.students.index):
-            status_message = f"Generating report for {student}…"
-            print("\n========================")
-            print(status_message)
-            print("========================")
+        stages = [
+            Stage("preparation", lambda job: self.__prepare_stage(job)),
+            Stage("comment", lambda job: self.__comment_stage(job, autocorrect, delay),
+                  workers = comment_workers if self.cgen_mode == "ai" and not delay else 1),
+            Stage("rendering", lambda job: self.__render_stage(job, work_path, report_archive, convert_to_pdf))
+        ]
+
+        if pdf_renderer is not None:
+            stages.append(Stage("conversion", lambda job: self.__native_convert_stage(job, work_path, pdf_renderer)))
+        elif libreoffice_pool is not None:
+            stages.append(Stage("conversion", lambda job: self.__convert_stage(job, work_path, libreoffice_pool.convert),
+                                workers = libreoffice_pool.instances, queue_size = libreoffice_pool.instances * 2))
+        elif convert_to_pdf:
+            stages.append(Stage("conversion", lambda job: self.__convert_stage(job, work_path, lambda docx_path, pdf_path: docx2pdf.convert(docx_path, pdf_path, keep_active = True)),
+                                on_start = self.__open_word_session, on_stop = lambda session: session.close()))
+
+        batch_manifest = None
+        if convert_to_pdf:
+            batch_manifest = BatchManifest(key = self.manifest_key)
+            stages.append(Stage("signing", lambda job: self.__sign_stage(job, report_archive, finalize_pool, optimize_pdf, batch_manifest), workers = finalize_workers))
+
+        job_start = self.profiler.elapsed()
+
+        def on_job_finished(job, done, total):
+            if job.failed:
+                status_message = f"Error: Report for {job.key} failed at the {job.failed_stage} stage. Details: {job.error}"
+            elif job.cancelled:
+                status_message = f"Report for {job.key} cancelled."
+            else:
+                status_message = f"Report for {job.key} generated."
+            eta = self.profiler.eta(done, total, since = job_start)
+            print(f"[{'!!' if job.failed or job.cancelled else 'OK'}] {status_message}")
+            print(f"Progress: {round(done / total * 100, 2)}% | ETA: {format_duration(eta)}")
             if callback is not None:
-                callback(i, job_count, status_message)
-            
-            start_time = datetime.datetime.now()
-            self.generate_for_student(student_name = student, autocorrect = autocorrect, force = force)
-            end_time = datetime.datetime.now()
-            
-            processing_time = end_time - start_time
-            print(f"[OK] Report for {student} generated in {processing_time.total_seconds()} seconds.")
-            print(f"Progress: {round(i / job_count * 100, 2)}%")
-
-            if processing_time.total_seconds() < 4 and i < job_count - 1 and delay:
-                wait_time = 4 - processing_time.total_seconds()
-                print(f"[-'] Waiting for {wait_time} seconds before processing next student to avoid rate limiting…")
-                time.sleep(wait_time)
+                callback(done, total, f"{status_message} (ETA: {format_duration(eta)})" if done < total else status_message)
         
+        print(f"[  ] Job started at {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}. Generating reports for {job_count} students…")
         if callback is not None:
-            callback(job_count, job_count, "")
+            callback(0, job_count, f"Generating reports for {job_count} students…")
+
+        with self.profiler.span("job"):
+            try:
+                jobs = Pipeline(stages, callback = on_job_finished, control = control).run(students)
+            finally:
+                if libreoffice_pool is not None:
+                    libreoffice_pool.close()
+                if finalize_pool is not None:
+                    finalize_pool.shutdown(cancel_futures = True)
+
+                if archive:
+                    if batch_manifest is not None and len(batch_manifest.names()) > 0:
+                        report_archive.add(manifest_name(self.grader_report), json.dumps(batch_manifest.to_dict(), indent = 4, ensure_ascii = False).encode("utf-8"))
+                    report_archive.close()
+                    if work_path != self.output_path:
+                        shutil.rmtree(work_path, ignore_errors = True)
+
+                if self.cgen_mode == "ai":
+                    with self.profiler.span("manifest"):
+                        self.manifest.save()
+
+        # Each class gets its own manifest, and a batch without any PDF file gets none
+        if batch_manifest is not None and len(batch_manifest.names()) > 0:
+            if not archive:
+                batch_manifest.save(f"{self.output_path}/{manifest_name(self.grader_report)}")
+            if batch_manifest.key is not None:
+                print(f"[OK] Batch manifest of {len(batch_manifest.names())} PDF file(s) signed. Root: {batch_manifest.root()[:16]}…")
+            else:
+                print(f"[OK] Batch manifest of {len(batch_manifest.names())} PDF file(s) saved with a checksum only (no batch manifest key configured). Root: {batch_manifest.root()[:16]}…")
+        elif batch_manifest is not None:
+            print(f"[!!] No PDF file was signed, so no batch manifest was saved.")
+        if archive:
+            print(f"[OK] {len(report_archive.names)} file(s) saved in {report_archive.file_path}")
             
         job_end = datetime.datetime.now()
-        time_taken = job_end - job_start
-        time_taken_formatted = f"{time_taken.seconds // 60} minutes {time_taken.seconds % 60} seconds"
+        time_taken_formatted = format_duration(self.profiler.elapsed() - job_start)
+        failed_count = len([job for job in jobs if job.failed])
+        cancelled_count = len([job for job in jobs if job.cancelled])
         print(f"Progress: 100%")
         print(f"[OK] Job completed at {job_end.strftime('%Y-%m-%d %H:%M:%S')}. Time taken: {time_taken_formatted}")
-        callback(job_count, job_count, f"Job completed at {job_end.strftime('%Y-%m-%d %H:%M:%S')}. Time taken: {time_taken_formatted}")
+        self.profiler.report()
+        if failed_count > 0:
+            print(f"[!!] {failed_count} of {job_count} reports failed. Check the errors above for details.")
+        if cancelled_count > 0:
+            print(f"[!!] Job cancelled. {cancelled_count} of {job_count} reports were not generated.")
+        if callback is not None:
+            callback(job_count, job_count, f"Job completed at {job_end.strftime('%Y-%m-%d %H:%M:%S')}. Time taken: {time_taken_formatted}")
+            if failed_count > 0:
+                callback(job_count, job_count, f"Warning: {failed_count} of {job_count} reports failed. Check console/terminal for details.")
+            if cancelled_count > 0:
+                callback(job_count, job_count, f"Warning: Job cancelled. {cancelled_count} of {job_count} reports were not generated.")
 
-        if convert_to_pdf:
-            docx2pdf.convert(self.output_path)
-            for student in self.grader_report.students.index:
-                if callback is not None:
-                    callback(i, job_count, f"Creating PDF copy for {student}'s report…")
-                print(f"[  ] Creating PDF copy for {student}'s report…")
-
-                metadata.pdf_inject(f"{self.output_path}/{student}.pdf", student, self.grader_report)
-                integrity.sign_pdf(f"{self.output_path}/{student}.pdf")
-            
-            if callback is not None:
-                callback(i, job_count, f"PDF copies for all reports created!")
-            print(f"[OK] PDF copies for all reports created!")
+        return jobs
+
+    # Pipeline stages
+    def __prepare_stage(self, job):
+        """Pipeline stage: prepares the report card data for a student."""
+        with self.profiler.span("preparation", job = job.key):
+            job.payload = self.builder.prepare(job.key)
 
-    def generate_for_student(self, student_name, autocorrect = True, force = False, convert_to_pdf = False):
+    def __comment_stage(self, job, autocorrect, delay):
+        """Pipeline stage: generates the comment for a prepared report card."""
+        if delay and self.cgen_mode == "ai":
+            self.__wait_for_request_slot()
+
+        with self.profiler.span("comment", job = job.key):
+            self.builder.write_comment(job.payload, autocorrect = autocorrect)
+
+        if self.cgen_mode == "ai":
+            with self.profiler.span("manifest", job = job.key):
+                self.manifest.save()
+
+    def __render_stage(self, job, work_path, report_archive, convert_to_pdf):
+        """Pipeline stage: renders the report card and saves it as a DOCX file (or into the archive)."""
+        docx_path = f"{work_path}/{job.key}.docx"
+        with self.profiler.span("render", job = job.key):
+            document = self.render(job.payload)
+        with self.profiler.span("save", job = job.key):
+            if report_archive is None:
+                document_helper.save_deterministic(document, docx_path)
+            else:
+                buffer = io.BytesIO()
+                document_helper.save_deterministic(document, buffer)
+                report_archive.add(f"{job.key}.docx", buffer.getvalue())
+                # Word can only convert files, so keep a local copy for the conversion stage
+                if convert_to_pdf:
+                    with open(docx_path, "wb") as docx_file:
+                        docx_file.write(buffer.getvalue())
+        job.results["docx_path"] = docx_path
+        job.results["time_docsaved"] = datetime.datetime.now()
+
+    def __convert_stage(self, job, work_path, convert):
+        """Pipeline stage: converts the saved DOCX file into a PDF file with the given conversion function (DOCX path, PDF path)."""
+        pdf_path = f"{work_path}/{job.key}.pdf"
+        print(f"[  ] Creating PDF copy for {job.key}'s report…")
+        with self.profiler.span("conversion", job = job.key):
+            convert(job.results["docx_path"], pdf_path)
+        job.results["pdf_path"] = pdf_path
+
+    def __native_convert_stage(self, job, work_path, pdf_renderer):
+        """Pipeline stage: renders the report card straight into a PDF file without MS Word."""
+        pdf_path = f"{work_path}/{job.key}.pdf"
+        with self.profiler.span("conversion", job = job.key):
+            pdf_renderer.render(job.payload, pdf_path)
+        job.results["pdf_path"] = pdf_path
+
+    def __sign_stage(self, job, report_archive, finalize_pool, optimize_pdf, batch_manifest):
+        """
+        Pipeline stage: injects the metadata into the PDF file and signs it in a worker process, then records its hash in the batch manifest
+        (and the signing ledger). In archive mode, the signed PDF is moved into the archive.
+        """
+        pdf_metadata = metadata.build_metadata(job.key, self.grader_report, job.results["time_docsaved"])
+        with self.profiler.span("finalization", job = job.key):
+            finalize_pool.submit(integrity.finalize_pdf, job.results["pdf_path"], pdf_metadata, optimize_pdf).result()
+
+        with open(job.results["pdf_path"], "rb") as pdf_file:
+            pdf_data = pdf_file.read()
+        batch_manifest.add(f"{job.key}.pdf", integrity.hash_bytes(pdf_data))
+
+        if report_archive is not None:
+            self.__record_signature(job.key, f"{report_archive.file_path}/{job.key}.pdf", pdf_data)
+            with self.profiler.span("archive", job = job.key):
+                report_archive.add(f"{job.key}.pdf", pdf_data)
+                os.remove(job.results["pdf_path"])
+                os.remove(job.results["docx_path"])
+        else:
+            self.__record_signature(job.key, job.results["pdf_path"], pdf_data)
+
+    def __record_signature(self, student_name, file_path, pdf_data):
+        """Records a signed PDF file in the signing ledger, if there is one."""
+        if self.ledger is None:
+            return
+
+        with self.profiler.span("ledger", job = student_name):
+            self.ledger.record(file_path, student = student_name, subject = self.grader_report.get_course_info("Subject"),
+                               grade = self.grader_report.get_course_info("Grade"), semester = self.grader_report.get_course_info("Semester"),
+                               school_year = self.grader_report.get_course_info("School Year"), data = pdf_data)
+
+    def __open_word_session(self):
+        """Opens a MS Word session for a conversion worker thread."""
+        # Imported here so that the other backends also work where pywin32 is not installed
+        from components.utility import WordSession
+
+        session = WordSession()
+        session.open()
+        return session
+
+    def __wait_for_request_slot(self):
+        """Spaces out AI requests by at least 4 seconds to avoid rate limiting."""
+        with self.__request_lock:
+            wait_time = self.__next_request_time - time.monotonic()
+            if wait_time > 0:
+                print(f"[-'] Waiting for {round(wait_time, 2)} seconds before processing next student to avoid rate limiting…")
+                time.sleep(wait_time)
+            self.__next_request_time = time.monotonic() + 4
+
+    def generate_for_student(self, student_name, autocorrect = True, force = False, convert_to_pdf = False, optimize_pdf = False):
         """
         Generates a report for a specific student.
         
@@ -127,17 +362,137 @@ class Generator:
             student_name (str): The name of the student.
             autocorrect (bool): Whether to autocorrect the generated comments or not.
             force (bool): Whether to force the generation process or not. This will ignore the data validation errors.
+            convert_to_pdf (bool): Whether to create a signed PDF copy of the report or not.
+            optimize_pdf (bool): Whether to shrink the PDF file (recompressed content, shared images) before signing it or not.
         """
         # Validate data
         if not self.grader_report.data_valid and not force:
             print(f"[  ] Grader report incomplete. Aborting process...")
             return
         
-        # Prepare data
-        student_sna = {}
-        str_letter_grade = str(self.grader_report.get_final_grade(student_name, "Letter Grade"))
-        str_final_score = str(self.grader_report.get_final_grade(student_name, "Final Score"))
-        count_sna = self.grader_report.count_sna()
+        # Prepare data and generate comment
+        with self.profiler.span("preparation", job = student_name):
+            report_card = self.builder.prepare(student_name)
+        with self.profiler.span("comment", job = student_name):
+            self.builder.write_comment(report_card, autocorrect = autocorrect)
+
+        # Render document
+        with self.profiler.span("render", job = student_name):
+            document = self.render(report_card)
+
+        # Save document. The output file will be named as the student's name.
+        with self.profiler.span("save", job = student_name):
+            document_helper.save_deterministic(document, f"{self.output_path}/{student_name}.docx")
+        time_docsaved = datetime.datetime.now()
+
+        if convert_to_pdf:
+            print(f"[  ] Creating a PDF copy for {student_name}'s report…")
+            with self.profiler.span("conversion", job = student_name):
+                if self.pdf_backend == "native":
+                    PDFRenderer(use_watermark = self.use_watermark).render(report_card, f"{self.output_path}/{student_name}.pdf")
+                elif self.pdf_backend == "libreoffice":
+                    with LibreOfficePool(instances = 1) as libreoffice_pool:
+                        libreoffice_pool.convert(f"{self.output_path}/{student_name}.docx", f"{self.output_path}/{student_name}.pdf")
+                else:
+                    docx2pdf.convert(f"{self.output_path}/{student_name}.docx")
+            with self.profiler.span("finalization", job = student_name):
+                integrity.finalize_pdf(f"{self.output_path}/{student_name}.pdf", metadata.build_metadata(student_name, self.grader_report, time_docsaved), optimize = optimize_pdf)
+            if self.ledger is not None:
+                with open(f"{self.output_path}/{student_name}.pdf", "rb") as pdf_file:
+                    self.__record_signature(student_name, f"{self.output_path}/{student_name}.pdf", pdf_file.read())
+            print(f"[OK] PDF copy for {student_name}'s report created!")
+
+        if self.cgen_mode == "ai":
+            with self.profiler.span("manifest", job = student_name):
+                self.manifest.save()
+
+    def plan_all(self, autocorrect = True, callback = None, force = False):
+        """
+        Computes the report cards for all students in the grader report without rendering them.
+        This is the 'plan' mode of the generator which is useful for previewing and diffing comments.
+
+        Args:
+            autocorrect (bool): Whether to autocorrect the generated comments or not.
+            callback (function): The callback function to be called after each student is processed.
+            force (bool): Whether to force the process or not. This will ignore the data validation errors.
+
+        Returns:
+            list: The list of ReportCard instances.
+        """
+        report_cards = self.builder.build_all(autocorrect = autocorrect, callback = callback, force = force)
+
+        if self.cgen_mode == "ai":
+            self.manifest.save()
+
+        return report_cards
+
+    def plan_for_student(self, student_name, autocorrect = True, force = False):
+        """
+        Computes the report card of a specific student without rendering it (see plan_all).
+
+        Args:
+            student_name (str): The name of the student.
+            autocorrect (bool): Whether to autocorrect the generated comment or not.
+            force (bool): Whether to force the process or not. This will ignore the data validation errors.
+
+        Returns:
+            ReportCard: The report card of the student. None if the grader report is invalid and force is False.
+        """
+        if not self.grader_report.data_valid and not force:
+            print(f"[  ] Grader report incomplete. Aborting process...")
+            return None
+
+        report_card = self.builder.build(student_name, autocorrect = autocorrect)
+
+        if self.cgen_mode == "ai":
+            self.manifest.save()
+
+        return report_card
+
+    def generate_html(self, autocorrect = True, callback = None, force = False):
+        """
+        Generates a self-contained HTML page for each student in the grader report, plus a class index page (index.html).
+        The pages use the same report card data as the DOCX reports and do not need MS Word, so they can be
+        published to the parent portal right away. PDFs can be generated later as the archival copy.
+
+        Args:
+            autocorrect (bool): Whether to autocorrect the generated comments or not.
+            callback (function): The callback function to be called after each student is processed.
+            force (bool): Whether to force the generation process or not. This will ignore the data validation errors.
+
+        Returns:
+            list: The list of ReportCard instances.
+        """
+        report_cards = self.plan_all(autocorrect = autocorrect, callback = callback, force = force)
+        if len(report_cards) == 0:
+            return report_cards
+
+        renderer = HTMLRenderer(use_watermark = self.use_watermark)
+
+        for report_card in report_cards:
+            with self.profiler.span("html", job = report_card.student_name):
+                with open(f"{self.output_path}/{report_card.student_name}.html", "w", encoding = "utf-8") as html_file:
+                    html_file.write(renderer.render(report_card))
+
+        with open(f"{self.output_path}/index.html", "w", encoding = "utf-8") as html_file:
+            html_file.write(renderer.render_index(report_cards))
+
+        print(f"[OK] {len(report_cards)} HTML report(s) and the class index saved in {self.output_path}")
+        return report_cards
+
+    def render(self, report_card: ReportCard):
+        """
+        Renders a report card into a DOCX document.
+
+        Args:
+            report_card (ReportCard): The report card to render.
+
+        Returns:
+            Document: The rendered document. The document is not saved.
+        """
+        student_name = report_card.student_name
+        course_info = report_card.course_info
+        stopwatch = self.profiler.stopwatch("render", job = student_name)
 
         # Document processing begins
         document = Document()
@@ -145,27 +500,18 @@ class Generator:
 
         # Document metadata setup
         doc_prop = document.core_properties
-        doc_prop.author = "JAC Academic Reporting System"
-        doc_prop.title = f"{student_name} - {self.grader_report.get_course_info('Subject')} - S{self.grader_report.get_course_info('Semester')} AY{self.grader_report.get_course_info('School Year')} Report Card"
-        doc_prop.subject = f"{self.grader_report.get_course_info('Subject')} - S{self.grader_report.get_course_info('Semester')} AY{self.grader_report.get_course_info('School Year')} Report Card"
-        doc_prop.category = "Semester Report Card"
-        doc_prop.revised = 1
-        doc_prop.version = "1.0.0"
-        doc_prop.keywords = "JAC; JARS; Report Card; Semester Report Card"
-        doc_prop.language = "en-GB"
-        doc_prop.content_status = "Final"
+        for prop, value in report_card.metadata.items():
+            setattr(doc_prop, prop, value)
+
+        # Pin the timestamps to the report date so that the same report card always renders the same document
+        if report_card.date is not None:
+            report_date = report_card.date if isinstance(report_card.date, datetime.datetime) else datetime.datetime.combine(report_card.date, datetime.time())
+            doc_prop.created = report_date
+            doc_prop.modified = report_date
 
         # Spacing setup
-        section_spacing = Pt(18)
-        subject_description_spacing = Pt(12)
-
-        if count_sna > 6:
-            section_spacing = Pt(12)
-        if count_sna > 8:
-            section_spacing = Pt(10)
-        if count_sna > 9:
-            subject_description_spacing = Pt(8)
-            section_spacing = Pt(8)
+        section_spacing = Pt(report_card.spacing["section"])
+        subject_description_spacing = Pt(report_card.spacing["subject_description"])
         
         # Sections and headers setup
         section = document.sections[0]
@@ -180,6 +526,8 @@ class Generator:
         font.name = "Calibri"
         font.size = Pt(11)
 
+        stopwatch.lap("setup")
+
         # CONTENT STARTS HERE
         # Top spacer
         top_spacer = document.add_paragraph()
@@ -187,153 +535,64 @@ class Generator:
         top_spacer.paragraph_format.space_after = Pt(0)
 
         # Course Information Section
-        ci_table = document.add_table(rows = 3, cols = 5)
-        ci_table.style = "Table Grid"
-        ci_table.alignment = WD_TABLE_ALIGNMENT.CENTER
-        ci_table.autofit = False
-        ci_table.allow_autofit = False
-        ci_table_col_widths = [Cm(3), Cm(8), Cm(3), Cm(1.5), Cm(1.5)]
-
-        ci_table.cell(0, 0).text = "Student"
-        ci_table.cell(0, 0).paragraphs[0].runs[0].bold = True
-        ci_table.cell(0, 1).text = student_name
-
-        ci_table.cell(1, 0).text = "Grade"
-        ci_table.cell(1, 0).paragraphs[0].runs[0].bold = True
-        ci_table.cell(1, 1).text = self.grader_report.get_course_info("Grade")
-        
-        ci_table.cell(2, 0).text = "School Year"
-        ci_table.cell(2, 0).paragraphs[0].runs[0].bold = True
-        ci_table.cell(2, 1).text = self.grader_report.get_course_info("School Year")
-
-        ci_table.cell(0, 2).text = "Semester"
-        ci_table.cell(0, 2).paragraphs[0].runs[0].bold = True
-        ci_table.cell(0, 3).merge(ci_table.cell(0, 4)).text = str(self.grader_report.get_course_info("Semester"))
-        ci_table.cell(0, 3).paragraphs[0].alignment = WD_TABLE_ALIGNMENT.CENTER
-
-        ci_table.cell(1, 2).text = "Subject"
-        ci_table.cell(1, 2).paragraphs[0].runs[0].bold = True
-        ci_table.cell(1, 3).merge(ci_table.cell(1, 4)).text = self.grader_report.get_course_info("Subject")
-        ci_table.cell(1, 3).paragraphs[0].alignment = WD_TABLE_ALIGNMENT.CENTER
-        
-        ci_table.cell(2, 2).text = "Assessment"
-        ci_table.cell(2, 2).paragraphs[0].runs[0].bold = True
-        ci_table.cell(2, 3).text = str_final_score
-        ci_table.cell(2, 3).paragraphs[0].alignment = WD_TABLE_ALIGNMENT.CENTER
-        ci_table.cell(2, 4).text =str_letter_grade
-        ci_table.cell(2, 4).paragraphs[0].alignment = WD_TABLE_ALIGNMENT.CENTER
+        document_helper.build_table(document, [
+            [{"text": "Student", "bold": True}, student_name,
+             {"text": "Semester", "bold": True}, {"text": course_info["Semester"], "align": "center", "span": 2, "width": Cm(1.5)}],
+            [{"text": "Grade", "bold": True}, course_info["Grade"],
+             {"text": "Subject", "bold": True}, {"text": course_info["Subject"], "align": "center", "span": 2, "width": Cm(1.5)}],
+            [{"text": "School Year", "bold": True}, course_info["School Year"],
+             {"text": "Assessment", "bold": True}, {"text": report_card.final_score, "align": "center"}, {"text": report_card.letter_grade, "align": "center"}]
+        ], widths = [Cm(3), Cm(8), Cm(3), Cm(1.5), Cm(1.5)])
 
-        for i in range(0, 3):
-            for j in range(0, 5):
-                ci_table.cell(i, j).width = ci_table_col_widths[j]
+        stopwatch.lap("course_info")
 
         # Subject Description Section
         sd_header = document.add_paragraph()
         sd_header.add_run("SUBJECT DESCRIPTION").bold = True
         sd_header.paragraph_format.space_before = subject_description_spacing
         sd_header.paragraph_format.space_after = Pt(0)
-        
-        sd_table = document.add_table(rows = 1, cols = 1)
-        sd_table.style = "Table Grid"
-        sd_table.alignment = WD_TABLE_ALIGNMENT.CENTER
-        sd_table.autofit = False
-        sd_table.allow_autofit = False
-        sd_table.rows[0].height = Cm(1.5)
-        sd_table.cell(0, 0).text = self.grader_report.get_course_info("Subject Description")
-        sd_table.cell(0, 0).paragraphs[0].alignment = WD_TABLE_ALIGNMENT.LEFT
-        sd_table.cell(0, 0).width = Cm(17)
+
+        document_helper.build_table(document, [[{"text": course_info["Subject Description"], "align": "left"}]],
+                                    widths = [Cm(17)], heights = [Cm(1.5)])
+
+        stopwatch.lap("subject_description")
 
         # Skills and Assessment Section
         sna_header = document.add_paragraph()
         sna_header.add_run("SKILLS AND ASSESSMENT").bold = True
         sna_header.paragraph_format.space_before = section_spacing
         sna_header.paragraph_format.space_after = Pt(0)
-        
-        sna_table = document.add_table(rows = count_sna, cols = 2)
-        sna_table.style = "Table Grid"
-        sna_table.alignment = WD_TABLE_ALIGNMENT.CENTER
-        sna_table.autofit = False
-        sna_table.allow_autofit = False
-        
-        for i, assessment in enumerate(self.grader_report.data_sna.columns):
-            student_sna[assessment] = self.grader_report.get_grade_sna(student_name, assessment)
-            sna_table.cell(i, 0).text = assessment
-            sna_table.cell(i, 0).width = Cm(15)
-            sna_table.cell(i, 1).text = str(student_sna[assessment])
-            sna_table.cell(i, 1).width = Cm(2)
-            sna_table.cell(i, 1).paragraphs[0].alignment = WD_TABLE_ALIGNMENT.CENTER
+
+        document_helper.build_table(document, [[assessment, {"text": grade, "align": "center"}] for assessment, grade in report_card.sna.items()],
+                                    widths = [Cm(15), Cm(2)])
+
+        stopwatch.lap("sna")
 
         # Personal Development Section
         pd_header = document.add_paragraph()
         pd_header.add_run("PERSONAL DEVELOPMENT").bold = True
         pd_header.paragraph_format.space_before = section_spacing
         pd_header.paragraph_format.space_after = Pt(0)
-        
-        pd_table = document.add_table(rows = len(self.grader_report.data_pd.columns) + 1, cols = 6)
-        pd_table.style = "Table Grid"
-        pd_table.alignment = WD_TABLE_ALIGNMENT.CENTER
-        pd_table.autofit = False
-        pd_table.allow_autofit = False
-
-        pd_table_header = pd_table.rows[0].cells
-        pd_table_header[0].text = "Item"
-        pd_table_header[1].text = "NI"
-        pd_table_header[2].text = "S"
-        pd_table_header[3].text = "G"
-        pd_table_header[4].text = "VG"
-        pd_table_header[5].text = "E"
-
-        for i in range(0, 6): # Setup table header layout
-            pd_table_header[i].paragraphs[0].runs[0].bold = True
-            pd_table_header[i].paragraphs[0].alignment = WD_TABLE_ALIGNMENT.CENTER
-            pd_table_header[i].width = Cm(1) if i != 0 else Cm(12)
-
-        for i, item in enumerate(self.grader_report.data_pd.columns): # Setup table body (items)
-            pd_table.cell(i + 1, 0).text = item
-            pd_table.cell(i + 1, 0).paragraphs[0].alignment = WD_TABLE_ALIGNMENT.LEFT
-            pd_table.cell(i + 1, 0).width = Cm(12)
-            pd_grade = int(self.grader_report.get_grade_pd(student_name, item))
-            pd_table.cell(i + 1, pd_grade).text = "✔"
-            pd_table.cell(i + 1, pd_grade).paragraphs[0].runs[0].font.name = "Segoe UI Symbol"
-            pd_table.cell(i + 1, pd_grade).paragraphs[0].alignment = WD_TABLE_ALIGNMENT.CENTER
-            
-        for i in range(1, len(self.grader_report.data_pd.columns) + 1): # For each cell in row
-            for j in range(1, 6):                                       # and in each column
-                pd_table.cell(i, j).width = Cm(1)                       # set width to 1cm
 
-        # Teacher's Comments Section        
+        pd_rows = [[{"text": label, "bold": True, "align": "center"} for label in ["Item"] + PD_SCALE]]
+        for item, pd_grade in report_card.pd.items():
+            pd_rows.append([{"text": item, "align": "left"}] +
+                           [{"text": "✔", "font": "Segoe UI Symbol", "align": "center"} if grade == pd_grade else None for grade in range(1, len(PD_SCALE) + 1)])
+
+        document_helper.build_table(document, pd_rows, widths = [Cm(12)] + [Cm(1)] * len(PD_SCALE))
+
+        stopwatch.lap("pd")
+
+        # Teacher's Comments Section
         tc_header = document.add_paragraph()
         tc_header.add_run("TEACHER'S COMMENTS").bold = True
         tc_header.paragraph_format.space_before = section_spacing
         tc_header.paragraph_format.space_after = Pt(0)
 
-        tc_table = document.add_table(rows = 1, cols = 1)
-        tc_table.style = "Table Grid"
-        tc_table.alignment = WD_TABLE_ALIGNMENT.CENTER
-        tc_table.autofit = False
-        tc_table.allow_autofit = False
-        tc_table.rows[0].height = Cm(2)
-
-        if self.cgen_mode == "map":
-            comment_generator = cgen.CommentGenerator(student_name = student_name, 
-                                                      short_name = self.grader_report.get_student_info(student_name, "Short Name"),
-                                                      gender = self.grader_report.get_student_info(student_name, "Gender"),
-                                                      comment_mapping = self.grader_report.data_comment_mapping,
-                                                      student_result = student_sna,
-                                                      letter_grade = str_letter_grade,
-                                                     )
-            tc_table.cell(0, 0).text = comment_generator.generate_comment(autocorrect = autocorrect)
-        elif self.cgen_mode == "ai":
-            comment_generator = cgen.AICommentGenerator(self.manifest)
-            tc_table.cell(0, 0).text = comment_generator.generate_comment(nickname = self.grader_report.get_student_info(student_name, "Short Name"),
-                                                                          gender = self.grader_report.get_student_info(student_name, "Gender"),
-                                                                          final_grade = str_letter_grade,
-                                                                          sna_list = student_sna,
-                                                                          verbose = True
-                                                                         )
-            
-        tc_table.cell(0, 0).paragraphs[0].alignment = WD_PARAGRAPH_ALIGNMENT.JUSTIFY
-        tc_table.cell(0, 0).width = Cm(17)
+        document_helper.build_table(document, [[{"text": report_card.comment, "align": "both"}]],
+                                    widths = [Cm(17)], heights = [Cm(2)])
+
+        stopwatch.lap("comments")
 
         # Acknowledgement Section
         ak_header = document.add_paragraph()
@@ -341,39 +600,22 @@ class Generator:
         ak_header.paragraph_format.space_before = section_spacing
         ak_header.paragraph_format.space_after = Pt(0)
 
-        ak_table = document.add_table(rows = 2, cols = 4)
-        ak_table.style = "Table Grid"
-        ak_table.alignment = WD_TABLE_ALIGNMENT.CENTER
-        ak_table.autofit = False
-        ak_table.allow_autofit = False
+        date_paragraphs = ["Date"]
+        if report_card.date is not None:
+            date_paragraphs.append(report_card.date.strftime("%B %d, %Y"))
 
-        for row in ak_table.rows:
-            row.height = Cm(1.5) # Set row height to 1cm
+        ak_table = document_helper.build_table(document, [
+            [{"paragraphs": [{"text": "Teacher:", "bold": True}, course_info["Teacher"]]},
+             {"text": "Signature", "borders": {"end": {"sz": 1, "val": "none"}}},
+             {"borders": {"start": {"sz": 1, "val": "none"}}},
+             {"paragraphs": date_paragraphs}],
+            [{"text": "Parent:", "bold": True}, {"text": "Signature", "span": 2, "width": Cm(6.5)}, "Date"]
+        ], widths = [Cm(6.5), Cm(2), Cm(4.5), Cm(4)], heights = [Cm(1.5), Cm(1.5)])
 
-        ak_table.cell(0, 0).paragraphs[0].add_run("Teacher:").bold = True
-        ak_table.cell(0, 0).add_paragraph(self.grader_report.get_course_info("Teacher"))
+        if report_card.signature_path is not None:
+            ak_table.cell(0, 2).paragraphs[0].add_run().add_picture(report_card.signature_path, height = Cm(1.5))
 
-        ak_table.cell(0, 1).text = "Signature"
-        if self.signature_path is not None:
-            ak_table.cell(0, 2).paragraphs[0].add_run().add_picture(self.signature_path, height = Cm(1.5))
-        
-        ak_table.cell(0, 3).text = "Date"
-        if self.date is not None:
-            ak_table.cell(0, 3).add_paragraph(self.date.strftime("%B %d, %Y"))
-        
-        ak_table.cell(0, 0).width = Cm(6.5)
-        ak_table.cell(0, 1).width = Cm(2)
-        ak_table.cell(0, 2).width = Cm(4.5)
-        ak_table.cell(0, 3).width = Cm(4)
-        document_helper.set_cell_border(ak_table.cell(0, 1), end = {"sz": 1, "val": "none"})
-        document_helper.set_cell_border(ak_table.cell(0, 2), start = {"sz": 1, "val": "none"})
-
-        ak_table.cell(1, 0).paragraphs[0].add_run("Parent:").bold = True
-        ak_table.cell(1, 1).merge(ak_table.cell(1, 2)).text = "Signature"
-        ak_table.cell(1, 3).text = "Date"
-        ak_table.cell(1, 0).width = Cm(6.5)
-        ak_table.cell(1, 1).width = Cm(6.5)
-        ak_table.cell(1, 3).width = Cm(4)
+        stopwatch.lap("acknowledgement")
 
         # Legend Section
         lg_header = document.add_paragraph()
@@ -381,111 +623,30 @@ class Generator:
         lg_header.paragraph_format.space_before = section_spacing
         lg_header.paragraph_format.space_after = Pt(0)
 
-        lg_table = document.add_table(rows = 3, cols = 13)
-        lg_table.style = "Table Grid"
-        lg_table.alignment = WD_TABLE_ALIGNMENT.CENTER
-        lg_table.autofit = False
-        lg_table.allow_autofit = False
-
-        # Skills and Assessment legend header
-        lg_table.cell(0, 0).merge(lg_table.cell(0, 5)).text = "Skills and Assessment"
-        lg_table.cell(0, 0).paragraphs[0].runs[0].bold = True
-        lg_table.cell(0, 0).width = Cm(8.4)
-
-        # Small spacer between two legends
-        lg_table.cell(0, 6).width = Cm(0.2)
-        lg_table.cell(0, 6).text = ""
-        document_helper.set_cell_border(lg_table.cell(0, 6), top = {"sz": 1, "val": "none"}, bottom = {"sz": 1, "val": "none"})
-        document_helper.set_cell_margin(lg_table.cell(0, 6), margin_left_mm = 0, margin_right_mm = 0)
-        
-        lg_table.cell(1, 6).width = Cm(0.2)
-        lg_table.cell(1, 6).text = ""
-        document_helper.set_cell_border(lg_table.cell(1, 6), top = {"sz": 1, "val": "none"}, bottom = {"sz": 1, "val": "none"})
-        document_helper.set_cell_margin(lg_table.cell(1, 6), margin_left_mm = 0, margin_right_mm = 0)
-        
-        lg_table.cell(2, 6).width = Cm(0.2)
-        lg_table.cell(2, 6).text = ""
-        document_helper.set_cell_border(lg_table.cell(2, 6), top = {"sz": 1, "val": "none"}, bottom = {"sz": 1, "val": "none"})
-        document_helper.set_cell_margin(lg_table.cell(2, 6), margin_left_mm = 0, margin_right_mm = 0)
-
-        # Personal Development legend header
-        lg_table.cell(0, 7).merge(lg_table.cell(0, 12)).text = "Personal Development"
-        lg_table.cell(0, 7).paragraphs[0].runs[0].bold = True
-        lg_table.cell(0, 7).width = Cm(8.4)
-
-        # Skills and Assessment legend
-        lg_table.cell(1, 0).text = "A"
-        lg_table.cell(1, 1).text = "95-100"
-        lg_table.cell(2, 0).text = "B"
-        lg_table.cell(2, 1).text = "85-94"
-        lg_table.cell(1, 0).width = Cm(0.8)
-        lg_table.cell(1, 1).width = Cm(1.8)
-        lg_table.cell(2, 0).width = Cm(0.8)
-        lg_table.cell(2, 1).width = Cm(1.8)
-        document_helper.set_cell_margin(lg_table.cell(1, 0), margin_left_mm = 0, margin_right_mm = 0)
-        document_helper.set_cell_margin(lg_table.cell(1, 1), margin_left_mm = 0, margin_right_mm = 0)
-        document_helper.set_cell_margin(lg_table.cell(2, 0), margin_left_mm = 0, margin_right_mm = 0)
-        document_helper.set_cell_margin(lg_table.cell(2, 1), margin_left_mm = 0, margin_right_mm = 0)
-
-        lg_table.cell(1, 2).text = "C"
-        lg_table.cell(1, 3).text = "75-84"
-        lg_table.cell(2, 2).text = "D"
-        lg_table.cell(2, 3).text = "40-74"
-        lg_table.cell(1, 2).width = Cm(0.8)
-        lg_table.cell(1, 3).width = Cm(1.8)
-        lg_table.cell(2, 2).width = Cm(0.8)
-        lg_table.cell(2, 3).width = Cm(1.8)
-
-        lg_table.cell(1, 4).merge(lg_table.cell(2, 4)).text = "E"
-        lg_table.cell(1, 5).merge(lg_table.cell(2, 5)).text = "Below 40"
-        lg_table.cell(1, 4).width = Cm(0.8)
-        lg_table.cell(1, 5).width = Cm(2)
-
-        lg_table.cell(1, 7).text = "E"
-        lg_table.cell(1, 8).text = "Excellent"
-        lg_table.cell(2, 7).text = "VG"
-        lg_table.cell(2, 8).text = "Very Good"
-        lg_table.cell(1, 7).width = Cm(0.8)
-        lg_table.cell(1, 8).width = Cm(1.8)
-        lg_table.cell(2, 7).width = Cm(0.8)
-        lg_table.cell(2, 8).width = Cm(1.8)
-
-        lg_table.cell(1, 9).text = "G"
-        lg_table.cell(1, 10).text = "Good"
-        lg_table.cell(2, 9).text = "S"
-        lg_table.cell(2, 10).text = "Satisfactory"
-        lg_table.cell(1, 9).width = Cm(0.8)
-        lg_table.cell(1, 10).width = Cm(2)
-        lg_table.cell(2, 9).width = Cm(0.8)
-        lg_table.cell(2, 10).width = Cm(2)
-
-        lg_table.cell(1, 11).merge(lg_table.cell(2, 11)).text = "NI"
-        lg_table.cell(1, 12).merge(lg_table.cell(2, 12)).text = "Needs Improvement"
-        lg_table.cell(1, 11).width = Cm(0.8)
-        lg_table.cell(1, 12).width = Cm(2.2)
-
-        for i in range(0, 3): # Adjust cell formatting for legend table
-            for j in range(0, 13):
-                lg_table.cell(i, j).vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-                lg_table.cell(i, j).paragraphs[0].alignment = WD_TABLE_ALIGNMENT.CENTER
-                lg_table.cell(i, j).paragraphs[0].runs[0].font.size = Pt(9)
+        def legend(text, **kwargs):
+            return {"text": text, "align": "center", "valign": "center", "size": Pt(9), **kwargs}
+
+        no_margin = {"margin_left_mm": 0, "margin_right_mm": 0}
+        spacer = legend("", borders = {"top": {"sz": 1, "val": "none"}, "bottom": {"sz": 1, "val": "none"}}, margins = no_margin) # Small spacer between two legends
+        merged = {"merge": "continue"}
+
+        document_helper.build_table(document, [
+            [legend("Skills and Assessment", bold = True, span = 6, width = Cm(8.4)), spacer, legend("Personal Development", bold = True, span = 6, width = Cm(8.4))],
+            [legend("A", margins = no_margin), legend("95-100", margins = no_margin), legend("C"), legend("75-84"),
+             legend("E", merge = "restart"), legend("Below 40", merge = "restart"), spacer,
+             legend("E"), legend("Excellent"), legend("G"), legend("Good"), legend("NI", merge = "restart"), legend("Needs Improvement", merge = "restart")],
+            [legend("B", margins = no_margin), legend("85-94", margins = no_margin), legend("D"), legend("40-74"), merged, merged, spacer,
+             legend("VG"), legend("Very Good"), legend("S"), legend("Satisfactory"), merged, merged]
+        ], widths = [Cm(0.8), Cm(1.8), Cm(0.8), Cm(1.8), Cm(0.8), Cm(2), Cm(0.2), Cm(0.8), Cm(1.8), Cm(0.8), Cm(2), Cm(0.8), Cm(2.2)])
+
+        stopwatch.lap("legend")
 
         # Watermark setup
         if self.use_watermark:
             document_helper.add_image_watermark(document, config.get_config("watermark_path"), opacity = 0.1, width_pt = 600, height_pt = 600)
 
+        stopwatch.lap("watermark")
+
         # CONTENT ENDS HERE
         # Document processing ends
-        # Save document. The output file will be named as the student's name.
-        document.save(f"{self.output_path}/{student_name}.docx")
-        time_docsaved = datetime.datetime.now()
-
-        if convert_to_pdf:
-            print(f"[  ] Creating a PDF copy for {student_name}'s report…")
-            docx2pdf.convert(f"{self.output_path}/{student_name}.docx")
-            metadata.pdf_inject(f"{self.output_path}/{student_name}.pdf", student_name, self.grader_report, time_docsaved)
-            integrity.sign_pdf(f"{self.output_path}/{student_name}.pdf")
-            print(f"[OK] PDF copy for {student_name}'s report created!")
-
-        if self.cgen_mode == "ai":
-            self.manifest.save()
\ No newline at end of file
+        return document
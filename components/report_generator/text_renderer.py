@@ -0,0 +1,49 @@
+from components.report_generator.report_card import PD_SCALE, ReportCard
+
+SECTION_TITLES = ["SUBJECT DESCRIPTION", "SKILLS AND ASSESSMENT", "PERSONAL DEVELOPMENT", "TEACHER'S COMMENTS", "ACKNOWLEDGEMENT"]
+
+@staticmethod
+def render(report_card: ReportCard, width = 60):
+    """
+    Renders a report card as plain text for quick previews. Nothing is written to disk.
+
+    Args:
+        report_card (ReportCard): The report card to render.
+        width (int): The width of the item lists in characters.
+
+    Returns:
+        str: The report card as text. Section titles are on their own line (see SECTION_TITLES).
+    """
+    course_info = report_card.course_info
+    lines = [
+        _columns(f"Student: {report_card.student_name}", f"Semester: {course_info['Semester']}", width, fill = " "),
+        _columns(f"Grade: {course_info['Grade']}", f"Subject: {course_info['Subject']}", width, fill = " "),
+        _columns(f"School Year: {course_info['School Year']}", f"Assessment: {report_card.final_score} ({report_card.letter_grade})", width, fill = " "),
+        "",
+        SECTION_TITLES[0],
+        str(course_info["Subject Description"]),
+        "",
+        SECTION_TITLES[1]
+    ]
+
+    for assessment, grade in report_card.sna.items():
+        lines.append(_columns(f"  {assessment}", grade, width))
+
+    lines += ["", SECTION_TITLES[2]]
+    for item, pd_grade in report_card.pd.items():
+        lines.append(_columns(f"  {item}", PD_SCALE[pd_grade - 1], width))
+
+    lines += ["", SECTION_TITLES[3], report_card.comment if report_card.comment is not None else "(No comment)", ""]
+
+    date = report_card.date.strftime("%B %d, %Y") if report_card.date is not None else "(No date)"
+    signature = "(Signed)" if report_card.signature_path is not None else "(No signature)"
+    lines += [SECTION_TITLES[4], f"Teacher: {course_info['Teacher']}", f"Signature: {signature}", f"Date: {date}"]
+
+    return "\n".join(lines)
+
+def _columns(left, right, width, fill = "."):
+    """Pads the left text with the fill character so that the right text ends at the given width."""
+    right = str(right)
+    if len(left) + len(right) + 2 >= width:
+        return f"{left} {right}"
+    return f"{left} ".ljust(width - len(right) - 1, fill) + f" {right}"
@@ -0,0 +1,143 @@
+# TEST
+import getopt
+import os
+import sys
+import tempfile
+import time
+
+help_text = """
+HELP PAGE
+=========
+This script stores sample verification results in a verification cache and checks that they are only reused while
+the file, the verification mode, and the ledger are unchanged, and that the cache keeps its size limit.
+
+=========
+USAGE
+=========
+Format:
+verification_cache_test.py -o <output_folder_path>
+
+Options:
+-h, --help
+    Displays this help page.
+-o, --output <output_folder_path>
+    Specifies the folder to write the sample files and the cache to. Defaults to a new temporary folder.
+    Example:
+        C:/Users/John Doe/Desktop/Verification Cache Test
+
+Example:
+verification_cache_test.py -o C:/Users/John Doe/Desktop/Verification Cache Test
+
+Note:
+The script exits with 1 if any check fails.
+"""
+
+def run(output_folder_path, verification_cache):
+    failures = []
+
+    def check(name, condition):
+        print(f"[OK] {name}" if condition else f"[!!] {name}")
+        if not condition:
+            failures.append(name)
+
+    def write(name, data):
+        file_path = f"{output_folder_path}/{name}"
+        with open(file_path, "wb") as file:
+            file.write(data)
+        return file_path
+
+    cache_path = f"{output_folder_path}/Verification Cache.json"
+    if os.path.isfile(cache_path):
+        os.remove(cache_path)
+
+    file_path = write("Report.pdf", b"%PDF-1.4 sample report" * 10000)
+    identity = verification_cache.identify(file_path)
+
+    print("[  ] Checking the file identity…")
+    check("An unchanged file has the same identity", verification_cache.identify(file_path) == identity)
+    check("A missing file has no identity", verification_cache.identify(f"{output_folder_path}/Missing.pdf") is None)
+
+    print("[  ] Checking reuse and invalidation…")
+    cache = verification_cache.VerificationCache(cache_path)
+    check("An unknown file is not cached", cache.get(file_path, identity) is None)
+    cache.put(file_path, identity, {"Result": "Pass"})
+    check("An unchanged file is answered from the cache", cache.get(file_path, identity) == {"Result": "Pass"})
+    check("Another spelling of the path is answered from the cache", cache.get(f"{output_folder_path}/./Report.pdf", identity) == {"Result": "Pass"})
+
+    # Same size and modification time, different content in the last block
+    stat = os.stat(file_path)
+    write("Report.pdf", b"%PDF-1.4 sample report" * 9999 + b"%PDF-1.4 sample repory")
+    os.utime(file_path, ns = (stat.st_atime_ns, stat.st_mtime_ns))
+    changed_identity = verification_cache.identify(file_path)
+    check("A file changed in place has a different identity", changed_identity != identity and changed_identity["mtime"] == identity["mtime"])
+    check("A changed file is not answered from the cache", cache.get(file_path, changed_identity) is None)
+    check("A changed file is dropped from the cache", cache.get(file_path, identity) is None)
+
+    print("[  ] Checking verification modes…")
+    ledger_path = write("Signing Ledger.db", b"first state")
+    ledger_mode = verification_cache.verification_mode(ledger_path)
+    cache.put(file_path, changed_identity, {"Result": "Pass"})
+    cache.put(file_path, changed_identity, {"Result": "Pass", "Reason": "ledger"}, ledger_mode)
+    check("Full and ledger results are kept apart", cache.get(file_path, changed_identity, verification_cache.verification_mode()) == {"Result": "Pass"}
+          and cache.get(file_path, changed_identity, ledger_mode)["Reason"] == "ledger")
+
+    time.sleep(0.01)
+    write("Signing Ledger.db", b"second state")
+    new_ledger_mode = verification_cache.verification_mode(ledger_path)
+    check("A changed ledger changes the mode", new_ledger_mode != ledger_mode)
+    check("A ledger result is not returned after the ledger changed", cache.get(file_path, changed_identity, new_ledger_mode) is None)
+
+    cache.put(file_path, changed_identity, {"Result": "Pass", "Reason": "new ledger"}, new_ledger_mode)
+    check("Only the latest ledger result is kept", cache.get(file_path, changed_identity, ledger_mode) is None)
+    check("The full result is kept next to the ledger result", cache.get(file_path, changed_identity) == {"Result": "Pass"})
+
+    print("[  ] Checking saving and loading…")
+    cache.save()
+    loaded = verification_cache.VerificationCache(cache_path)
+    check("A saved result is loaded", loaded.get(file_path, changed_identity, new_ledger_mode) == {"Result": "Pass", "Reason": "new ledger"})
+    write("Verification Cache.json", b"{damaged")
+    check("A damaged cache file loads as empty", len(verification_cache.VerificationCache(cache_path)) == 0)
+
+    print("[  ] Checking the size limit…")
+    small = verification_cache.VerificationCache(max_files = 3)
+    paths = [write(f"Report {i}.pdf", f"report {i}".encode()) for i in range(5)]
+    for path in paths[:3]:
+        small.put(path, verification_cache.identify(path), {"Result": "Pass"})
+    small.get(paths[0], verification_cache.identify(paths[0]))
+    for path in paths[3:]:
+        small.put(path, verification_cache.identify(path), {"Result": "Pass"})
+    check("The cache keeps at most its limit", len(small) == 3)
+    check("The least recently used files are dropped first", small.get(paths[1], verification_cache.identify(paths[1])) is None
+          and small.get(paths[2], verification_cache.identify(paths[2])) is None
+          and small.get(paths[0], verification_cache.identify(paths[0])) is not None)
+
+    print(f"[  ] Done. {len(failures)} check(s) failed.")
+    return len(failures)
+
+def main(argv):
+    import components.common.verification_cache as verification_cache
+
+    output_folder_path = ""
+
+    try:
+        opts, args = getopt.getopt(argv, "ho:", ["help", "output="])
+    except getopt.GetoptError:
+        print("Error! Invalid argument(s).")
+        print("verification_cache_test.py -o <output_folder_path> --help")
+        sys.exit(2)
+
+    for opt, arg in opts:
+        if opt in ("-h", "--help"):
+            print(help_text)
+            sys.exit()
+        elif opt in ("-o", "--output"):
+            output_folder_path = arg
+
+    if output_folder_path == "":
+        output_folder_path = tempfile.mkdtemp(prefix = "jars_verification_cache_test_")
+    os.makedirs(output_folder_path, exist_ok = True)
+
+    sys.exit(1 if run(output_folder_path, verification_cache) > 0 else 0)
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
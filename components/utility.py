@@ -65,4 +65,36 @@ def check_word_status():
     except Exception as e:
         return word_is_open, None, str(e)
     finally:
-        pythoncom.CoUninitialize()
\ No newline at end of file
+        pythoncom.CoUninitialize()
+
+class WordSession:
+    """
+    Keeps a MS Word instance alive for the lifetime of a worker thread so that consecutive
+    DOCX to PDF conversions do not start and quit Word for every file.
+
+    Methods:
+        open(self): Initializes COM for the current thread and checks whether Word was already running.
+        close(self): Quits Word if it was started by this session and uninitializes COM.
+    """
+
+    def __init__(self):
+        """Initialize the Word session instance."""
+        self.__word_was_running = False
+
+    def open(self):
+        """Initializes COM for the current thread and checks whether Word was already running."""
+        pythoncom.CoInitialize()
+
+        try:
+            GetActiveObject("Word.Application")
+            self.__word_was_running = True
+        except pythoncom.com_error:
+            self.__word_was_running = False
+
+    def close(self):
+        """Quits Word if it was started by this session and uninitializes COM."""
+        try:
+            if not self.__word_was_running:
+                Dispatch("Word.Application").Quit()
+        finally:
+            pythoncom.CoUninitialize()
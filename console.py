@@ -9,10 +9,13 @@ __version__ = "1.0.0"
 __author__ = "Raven Limadinata"
 
 import getopt
+import multiprocessing
 import sys
 
 import console.report_formatter as report_formatter
 import console.report_generator as report_generator
+import console.verification_server as verification_server
+import console.verifier as verifier
 
 help_text = """
 HELP PAGE
@@ -38,22 +41,32 @@ Options:
         --tool report_formatter
         or
         --tool report_generator
+        or
+        --tool verify
+        or
+        --tool serve
 Tip: Use the -h or --help option to display the help page for the specified tool.
 Note: Pass the arguments for the specified tool after the tool name.
 
 Example:
 console.py -t report_generator -s "C:/Grader Report.xlsm" -o "C:/Reports" -a --all
+console.py -t verify -s "C:/Reports" -o "C:/Reports/Verification Summary.xlsx"
+console.py -t serve --port 8080 --ledger "C:/Reports/Signing Ledger.db"
 """
 
 def interactive():
     print("JARS Report Processor\nJAC Academic Reporting System | Version 1.0.0")
-    print("\nSelect a tool to open:\n1. Report Formatter\n2. Report Generator")
+    print("\nSelect a tool to open:\n1. Report Formatter\n2. Report Generator\n3. Report Verifier\n4. Verification Server")
     tool = int(input("Please enter appropriate tool number: "))
 
     if tool == 1:
         report_formatter.run()
     elif tool == 2:
         report_generator.run()
+    elif tool == 3:
+        verifier.run()
+    elif tool == 4:
+        verification_server.run()
 
     input("\nPress Enter to exit…")
 
@@ -62,8 +75,8 @@ long_args = ["help", "interactive", "tool="]
 
 def main(argv):
     try:
-        opts, args = getopt.getopt(argv, short_args + report_formatter.short_args + report_generator.short_args, 
-                                   long_args + report_formatter.long_args + report_generator.long_args)
+        opts, args = getopt.getopt(argv, short_args + report_formatter.short_args + report_generator.short_args + verifier.short_args + verification_server.short_args, 
+                                   long_args + report_formatter.long_args + report_generator.long_args + verifier.long_args + verification_server.long_args)
     except getopt.GetoptError:
         print("Error! Invalid argument(s).")
         print("main.py -t <tool_name> -i --help")
@@ -80,6 +93,11 @@ def main(argv):
                 report_formatter.main(sys.argv[3:])
             elif arg == "report_generator":
                 report_generator.main(sys.argv[3:])
+            elif arg == "verify":
+                verifier.main(sys.argv[3:])
+            elif arg == "serve":
+                verification_server.main(sys.argv[3:])
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main(sys.argv[1:])
\ No newline at end of file
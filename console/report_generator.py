@@ -15,10 +15,18 @@ if __name__ == "__main__":
 import time
 import getopt
 import sys
+import threading
 
 import console.helper as con
 import components.common.grader_report as grader_report
 import components.report_generator.semester_report as processor
+import components.report_generator.report_card as report_card
+import components.report_generator.consolidated_report as consolidated_report
+import components.common.report_index as report_index
+import components.common.batch_manifest as batch_manifest
+from components.common.ledger import SigningLedger
+from components.common.profiler import Profiler
+from components.report_generator.pipeline import JobControl
 import components.report_generator.language_tool_master as ltm
 
 help_text = """
@@ -58,11 +66,55 @@ Options:
         --student "John Doe"
 -f, --force
     Specifies whether to force the program to proceed with the operation even if invalid data is detected in the source file.
+-p, --pdf
+    Specifies whether to create a PDF copy of the generated reports.
+--pdf-backend <word|libreoffice|native>
+    Specifies how the PDF copies are created. "word" (default) converts the DOCX reports with MS Word.
+    "libreoffice" converts them concurrently with a pool of headless LibreOffice instances (requires LibreOffice and its Python UNO bridge).
+    "native" renders the PDF directly and does not need an office suite.
+    Example:
+        --pdf-backend native
+--ledger <ledger_file_path>
+    Records every signed PDF copy in a signing ledger (SQLite database). The ledger is created if it does not exist.
+    Reports recorded in the ledger can be verified with a quick lookup (see console.py -t verify --ledger).
+    Example:
+        --ledger "C:/Reports/Signing Ledger.db"
+--manifest-key <key>
+    Specifies the secret key (up to 64 bytes) to sign the batch manifest of the PDF copies with. Defaults to the
+    "batch_manifest_key" setting. Without a key the manifest only gets a checksum and does not prove the reports are authentic.
+    Keep the key private; it is needed again to verify the manifest (see console.py -t verify --manifest).
+--optimize
+    Shrinks the PDF copies before signing them (the page contents are recompressed and images used more than once are stored once).
+--plan
+    Computes the report data and comments without rendering any document.
+    The result is saved as a JSON file (Plan <timestamp>.json) in the output folder for previewing and diffing.
+--html
+    Generates a self-contained HTML page for each student and a class index page (index.html) instead of DOCX reports.
+    Note: This option is only available if the --all option is specified.
+--consolidate <grader_report_folder_path>
+    Generates one consolidated report card per student across all subjects from the grader reports in a folder.
+    Students are matched by name across the grader reports. The --source option is not needed in this mode.
+    Example:
+        --consolidate "C:/Grader Reports/P1A"
+--archive
+    Saves all generated reports into a single zip archive in the output folder instead of writing them one by one.
+    Recommended when the output folder is on a network share.
+    Note: This option is only available if the --all option is specified.
+--timings <profile_file_path>
+    Exports the timing spans of the job (loading, validation, comment generation, rendering, saving, conversion, and signing).
+    The file extension decides the format: .json (full profile) or .csv (one row per student with percentiles).
+    Example:
+        --timings "C:/Reports/Timings.csv"
+
+Press Ctrl+C while generating reports for all students to pause the job. You will then be asked whether to resume or cancel it.
+Students in progress finish their current step first, and the reports generated so far are kept.
 
 Example:
 report_generator.py -s "C:/Grader Report P1A Art Sample.xlsm" -o "C:/Reports" -a --student "John Doe" --force
 or
 console.py -t report_generator -s "C:/Grader Report.xlsm" -o "C:/Reports" -a --all
+or
+console.py -t report_generator -s "C:/Grader Report.xlsm" -o "C:/Reports" --all --plan
 """
 
 def get_mode():
@@ -115,8 +167,37 @@ def run():
 
     ltm.close_tool()
 
+def run_with_control(function, **kwargs):
+    """
+    Runs a generation job in a background thread so that it can be paused and cancelled with Ctrl+C.
+
+    Args:
+        function (function): The generation function. Must accept a control keyword argument (JobControl).
+        **kwargs: The keyword arguments of the generation function.
+    """
+    control = JobControl()
+    thread = threading.Thread(target = function, kwargs = {**kwargs, "control": control})
+    thread.start()
+
+    while thread.is_alive():
+        try:
+            thread.join(0.5)
+        except KeyboardInterrupt:
+            control.pause()
+            try:
+                answer = input("\n[!!] Job paused after the students in progress. Resume or cancel? (r/c): ")
+            except (KeyboardInterrupt, EOFError):
+                answer = "c"
+
+            if answer.lower() == "c":
+                print("[  ] Cancelling… Reports generated so far will be kept.")
+                control.cancel()
+            else:
+                print("[  ] Resuming…")
+                control.resume()
+
 short_args = "hs:o:afp"
-long_args = ["help", "source=", "output=", "autocorrect", "all", "student=", "force", "pdf"]
+long_args = ["help", "source=", "output=", "autocorrect", "all", "student=", "force", "pdf", "plan", "timings=", "archive", "html", "consolidate=", "pdf-backend=", "optimize", "ledger=", "manifest-key="]
 
 def main(argv):
     source_file_path = ""
@@ -125,6 +206,15 @@ def main(argv):
     generate_all = False
     force = False
     pdf = False
+    pdf_backend = "word"
+    optimize_pdf = False
+    ledger_path = ""
+    manifest_key = batch_manifest.configured_key()
+    plan = False
+    timings_path = ""
+    archive = False
+    html_output = False
+    consolidate_path = ""
 
     print(f"Argument List: {argv}")
 
@@ -153,14 +243,69 @@ def main(argv):
             force = True
         elif opt in ("-p", "--pdf"):
             pdf = True
+        elif opt == "--pdf-backend":
+            if arg not in ("word", "libreoffice", "native"):
+                print("Error! Invalid PDF backend. Use \"word\", \"libreoffice\", or \"native\".")
+                sys.exit(2)
+            pdf_backend = arg
+        elif opt == "--ledger":
+            ledger_path = arg
+        elif opt == "--manifest-key":
+            try:
+                manifest_key = batch_manifest.parse_key(arg)
+            except ValueError as e:
+                print(f"Error! {e}")
+                sys.exit(2)
+        elif opt == "--optimize":
+            optimize_pdf = True
+        elif opt == "--plan":
+            plan = True
+        elif opt == "--timings":
+            timings_path = arg
+        elif opt == "--archive":
+            archive = True
+        elif opt == "--html":
+            html_output = True
+        elif opt == "--consolidate":
+            consolidate_path = arg
+
+    if consolidate_path != "":
+        if output_file_path == "":
+            print("Error! No output file path specified.")
+            print("report_generator.py --consolidate <grader_report_folder_path> -o <output_file_path>")
+            sys.exit(2)
+
+        profiler = Profiler()
+        index = report_index.ReportIndex(profiler = profiler)
+        index.load_folder(consolidate_path)
+        consolidated_report.ConsolidatedGenerator(output_file_path, index, profiler = profiler).generate_all(autocorrect = autocorrect)
+
+        if timings_path != "":
+            profiler.export(timings_path)
+            print(f"[OK] Timings saved at {timings_path}")
+
+        ltm.close_tool()
+        return
 
     if source_file_path == "" or output_file_path == "":
         print("Error! No output and/or source file path specified.")
         print("report_generator.py -s <source_file_path> -o <output_file_path>")
         sys.exit(2)
 
-    gr = grader_report.GraderReport(source_file_path)
-    proc = processor.Generator(output_file_path, gr)
+    if archive and not generate_all:
+        print("Error! Invalid argument(s).")
+        print("The --archive option is only available if the --all option is specified.")
+        sys.exit(2)
+
+    if html_output and not generate_all:
+        print("Error! Invalid argument(s).")
+        print("The --html option is only available if the --all option is specified.")
+        sys.exit(2)
+
+    profiler = Profiler()
+    gr = grader_report.GraderReport(source_file_path, profiler = profiler)
+    ledger = SigningLedger(ledger_path, create = True) if ledger_path != "" else None
+    proc = processor.Generator(output_file_path, gr, profiler = profiler, pdf_backend = pdf_backend, ledger = ledger, manifest_key = manifest_key)
 
     if autocorrect:
         java_exists = ltm.check_java()
@@ -178,9 +323,28 @@ def main(argv):
                 print("Operation aborted. Closing program…")
                 sys.exit(2)
 
-    if generate_all:
-        proc.generate_all(autocorrect = autocorrect, force = force, convert_to_pdf = pdf)
+    if plan:
+        if generate_all:
+            report_cards = proc.plan_all(autocorrect = autocorrect, force = force)
+        else:
+            report_card = proc.plan_for_student(student_name, autocorrect = autocorrect, force = force)
+            report_cards = [report_card] if report_card is not None else []
+
+        plan_path = f"{output_file_path}/Plan {time.strftime('%Y%m%d %H%M%S')}.json"
+        report_card.export_plan(report_cards, plan_path)
+        print(f"[OK] Planned {len(report_cards)} report(s). Plan saved at {plan_path}")
+    elif html_output and generate_all:
+        proc.generate_html(autocorrect = autocorrect, force = force)
+    elif generate_all:
+        run_with_control(proc.generate_all, autocorrect = autocorrect, force = force, convert_to_pdf = pdf, archive = archive, optimize_pdf = optimize_pdf)
     else:
-        proc.generate_for_student(student_name = student_name, autocorrect = autocorrect, force = force, convert_to_pdf = pdf)
+        proc.generate_for_student(student_name = student_name, autocorrect = autocorrect, force = force, convert_to_pdf = pdf, optimize_pdf = optimize_pdf)
+
+    if timings_path != "":
+        profiler.export(timings_path)
+        print(f"[OK] Timings saved at {timings_path}")
+
+    if ledger is not None:
+        ledger.close()
 
     ltm.close_tool()
\ No newline at end of file
@@ -0,0 +1,109 @@
+"""
+This module is a console handler for the JARS program verification server (InManage).
+
+It is meant to be used in the command line to answer report authenticity checks over HTTP,
+e.g. from the school website or from other schools, instead of checking each report by hand in the GUI application.
+"""
+
+__version__ = "1.0.0"
+__author__ = "Raven Limadinata"
+
+if __name__ == "__main__":
+    print("This script is not meant to be run directly. Please run this script from console.py file.")
+    exit()
+
+import getopt
+import sys
+
+import components.common.verification_service as verification_service
+
+help_text = """
+HELP PAGE
+=========
+This tool runs a local HTTP service that verifies the JARSIM Digital Signature of report cards.
+Requests are handled concurrently, and the verdicts of files that were already verified are answered from a cache.
+
+Endpoints:
+POST /verify
+    Verifies an uploaded PDF file (a multipart "file" field, or the request body with Content-Type: application/pdf).
+GET /verify/hash/<hash>
+    Looks up a report by its file hash or JARSIM hash.
+GET /verify/serial/<serial_number>
+    Looks up a report by its serial number.
+The response is a JSON object with the result and the reason. Uploaded files are "Pass" or "Fail".
+With a ledger, an uploaded file with a valid signature that is not recorded in the ledger is "Signature Valid" instead of "Pass".
+Lookups only find the ledger entry, so they are "Recorded" (or "Superseded" if the report was signed again later).
+Anything that is not found is "Unknown".
+
+The built-in server is meant for this computer or a trusted local network only. To serve other computers, run the
+service with a production WSGI server such as waitress, e.g.:
+    waitress.serve(verification_service.create_app("C:/Reports/Signing Ledger.db"), host = "0.0.0.0", port = 8080)
+
+=========
+USAGE
+=========
+Format:
+console.py -t serve --host <address> --port <port> --ledger <ledger_file_path> --help
+
+Options:
+-h, --help
+    Displays this help page.
+--host <address>
+    Specifies the address to listen on. Defaults to 127.0.0.1 (this computer only).
+--port <port>
+    Specifies the port to listen on. Defaults to 8080.
+--ledger <ledger_file_path>
+    Specifies an existing signing ledger (see console.py -t report_generator --ledger).
+    With a ledger, hash and serial number lookups are only answered from the ledger.
+    Without one, they only find files that were uploaded to the service before.
+
+Example:
+console.py -t serve --port 8080 --ledger "C:/Reports/Signing Ledger.db"
+curl -F "file=@Report.pdf" http://127.0.0.1:8080/verify
+"""
+
+def run():
+    port = input("Enter the port to listen on (leave empty for 8080): ")
+    ledger_path = input("Enter the path to the signing ledger (leave empty to skip): ")
+
+    print("[  ] Starting the verification server. Press Ctrl+C to stop it.")
+    try:
+        verification_service.serve(port = int(port) if port.isdigit() else 8080, ledger_path = ledger_path if ledger_path != "" else None)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Error! The signing ledger could not be opened. Details: {e}")
+
+short_args = "h"
+long_args = ["help", "host=", "port=", "ledger="]
+
+def main(argv):
+    host = "127.0.0.1"
+    port = 8080
+    ledger_path = None
+
+    try:
+        opts, args = getopt.getopt(argv, short_args, long_args)
+    except getopt.GetoptError:
+        print("Error! Invalid argument(s).")
+        print("console.py -t serve --host <address> --port <port> --ledger <ledger_file_path> --help")
+        sys.exit(2)
+
+    for opt, arg in opts:
+        if opt in ("-h", "--help"):
+            print(help_text)
+            sys.exit()
+        elif opt == "--host":
+            host = arg
+        elif opt == "--port":
+            if not arg.isdigit() or not 0 < int(arg) < 65536:
+                print("Error! The port must be a number between 1 and 65535.")
+                sys.exit(2)
+            port = int(arg)
+        elif opt == "--ledger":
+            ledger_path = arg
+
+    print(f"[  ] Starting the verification server at http://{host}:{port}. Press Ctrl+C to stop it.")
+    try:
+        verification_service.serve(host = host, port = port, ledger_path = ledger_path)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Error! The signing ledger could not be opened. Details: {e}")
+        sys.exit(2)
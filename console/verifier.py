@@ -0,0 +1,302 @@
+"""
+This module is a console handler for the JARS program report verifier (InManage).
+
+It is meant to be used in the command line as an alternative to the GUI application.
+The console application is more suitable for auditing whole archives of reports by using a batch script.
+"""
+
+__version__ = "1.0.0"
+__author__ = "Raven Limadinata"
+
+if __name__ == "__main__":
+    print("This script is not meant to be run directly. Please run this script from console.py file.")
+    exit()
+
+import getopt
+import os
+import sys
+import time
+
+from termcolor import colored
+
+import components.common.batch_manifest as batch_manifest
+import components.common.batch_verifier as batch_verifier
+from components.common.ledger import SigningLedger
+from components.common.verification_cache import VerificationCache
+
+help_text = """
+HELP PAGE
+=========
+This tool verifies the JARSIM Digital Signature of every PDF report under a folder (including its subfolders).
+The files are verified in parallel, one worker process per CPU core.
+
+=========
+USAGE
+=========
+Format:
+console.py -t verify -s <folder_path> -o <summary_file_path> --workers <count> --help
+console.py -t verify --manifest <manifest_file_path> -s <folder_path> --manifest-key <key> --export-proofs <folder_path>
+console.py -t verify --proof <proof_file_path> -s <file_path> --manifest-key <key>
+
+Options:
+-h, --help
+    Displays this help page.
+-s, --source <folder_path>
+    Specifies the folder to verify.
+    Example:
+        C:/Reports/AY2024-2025
+-o, --output <summary_file_path>
+    Specifies the summary file to save the results in (.csv or .xlsx).
+    The summary lists the result, reason, serial number, signer, and signing time of each file.
+    Example:
+        C:/Reports/Verification Summary.xlsx
+--workers <count>
+    Specifies the number of worker processes. Defaults to the number of CPU cores.
+--ledger <ledger_file_path>
+    Specifies a signing ledger (see console.py -t report_generator --ledger). Files recorded in the ledger are verified
+    with a quick lookup; the other files are verified in full. The ledger must already exist.
+    Serial numbers that were recorded for more than one different file are listed in the summary and count as failures.
+--cache <cache_file_path>
+    Specifies a verification cache (.json). Files that are unchanged since they were last verified with the same cache
+    are not verified again, so repeated scans of an archive only verify the new and changed files.
+    Results are only reused for the same kind of scan: without a ledger, or with the same unchanged ledger.
+    The cache file is created if it does not exist.
+    Example:
+        C:/Reports/Verification Cache.json
+--manifest <manifest_file_path>
+    Verifies a whole batch against its batch manifest (<class> Batch Manifest.json) instead of verifying each file's signature.
+    Each file is only hashed once. The folder defaults to the folder of the manifest; use -s to verify a copy elsewhere.
+    Only the files listed in the manifest are checked; other files in the folder (e.g. other classes' reports) are ignored.
+    Example:
+        --manifest "C:/Reports/Art P1A S1 AY2024-2025 Batch Manifest.json"
+--manifest-key <key>
+    Specifies the key the batch manifest was signed with. Defaults to the "batch_manifest_key" setting.
+    A manifest without a key only has a checksum, which does not prove that the reports are authentic.
+--export-proofs <folder_path>
+    With --manifest, saves an inclusion proof (<file name>.proof.json) for every file in the batch after it is verified.
+    A single report can then be verified with its proof alone (see --proof).
+--proof <proof_file_path>
+    Verifies a single file (given with -s) with its inclusion proof.
+
+Exit codes:
+0   All files passed.
+1   At least one file failed or could not be read, or the ledger has duplicate serial numbers.
+2   Invalid arguments, no PDF files were found, or the ledger could not be opened.
+
+Example:
+console.py -t verify -s "C:/Reports/AY2024-2025" -o "C:/Reports/Verification Summary.xlsx"
+"""
+
+def run():
+    folder_path = input("Enter the path to the folder to verify: ")
+    output_file_path = input("Enter the path to the summary file (.csv or .xlsx, leave empty to skip): ")
+
+    verify_folder(folder_path, output_file_path)
+
+def verify_folder(folder_path, output_file_path = "", workers = None, ledger_path = None, cache_path = None):
+    """
+    Verifies every PDF file under a folder and prints a summary.
+
+    Args:
+        folder_path (str): The path of the folder.
+        output_file_path (str): The path of the summary file (.csv or .xlsx). No summary file is saved if empty.
+        workers (int): The number of worker processes. Defaults to the number of CPU cores.
+        ledger_path (str): The path of a signing ledger to look the files up in first.
+        cache_path (str): The path of a verification cache to reuse and update.
+
+    Returns:
+        int: The exit code (0 if all files passed, 1 if any file failed or the ledger has duplicate serial numbers,
+             2 if no files were found or the ledger could not be opened).
+    """
+    duplicates = {}
+    if ledger_path is not None:
+        try:
+            with SigningLedger(ledger_path) as ledger:
+                duplicates = ledger.duplicates()
+        except (OSError, ValueError) as e:
+            print(f"Error! The signing ledger could not be opened. Details: {e}")
+            return 2
+
+    file_paths = batch_verifier.find_pdfs(folder_path)
+    if len(file_paths) == 0:
+        print(f"Error! No PDF files found in {folder_path}.")
+        return 2
+
+    print(f"[  ] Verifying {len(file_paths)} file(s)…")
+    start_time = time.time()
+
+    def on_progress(current, total, message):
+        if not message.startswith("Pass"):
+            print(colored(f"[!!] {message}", "red"))
+        if current % 100 == 0 or current == total:
+            print(f"Progress: {round(current / total * 100, 2)}% ({current}/{total})")
+
+    cache = VerificationCache(cache_path) if cache_path is not None else None
+    cached_count = len(cache) if cache is not None else 0
+
+    results = batch_verifier.verify_files(file_paths, workers = workers, callback = on_progress, ledger_path = ledger_path, cache = cache)
+
+    if cache is not None:
+        cache.save()
+        print(f"[OK] Verification cache saved at {cache_path} ({len(cache)} file(s), {cached_count} before this scan).")
+
+    for result in results:
+        if result["Serial Number"] in duplicates:
+            result["Reason"] += f" Note: The serial number {result['Serial Number']} is recorded in the ledger for {duplicates[result['Serial Number']]} different files."
+
+    passed_count = len([result for result in results if result["Result"] == "Pass"])
+    print(f"[OK] Verified {len(results)} file(s) in {round(time.time() - start_time, 2)} seconds. "
+          f"{passed_count} passed, {len(results) - passed_count} failed.")
+
+    for serial_number, count in duplicates.items():
+        print(colored(f"[!!] The serial number {serial_number} is recorded in the ledger for {count} different files.", "red"))
+    if len(duplicates) > 0:
+        print(colored(f"[!!] {len(duplicates)} duplicate serial number(s) found in the signing ledger.", "red"))
+
+    if output_file_path != "":
+        batch_verifier.export_results(results, output_file_path)
+        print(f"[OK] Summary saved at {output_file_path}")
+
+    return 0 if passed_count == len(results) and len(duplicates) == 0 else 1
+
+def verify_manifest(manifest_path, folder_path = "", key = None, proofs_path = ""):
+    """
+    Verifies the files of a batch against its batch manifest and prints a summary.
+
+    Args:
+        manifest_path (str): The path of the batch manifest.
+        folder_path (str): The path of the folder with the files. Defaults to the folder of the manifest.
+                           Only the files listed in the manifest are checked.
+        key (bytes): The key the manifest was signed with. None for an unkeyed manifest.
+        proofs_path (str): The path of a folder to save the inclusion proof of every file in. No proofs are saved if empty.
+
+    Returns:
+        int: The exit code (0 if every file is unchanged, 1 if any file is changed or missing, 2 if the manifest is invalid).
+    """
+    try:
+        manifest = batch_manifest.load_manifest(manifest_path, key = key)
+    except (OSError, ValueError, KeyError) as e:
+        print(colored(f"[!!] The batch manifest could not be verified. Details: {e}", "red"))
+        return 2
+
+    if manifest.key is None:
+        print(colored("[!!] The batch manifest is not signed with a key. It only shows that the files match the manifest, not that they are authentic.", "yellow"))
+
+    folder_path = folder_path or os.path.dirname(os.path.abspath(manifest_path))
+    print(f"[  ] Verifying the {len(manifest.names())} file(s) listed in the batch manifest in {folder_path}…")
+    passed, results = manifest.verify_folder(folder_path)
+
+    for name, status in results.items():
+        if status != "OK":
+            print(colored(f"[!!] {status}: {name}", "red"))
+
+    other_count = len([name for name in os.listdir(folder_path) if name.lower().endswith(".pdf") and name not in results]) if os.path.isdir(folder_path) else 0
+    if other_count > 0:
+        print(f"[  ] {other_count} other PDF file(s) in the folder are not part of this batch and were not checked.")
+
+    unchanged_count = len([status for status in results.values() if status == "OK"])
+    print(f"[OK] {unchanged_count} of {len(results)} file(s) unchanged since the batch was {'signed' if manifest.key is not None else 'generated'}.")
+
+    if proofs_path != "":
+        proof_paths = manifest.save_proofs(proofs_path)
+        print(f"[OK] {len(proof_paths)} inclusion proof(s) saved in {proofs_path}")
+
+    return 0 if passed else 1
+
+def verify_with_proof(file_path, proof_path, key = None):
+    """
+    Verifies a single file with its inclusion proof and prints the result.
+
+    Args:
+        file_path (str): The path to the file.
+        proof_path (str): The path of the proof file.
+        key (bytes): The key the batch was signed with. None for an unkeyed batch.
+
+    Returns:
+        int: The exit code (0 if the file is part of the batch and unchanged, 1 if not, 2 if the proof is invalid).
+    """
+    try:
+        passed = batch_manifest.verify_proof(file_path, batch_manifest.load_proof(proof_path), key = key)
+    except (OSError, ValueError, KeyError) as e:
+        print(colored(f"[!!] The proof could not be verified. Details: {e}", "red"))
+        return 2
+
+    if not passed:
+        print(colored(f"[!!] {file_path} does not match its proof. It has been changed or is not part of the batch.", "red"))
+        return 1
+
+    if key is None:
+        print(colored("[!!] The batch is not signed with a key. The proof only shows that the file matches the batch, not that it is authentic.", "yellow"))
+    print(f"[OK] {file_path} is unchanged and part of the batch.")
+    return 0
+
+short_args = "hs:o:"
+long_args = ["help", "source=", "output=", "workers=", "ledger=", "cache=", "manifest=", "manifest-key=", "export-proofs=", "proof="]
+
+def main(argv):
+    folder_path = ""
+    output_file_path = ""
+    workers = None
+    ledger_path = None
+    cache_path = None
+    manifest_path = ""
+    manifest_key = batch_manifest.configured_key()
+    proofs_path = ""
+    proof_path = ""
+
+    try:
+        opts, args = getopt.getopt(argv, short_args, long_args)
+    except getopt.GetoptError:
+        print("Error! Invalid argument(s).")
+        print("console.py -t verify -s <folder_path> -o <summary_file_path> --workers <count> --help")
+        sys.exit(2)
+
+    for opt, arg in opts:
+        if opt in ("-h", "--help"):
+            print(help_text)
+            sys.exit()
+        elif opt in ("-s", "--source"):
+            folder_path = arg
+        elif opt in ("-o", "--output"):
+            output_file_path = arg
+        elif opt == "--workers":
+            if not arg.isdigit() or int(arg) < 1:
+                print("Error! The number of workers must be a positive number.")
+                sys.exit(2)
+            workers = int(arg)
+        elif opt == "--ledger":
+            ledger_path = arg
+        elif opt == "--cache":
+            cache_path = arg
+        elif opt == "--manifest":
+            manifest_path = arg
+        elif opt == "--manifest-key":
+            try:
+                manifest_key = batch_manifest.parse_key(arg)
+            except ValueError as e:
+                print(f"Error! {e}")
+                sys.exit(2)
+        elif opt == "--export-proofs":
+            proofs_path = arg
+        elif opt == "--proof":
+            proof_path = arg
+
+    if manifest_path != "":
+        sys.exit(verify_manifest(manifest_path, folder_path, key = manifest_key, proofs_path = proofs_path))
+
+    if proof_path != "":
+        if folder_path == "":
+            print("Error! No file specified. Use -s to specify the file to verify with the proof.")
+            sys.exit(2)
+        sys.exit(verify_with_proof(folder_path, proof_path, key = manifest_key))
+
+    if folder_path == "":
+        print("Error! No folder path specified.")
+        print("console.py -t verify -s <folder_path> -o <summary_file_path>")
+        sys.exit(2)
+
+    if output_file_path != "" and not output_file_path.lower().endswith((".csv", ".xlsx")):
+        print("Error! The summary file must be a .csv or .xlsx file.")
+        sys.exit(2)
+
+    sys.exit(verify_folder(folder_path, output_file_path, workers = workers, ledger_path = ledger_path, cache_path = cache_path))
@@ -1,10 +1,26 @@
+import functools
 import os
+import threading
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+from queue import Empty, Queue
 
 import customtkinter as ctk
 import tkinter as tk
+from tkinter import ttk
 
-import components.common.integrity as integrity
+try:
+    from tkinterdnd2 import DND_FILES, TkinterDnD
+except ImportError:
+    # Drag and drop is optional; files can always be added with the file dialogs
+    TkinterDnD = None
+
+import components.common.batch_manifest as batch_manifest
+import components.common.batch_verifier as batch_verifier
 import components.common.metadata as metadata
+import components.common.verification_cache as verification_cache
+from components.common.verification_cache import DEFAULT_CACHE_PATH, VerificationCache
+
+POLL_INTERVAL = 100
 
 class InManageVerifierWindow(ctk.CTkToplevel):
     def __init__(self, master, **kwargs):
@@ -24,46 +40,90 @@ class InManageVerifierWindow(ctk.CTkToplevel):
         self.bind("<Destroy>", self.__on_destroy)
 
     def __on_destroy(self, event):
-        """Shows the master window when this window is destroyed."""
+        """Stops the verification workers and shows the master window when this window is destroyed."""
         if event.widget == self:
+            self.inmanage_frame.shutdown()
             self.master.deiconify()
 
 class InManageVerifierFrame(ctk.CTkFrame):
     """
     A custom frame for the InManage Verifier application.
 
-    This frame contains various widgets for selecting a file to verify and verifying it.
-    Also displays the result of the verification.
+    This frame contains a verification queue: files added with the file dialogs (or dropped onto the results table when
+    tkinterdnd2 is installed) are verified on a pool of worker processes, and each result is shown in the results table
+    as soon as it is ready, so the window stays responsive while large files are verified.
+    Selecting a file in the results table shows its signature information and verification result.
 
     Attributes:
         Buttons:
-            btn_file (CTkButton): The button for browsing the file to verify.
-            btn_verify (CTkButton): The button for verifying the selected file.
+            btn_add_files (CTkButton): The button for adding files to the queue.
+            btn_add_folder (CTkButton): The button for adding every PDF file in a folder to the queue.
+            btn_verify_manifest (CTkButton): The button for verifying a folder against its batch manifest.
+            btn_clear (CTkButton): The button for clearing the finished results.
 
         Labels:
             lbl_title (CTkLabel): The application window title.
-            lbl_file (CTkLabel): The label for the file selection.
+            lbl_queue (CTkLabel): The label for the results table.
+            lbl_progress (CTkLabel): The progress of the queue.
             lbl_output (CTkLabel): The label for the output text box.
-            lbl_info (CTkLabel): The label for the verification result.
+            lbl_info (CTkLabel): The verification result of the selected file.
 
         Textboxes and Entries:
-            txt_file (CTkEntry): The text entry for the file to verify.
-            txt_output (CTkTextbox): The text box for displaying the verification result.
+            txt_output (CTkTextbox): The text box for displaying the verification result of the selected file.
+
+        Tree View:
+            tv_results (Treeview): The results table with the result and serial number of each file.
     """
     def __init__(self, master, root, **kwargs):
         super().__init__(master, **kwargs, fg_color = "transparent")
         self.root = root
 
+        # Files that are unchanged since they were last verified are not verified again
+        self.__cache = VerificationCache(DEFAULT_CACHE_PATH)
+
+        # The worker pool is started with the first file, since starting the worker processes takes a moment
+        self.__executor = None
+        self.__executor_lock = threading.Lock()
+        self.__results_queue = Queue()
+        self.__results = {}
+        self.__pending = set()
+        self.__polling = False
+
         """
         WIDGETS SETUP
         """
         # Title
         self.lbl_title = ctk.CTkLabel(self, text = "InManage | Report Integrity Verifier", font = ("Arial", 20, "bold"))
 
-        # File selection
-        self.lbl_file = ctk.CTkLabel(self, text = "File to verify:")
-        self.txt_file = ctk.CTkEntry(self, width = 250)
-        self.btn_file = ctk.CTkButton(self, text = "Browse…", command = self.__open_file)
+        # Queue controls
+        self.frm_queue_control = ctk.CTkFrame(self, fg_color = "transparent")
+        self.btn_add_files = ctk.CTkButton(self.frm_queue_control, text = "Add Files…", width = 100, command = self.__open_files)
+        self.btn_add_folder = ctk.CTkButton(self.frm_queue_control, text = "Add Folder…", width = 100, command = self.__open_folder)
+        self.btn_verify_manifest = ctk.CTkButton(self.frm_queue_control, text = "Verify Manifest…", width = 120, fg_color = "purple", command = self.__verify_manifest)
+        self.btn_clear = ctk.CTkButton(self.frm_queue_control, text = "Clear", width = 70, fg_color = "grey", command = self.__clear)
+
+        # Results table
+        self.lbl_queue = ctk.CTkLabel(self, text = "Files:")
+        style = ttk.Style()
+
+        if ctk.get_appearance_mode() == "Dark":
+            style.theme_use("alt")
+            style.configure("InManage.Treeview", background = "gray24", fieldbackground = "gray14", foreground = "white")
+
+        self.tv_results = ttk.Treeview(self, columns = ("result", "serial_number"), height = 8, style = "InManage.Treeview")
+        self.tv_results.column("#0", width = 260)
+        self.tv_results.column("result", width = 70, anchor = tk.CENTER)
+        self.tv_results.column("serial_number", width = 190)
+        self.tv_results.heading("#0", text = "File")
+        self.tv_results.heading("result", text = "Result")
+        self.tv_results.heading("serial_number", text = "Serial Number")
+        self.tv_results.tag_configure("Pass", foreground = "green")
+        self.tv_results.tag_configure("Fail", foreground = "red")
+        self.tv_results.tag_configure("Error", foreground = "orange")
+        self.tv_results.tag_configure("Pending", foreground = "grey")
+        self.vsb_results = ttk.Scrollbar(self, orient = "vertical", command = self.tv_results.yview)
+        self.tv_results.configure(yscrollcommand = self.vsb_results.set)
+        self.lbl_progress = ctk.CTkLabel(self, text = "Add files or a folder to verify.")
 
         # File signature information
         self.lbl_signature_info = ctk.CTkLabel(self, text = "Signature Information:")
@@ -84,90 +144,282 @@ class InManageVerifierFrame(ctk.CTkFrame):
         """
         GUI LAYOUTING
         """
-        self.lbl_title.grid(row = 0, column = 0, sticky = tk.W, columnspan = 2, padx = 5, pady = (5, 10))
-
-        self.lbl_file.grid(row = 1, column = 0, sticky = tk.W, padx = 5, pady = 2)
-        self.txt_file.grid(row = 1, column = 1, sticky = tk.EW, padx = (5, 2), pady = 2)
-        self.btn_file.grid(row = 1, column = 2, sticky = tk.E, padx = (2, 5), pady = 2)
-
-        self.lbl_signature_info.grid(row = 2, column = 0, sticky = tk.W, padx = 5, pady = 2, columnspan = 2)
-        
-        self.lbl_signer.grid(row = 3, column = 0, sticky = tk.W, padx = 5, pady = 2)
-        self.txt_signer.grid(row = 3, column = 1, columnspan = 2, sticky = tk.EW, padx = 5, pady = 2)
-        
-        self.lbl_signed_on.grid(row = 4, column = 0, sticky = tk.W, padx = 5, pady = 2)
-        self.txt_signed_on.grid(row = 4, column = 1, columnspan = 2, sticky = tk.EW, padx = 5, pady = 2)
-        
-        self.lbl_hash.grid(row = 5, column = 0, sticky = tk.W, padx = 5, pady = 2)
-        self.txt_hash.grid(row = 5, column = 1, columnspan = 2, sticky = tk.EW, padx = 5, pady = 2)
-
-        self.lbl_serial_number.grid(row = 6, column = 0, sticky = tk.W, padx = 5, pady = 2)
-        self.txt_serial_number.grid(row = 6, column = 1, columnspan = 2, sticky = tk.EW, padx = 5, pady = 2)
-
-        self.lbl_output.grid(row = 7, column = 0, sticky = tk.NW, padx = 5, pady = 2)
-        self.txt_output.grid(row = 7, column = 1, columnspan = 2, sticky = tk.EW, padx = 5, pady = 2)
-
-        self.lbl_info.grid(row = 8, column = 2, sticky = tk.EW, padx = 5, pady = 2)
-
-    def __open_file(self):
-        """Opens a file dialog to select a file."""
-        file_path = ctk.filedialog.askopenfilename(title = "Select a file to integrity check…", defaultextension = ".pdf", filetypes = [("Portable Document Format", ".pdf")])
-        self.txt_file.delete(0, tk.END)
-        self.txt_file.insert(0, file_path)
-
-        if os.path.isfile(file_path):
-            # Reset results field
-            self.txt_output.configure(state = tk.NORMAL)
-            self.txt_output.delete("1.0", tk.END)
-            self.txt_output.configure(state = tk.DISABLED)
-            self.lbl_info.configure(text = "PENDING", fg_color = "blue")
+        self.lbl_title.grid(row = 0, column = 0, sticky = tk.W, columnspan = 3, padx = 5, pady = (5, 10))
 
-            # Get metadata
-            data = metadata.get_pdf_metadata(file_path)
-
-            # Show signature metadata
-            self.txt_signer.configure(state = tk.NORMAL)
-            self.txt_signer.delete(0, tk.END)
-            self.txt_signer.insert(0, data.get("/Signed By", "N/A"))
-            self.txt_signer.configure(state = tk.DISABLED)
-
-            self.txt_signed_on.configure(state = tk.NORMAL)
-            self.txt_signed_on.delete(0, tk.END)
-            self.txt_signed_on.insert(0, data.get("/Signed On", "N/A"))
-            self.txt_signed_on.configure(state = tk.DISABLED)
-            
-            self.txt_hash.configure(state = tk.NORMAL)
-            self.txt_hash.delete(0, tk.END)
-            self.txt_hash.insert(0, data.get("/Hash", "N/A"))
-            self.txt_hash.configure(state = tk.DISABLED)
-
-            self.txt_serial_number.configure(state = tk.NORMAL)
-            self.txt_serial_number.delete(0, tk.END)
-            self.txt_serial_number.insert(0, data.get("/Serial Number", "N/A"))
-            self.txt_serial_number.configure(state = tk.DISABLED)
-
-            self.__verify()
-
-    def __verify(self):
-        """Verifies the integrity of the selected file."""
-        file_path = self.txt_file.get()
-
-        if not os.path.isfile(file_path):
-            self.txt_output.configure(state = tk.NORMAL)
-            self.txt_output.delete("1.0", tk.END)
-            self.txt_output.insert("1.0", "The file does not exist!\nPlease check the file path and select a valid file to verify.")
-            self.txt_output.configure(state = tk.DISABLED)
-            self.lbl_info.configure(text = "FAIL", fg_color = "red")
+        self.frm_queue_control.grid(row = 1, column = 0, columnspan = 3, sticky = tk.W, padx = 5, pady = 2)
+        self.btn_add_files.pack(side = tk.LEFT, padx = (0, 2))
+        self.btn_add_folder.pack(side = tk.LEFT, padx = 2)
+        self.btn_verify_manifest.pack(side = tk.LEFT, padx = 2)
+        self.btn_clear.pack(side = tk.LEFT, padx = 2)
+
+        self.lbl_queue.grid(row = 2, column = 0, sticky = tk.W, columnspan = 3, padx = 5, pady = 2)
+        self.tv_results.grid(row = 3, column = 0, columnspan = 3, sticky = tk.NSEW, padx = (5, 0), pady = 2)
+        self.vsb_results.grid(row = 3, column = 3, sticky = tk.NS, padx = (0, 5), pady = 2)
+        self.lbl_progress.grid(row = 4, column = 0, columnspan = 3, sticky = tk.W, padx = 5, pady = 2)
+
+        self.lbl_signature_info.grid(row = 5, column = 0, sticky = tk.W, padx = 5, pady = 2, columnspan = 2)
+
+        self.lbl_signer.grid(row = 6, column = 0, sticky = tk.W, padx = 5, pady = 2)
+        self.txt_signer.grid(row = 6, column = 1, columnspan = 2, sticky = tk.EW, padx = 5, pady = 2)
+
+        self.lbl_signed_on.grid(row = 7, column = 0, sticky = tk.W, padx = 5, pady = 2)
+        self.txt_signed_on.grid(row = 7, column = 1, columnspan = 2, sticky = tk.EW, padx = 5, pady = 2)
+
+        self.lbl_hash.grid(row = 8, column = 0, sticky = tk.W, padx = 5, pady = 2)
+        self.txt_hash.grid(row = 8, column = 1, columnspan = 2, sticky = tk.EW, padx = 5, pady = 2)
+
+        self.lbl_serial_number.grid(row = 9, column = 0, sticky = tk.W, padx = 5, pady = 2)
+        self.txt_serial_number.grid(row = 9, column = 1, columnspan = 2, sticky = tk.EW, padx = 5, pady = 2)
+
+        self.lbl_output.grid(row = 10, column = 0, sticky = tk.NW, padx = 5, pady = 2)
+        self.txt_output.grid(row = 10, column = 1, columnspan = 2, sticky = tk.EW, padx = 5, pady = 2)
+
+        self.lbl_info.grid(row = 11, column = 2, sticky = tk.EW, padx = 5, pady = 2)
+
+        """
+        EVENT BINDINGS
+        """
+        self.tv_results.bind("<<TreeviewSelect>>", lambda event: self.__show_selected())
+        self.__enable_drop()
+
+    def shutdown(self):
+        """Stops the verification workers. Files that have not been verified yet are dropped."""
+        with self.__executor_lock:
+            executor, self.__executor = self.__executor, None
+        if executor is not None:
+            executor.shutdown(wait = False, cancel_futures = True)
+        self.__cache.save()
+
+    def __enable_drop(self):
+        """Lets files and folders be dropped onto the results table if tkinterdnd2 is installed."""
+        if TkinterDnD is None:
             return
 
-        integrous, output_text = integrity.verify_pdf(file_path)
-        
+        try:
+            TkinterDnD._require(self.winfo_toplevel())
+            self.tv_results.drop_target_register(DND_FILES)
+            self.tv_results.dnd_bind("<<Drop>>", self.__on_drop)
+        except (tk.TclError, RuntimeError, AttributeError):
+            # The tkdnd Tcl package could not be loaded
+            return
+
+        self.lbl_queue.configure(text = "Files (drop PDF files or folders here):")
+
+    def __on_drop(self, event):
+        """Adds the dropped files and folders to the queue."""
+        file_paths = []
+        for path in self.tk.splitlist(event.data):
+            if os.path.isdir(path):
+                file_paths += batch_verifier.find_pdfs(path)
+            elif path.lower().endswith(".pdf"):
+                file_paths.append(path)
+
+        self.__enqueue(file_paths)
+        return event.action
+
+    def __open_files(self):
+        """Opens a file dialog to select one or more files to verify."""
+        file_paths = ctk.filedialog.askopenfilenames(title = "Select files to integrity check…", defaultextension = ".pdf", filetypes = [("Portable Document Format", ".pdf")])
+        self.__enqueue(list(file_paths))
+
+    def __open_folder(self):
+        """Opens a folder dialog to verify every PDF file in a folder (including its subfolders)."""
+        folder_path = ctk.filedialog.askdirectory(title = "Select a folder to integrity check…")
+        if folder_path:
+            self.__enqueue(batch_verifier.find_pdfs(folder_path))
+
+    def __verify_manifest(self):
+        """
+        Opens a file dialog to select a batch manifest and verifies the files it lists against it. Other files in its folder
+        (e.g. the reports of other classes) are not touched.
+        The manifest is checked with the "batch_manifest_key" setting; each file is only hashed, so this is quick even for large batches.
+        """
+        manifest_path = ctk.filedialog.askopenfilename(title = "Select a batch manifest…", defaultextension = ".json", filetypes = [("Batch Manifest", ".json")])
+        if not manifest_path:
+            return
+
+        try:
+            manifest = batch_manifest.load_manifest(manifest_path, key = batch_manifest.configured_key())
+        except (OSError, ValueError, KeyError) as e:
+            self.lbl_progress.configure(text = f"The batch manifest could not be verified. {e}")
+            return
+
+        folder_path = os.path.dirname(manifest_path)
+        _, statuses = manifest.verify_folder(folder_path)
+
+        for name, status in statuses.items():
+            file_path = os.path.normpath(os.path.join(folder_path, name))
+            if status == "OK":
+                reason = "The file is unchanged since the batch was signed." if manifest.key is not None else \
+                         "The file matches the batch manifest. The manifest is not signed with a key, so this does not prove that the file is authentic."
+                result = {"File": file_path, "Result": "Pass", "Reason": reason}
+            elif status == "Changed":
+                result = {"File": file_path, "Result": "Fail", "Reason": "The file has been changed since the batch manifest was created."}
+            else:
+                result = {"File": file_path, "Result": "Error", "Reason": "The file listed in the batch manifest is missing."}
+
+            if self.tv_results.exists(file_path):
+                self.tv_results.item(file_path, values = (result["Result"].upper(), ""), tags = (result["Result"],))
+            else:
+                self.tv_results.insert("", tk.END, iid = file_path, text = name, values = (result["Result"].upper(), ""), tags = (result["Result"],))
+            self.__results[file_path] = result
+
+        self.__update_progress()
+
+    def __enqueue(self, file_paths):
+        """
+        Adds files to the verification queue. Cached results are shown right away; the other files are sent to the worker pool.
+
+        Args:
+            file_paths (list): The paths of the files to be verified.
+        """
+        for file_path in file_paths:
+            file_path = os.path.normpath(file_path)
+            if file_path in self.__pending or not os.path.isfile(file_path):
+                continue
+
+            if self.tv_results.exists(file_path):
+                self.tv_results.item(file_path, values = ("…", ""), tags = ("Pending",))
+            else:
+                self.tv_results.insert("", tk.END, iid = file_path, text = os.path.basename(file_path), values = ("…", ""), tags = ("Pending",))
+            self.__results.pop(file_path, None)
+            self.__pending.add(file_path)
+
+            identity = verification_cache.identify(file_path)
+            result = self.__cache.get(file_path, identity)
+            if result is not None:
+                result["File"] = file_path
+                self.__results_queue.put(result)
+                continue
+
+            with self.__executor_lock:
+                if self.__executor is None:
+                    self.__executor = ProcessPoolExecutor()
+                executor = self.__executor
+
+            try:
+                future = executor.submit(batch_verifier.verify_file, file_path)
+            except Exception as e:
+                # The pool is broken or the worker processes could not be started. The next file gets a new pool.
+                self.__reset_executor(executor)
+                self.__results_queue.put(batch_verifier.error_result(file_path, e))
+                continue
+            future.add_done_callback(functools.partial(self.__on_verified, executor, file_path, identity))
+
+        self.__update_progress()
+        if not self.__polling and len(self.__pending) > 0:
+            self.__polling = True
+            self.after(POLL_INTERVAL, self.__poll_results)
+
+    def __on_verified(self, executor, file_path, identity, future):
+        """
+        Passes a finished verification to the main thread. Runs on the worker pool's thread, so the widgets are not touched here.
+
+        Args:
+            executor (ProcessPoolExecutor): The worker pool the file was verified on.
+            file_path (str): The path to the verified file.
+            identity (dict): The identity of the file read before it was queued (see verification_cache.identify).
+            future (Future): The finished verification.
+        """
+        if future.cancelled():
+            return
+
+        try:
+            result = future.result()
+        except Exception as e:
+            # A worker process died (e.g. BrokenProcessPool); the remaining files of this pool fail the same way
+            if isinstance(e, BrokenExecutor):
+                self.__reset_executor(executor)
+            self.__results_queue.put(batch_verifier.error_result(file_path, e))
+            return
+
+        # Files that could not be read are tried again next time
+        if result["Result"] != "Error":
+            self.__cache.put(file_path, identity, result)
+        self.__results_queue.put(result)
+
+    def __reset_executor(self, executor):
+        """Drops a broken worker pool, so that the next file starts a new one. Does nothing if the pool was already replaced."""
+        with self.__executor_lock:
+            if self.__executor is not executor:
+                return
+            self.__executor = None
+        # The queued files are failed by the broken pool itself; cancelling them would leave them pending
+        executor.shutdown(wait = False)
+
+    def __poll_results(self):
+        """Shows the finished verifications in the results table. Keeps polling while files are pending."""
+        try:
+            while True:
+                result = self.__results_queue.get_nowait()
+                file_path = result["File"]
+                self.__pending.discard(file_path)
+                if not self.tv_results.exists(file_path):
+                    continue # Cleared while it was being verified
+
+                self.__results[file_path] = result
+                self.tv_results.item(file_path, values = (result["Result"].upper(), result.get("Serial Number", "")), tags = (result["Result"],))
+                if file_path in self.tv_results.selection():
+                    self.__show_selected()
+        except Empty:
+            pass
+
+        self.__update_progress()
+        if len(self.__pending) > 0:
+            self.after(POLL_INTERVAL, self.__poll_results)
+        else:
+            self.__polling = False
+            self.__cache.save()
+
+    def __update_progress(self):
+        """Updates the progress label of the queue."""
+        results = list(self.__results.values())
+        failed_count = len([result for result in results if result["Result"] != "Pass"])
+
+        if len(self.__pending) > 0:
+            self.lbl_progress.configure(text = f"Verifying… {len(results)} of {len(results) + len(self.__pending)} file(s) done, {failed_count} failed.")
+        elif len(results) > 0:
+            self.lbl_progress.configure(text = f"Done. {len(results) - failed_count} of {len(results)} file(s) passed, {failed_count} failed.")
+        else:
+            self.lbl_progress.configure(text = "Add files or a folder to verify.")
+
+    def __clear(self):
+        """Removes the files from the results table. Files that are still being verified are dropped when they finish."""
+        self.tv_results.delete(*self.tv_results.get_children())
+        self.__results = {}
+        self.__show_selected()
+        self.__update_progress()
+
+    def __show_selected(self):
+        """Shows the signature information and verification result of the selected file."""
+        selection = self.tv_results.selection()
+        file_path = selection[0] if len(selection) > 0 else None
+        result = self.__results.get(file_path)
+
+        # Get metadata (only the end of the file is read)
+        try:
+            data = (metadata.get_pdf_metadata(file_path) or {}) if file_path is not None else {}
+        except Exception:
+            data = {}
+
+        # Show signature metadata
+        for entry, key in ((self.txt_signer, "/Signed By"), (self.txt_signed_on, "/Signed On"), (self.txt_hash, "/Hash"), (self.txt_serial_number, "/Serial Number")):
+            entry.configure(state = tk.NORMAL)
+            entry.delete(0, tk.END)
+            entry.insert(0, data.get(key, "N/A") if file_path is not None else "")
+            entry.configure(state = tk.DISABLED)
+
+        # Show verification result
         self.txt_output.configure(state = tk.NORMAL)
         self.txt_output.delete("1.0", tk.END)
-        self.txt_output.insert("1.0", output_text)
+        self.txt_output.insert("1.0", result["Reason"] if result is not None else "")
         self.txt_output.configure(state = tk.DISABLED)
 
-        if integrous:
+        if file_path is None:
+            self.lbl_info.configure(text = "-", fg_color = "transparent")
+        elif result is None:
+            self.lbl_info.configure(text = "PENDING", fg_color = "blue")
+        elif result["Result"] == "Pass":
             self.lbl_info.configure(text = "PASS", fg_color = "green")
         else:
-            self.lbl_info.configure(text = "FAIL", fg_color = "red")
\ No newline at end of file
+            self.lbl_info.configure(text = "FAIL", fg_color = "red")
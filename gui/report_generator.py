@@ -12,11 +12,15 @@ from windows_toasts import InteractableWindowsToaster, Toast, ToastAudio, AudioS
 
 import config
 import components.report_generator.semester_report as processor
+import components.common.batch_manifest as batch_manifest
 import components.common.grader_report as grader_report
 import components.report_generator.comment_generator_test as cgen_test
+import components.report_generator.text_renderer as text_renderer
 import components.utility as util
 from gui.dialog import OutputDialog
 from components.report_generator.comment_generator import CommentGenerator
+from components.report_generator.pipeline import JobControl
+from components.report_generator.report_card import ReportCardBuilder
 from components.utility import check_word_status
 
 class ReportGeneratorWindow(ctk.CTkToplevel):
@@ -60,6 +64,8 @@ class ReportGeneratorFrame(ctk.CTkFrame):
             btn_validate (CTkButton): The button for validating the grader report.
             btn_process (CTkButton): The button for processing the report.
             btn_scan_word (CTkButton): The button to start manual scanning of MS Word installation.
+            btn_pause (CTkButton): The button for pausing and resuming the report generation.
+            btn_cancel (CTkButton): The button for cancelling the report generation.
 
         Labels:
             lbl_source (CTkLabel): The label for the source file path.
@@ -80,6 +86,7 @@ class ReportGeneratorFrame(ctk.CTkFrame):
             txt_signature_path (CTkEntry): The textbox for the signature file path.
             txt_student_name (CTkEntry): The textbox for the student name.
             txt_status (CTkTextbox): The textbox for the status message.
+            txt_preview (CTkTextbox): The textbox for the report preview of the selected student.
 
         Switches:
             switch_autocorrect (CTkSwitch): The switch for enabling/disabling autocorrect.
@@ -123,6 +130,11 @@ class ReportGeneratorFrame(ctk.CTkFrame):
         __scan_word(self): Scans the device for MS Word installation.
         __on_progress_update(self, current, total, status_message): Updates the progress bar.
         __update_status(self, status_message, clear = False): Updates the status message.
+        __toggle_pause(self): Pauses or resumes the running report generation.
+        __cancel_process(self): Cancels the running report generation.
+        __schedule_preview(self): Schedules a report preview update for the selected student.
+        __selected_student(self): Gets the student of the selected tree view item.
+        __update_preview(self): Renders the report preview of the selected student.
     """
 
     def __init__(self, master, root, office_version, **kwargs):
@@ -132,6 +144,12 @@ class ReportGeneratorFrame(ctk.CTkFrame):
         self.__office_version = office_version
         
         self._grader_report = None
+        self.job_control = None
+
+        # Report preview state
+        self.__tv_student_list = None
+        self.__preview_cache = {}
+        self.__preview_job = None
 
         """
         MENUBAR SETUP
@@ -262,6 +280,11 @@ class ReportGeneratorFrame(ctk.CTkFrame):
         self.btn_validate = ctk.CTkButton(self, text = "Validate Grader Report", width = 150, fg_color = "grey", command = self.__validate)
         self.btn_configure = ctk.CTkButton(self, text = "Settings…", width = 150, fg_color = "purple", command = self.__open_configurator)
 
+        # Job control buttons
+        self.frm_job_control = ctk.CTkFrame(self, fg_color = "transparent")
+        self.btn_pause = ctk.CTkButton(self.frm_job_control, text = "Pause", width = 70, fg_color = "grey", state = tk.DISABLED, command = self.__toggle_pause)
+        self.btn_cancel = ctk.CTkButton(self.frm_job_control, text = "Cancel", width = 70, fg_color = "dark red", state = tk.DISABLED, command = self.__cancel_process)
+
         # Tree View
         self.lbl_treeview = ctk.CTkLabel(self, text = "Grader Report Explorer")
         self.lbl_tv_search = ctk.CTkLabel(self, text = "Search:", width = 50)
@@ -282,6 +305,11 @@ class ReportGeneratorFrame(ctk.CTkFrame):
 
         self.vsb_treeview = ttk.Scrollbar(self, orient = "vertical", command = self.treeview.yview)
 
+        # Report Preview
+        self.lbl_preview = ctk.CTkLabel(self, text = "Report Preview")
+        self.txt_preview = ctk.CTkTextbox(self, width = 480, state = tk.DISABLED, wrap = "word", font = ("Consolas", 12))
+        self.txt_preview.tag_config("heading", foreground = "cyan")
+
         # Tooltips
         tooltip_font = ("Arial", 10)
         tooltips = {
@@ -294,6 +322,8 @@ class ReportGeneratorFrame(ctk.CTkFrame):
             self.txt_student_name: "Enter the name of the student to generate the report for. This is only enabled when the generate for student option is selected.",
             self.date_report: "Select the date to insert in the report. This is only enabled when the insert date option is selected.",
             self.btn_process: "Start generating the reports.",
+            self.btn_pause: "Pause the report generation after the students in progress, or resume it.",
+            self.btn_cancel: "Stop the report generation after the students in progress. Reports generated so far are kept.",
             self.btn_validate: "Validate the grader report for errors.",
             self.rdo_map_mode: "Use the comment map to generate student comments.",
             self.rdo_ai_mode: "Use AI to generate student comments. Note: AI is dumb and may not work as expected. This requires an API key to be set in the configuration file. Please supply your own key. Check the JARS GitHub page for guide on obtaining an API key.",
@@ -330,6 +360,8 @@ class ReportGeneratorFrame(ctk.CTkFrame):
         self.btn_browse_signature.grid(row = 2, column = 3, sticky = tk.EW, padx = 2, pady = 2)
         self.treeview.grid(row = 2, column = 4, rowspan = 11, columnspan = 2, sticky = tk.NSEW, padx = (10, 0), pady = 2)
         self.vsb_treeview.grid(row = 2, column = 6, rowspan = 11, sticky = tk.NS, padx = (0, 10), pady = 2)
+        self.lbl_preview.grid(row = 0, column = 7, sticky = tk.EW, padx = 10, pady = 2)
+        self.txt_preview.grid(row = 1, column = 7, rowspan = 12, sticky = tk.NSEW, padx = 10, pady = 2)
 
         self.lbl_generate.grid(row = 3, column = 0, sticky = tk.W, pady = 2)
         self.rdo_generate_all.grid(row = 3, column = 1, sticky = tk.W, padx =  5, pady = 2)
@@ -365,6 +397,9 @@ class ReportGeneratorFrame(ctk.CTkFrame):
 
         self.btn_configure.grid(row = 13, column = 0, sticky = tk.EW, padx = 2, pady = (20, 2))
         self.btn_validate.grid(row = 13, column = 1, sticky = tk.EW, padx = 2, pady = (20, 2))
+        self.frm_job_control.grid(row = 13, column = 2, sticky = tk.E, padx = 2, pady = (20, 2))
+        self.btn_pause.grid(row = 0, column = 0, padx = (0, 2))
+        self.btn_cancel.grid(row = 0, column = 1, padx = (2, 0))
         self.btn_process.grid(row = 13, column = 3, sticky = tk.EW, padx = 2, pady = (20, 2))
 
         """
@@ -387,10 +422,7 @@ class ReportGeneratorFrame(ctk.CTkFrame):
         if self.always_on_pdf_var.get():
             self.switch_pdf.select()
 
-        # Check if MS Word is installed and disable PDF switch if not found
-        if not office_version:
-            self.switch_pdf.configure(state = tk.DISABLED)
-            self.switch_pdf.deselect()
+        # PDF creation falls back to the native renderer if MS Word is not found, so the PDF switch stays enabled
 
         # Bind search function to search entry
         self.txt_tv_search.bind("<Return>", lambda event: self.__search_treeview())
@@ -399,6 +431,9 @@ class ReportGeneratorFrame(ctk.CTkFrame):
         # Bind scrollbars to treeview
         self.treeview.configure(yscrollcommand = self.vsb_treeview.set)
 
+        # Bind report preview to treeview selection
+        self.treeview.bind("<<TreeviewSelect>>", lambda event: self.__schedule_preview())
+
     # UI functions
     def __browse_file(self):
         """Opens a file dialog for browsing the source file."""
@@ -431,6 +466,7 @@ class ReportGeneratorFrame(ctk.CTkFrame):
     def __populate_treeview(self):
         """Populates the tree view with the grader report data."""
         self.treeview.delete(*self.treeview.get_children()) # Clear treeview
+        self.__preview_cache = {} # Previews of the previous grader report are no longer valid
         
         self.treeview.insert("", tk.END, text = "Grader Report Version", values = (self._grader_report._version))
         self.treeview.insert("", tk.END, text = "School Year", values = (self._grader_report.get_course_info("School Year")))
@@ -442,6 +478,7 @@ class ReportGeneratorFrame(ctk.CTkFrame):
 
         # Show student list from dataframe
         tv_student_list = self.treeview.insert("", tk.END, text = "Student List:")
+        self.__tv_student_list = tv_student_list
         for index, row in self._grader_report.students.iterrows():
             # Generic Display
             student = self.treeview.insert(tv_student_list, tk.END, text = index)
@@ -511,12 +548,14 @@ class ReportGeneratorFrame(ctk.CTkFrame):
         """Enables autocorrect toggle"""
         self.switch_autocorrect.configure(state = tk.NORMAL)
         self.switch_delay.configure(state = tk.DISABLED)
+        self.__schedule_preview()
 
     def __ai_cgen_mode_selected(self):
         """Disables autocorrect toggle"""
         self.switch_autocorrect.configure(state = tk.DISABLED)
         if self.mode_var.get() == "all":
             self.switch_delay.configure(state = tk.NORMAL)
+        self.__schedule_preview()
 
     def __toggle_date_entry(self):
         """Enables or disables the date entry field when the insert date option is selected or not."""
@@ -528,7 +567,7 @@ class ReportGeneratorFrame(ctk.CTkFrame):
     def __pdf_tooltip_message(self):
         """Returns the tooltip message for the PDF switch button."""
         if not self.__office_version:
-            return "PDF creation is disabled because Microsoft Office is not installed."
+            return "Enable this to create PDF copies of the generated reports. Microsoft Office is not installed, so the PDFs are rendered directly."
         else:
             return "Enable this to convert the generated reports to PDF."
         
@@ -542,6 +581,8 @@ class ReportGeneratorFrame(ctk.CTkFrame):
         else:
             self.btn_process.configure(state = tk.NORMAL)
             self.btn_validate.configure(state = tk.NORMAL)
+            self.btn_pause.configure(state = tk.DISABLED, text = "Pause")
+            self.btn_cancel.configure(state = tk.DISABLED)
 
             # Get return value from thread
             result = self.thread_queue.get()
@@ -549,6 +590,11 @@ class ReportGeneratorFrame(ctk.CTkFrame):
                 self.__update_status("Report generation failed or was aborted.")
                 return
 
+            if self.job_control.cancelled:
+                self.lbl_count.configure(text = "Cancelled")
+                self.__update_status("Warning: Report generation cancelled. Reports generated before cancelling are kept in the output folder.")
+                return
+
             # Post-operation
             self.lbl_count.configure(text = "Done!")
             self.__update_status("Report generation completed successfully.")
@@ -576,9 +622,13 @@ class ReportGeneratorFrame(ctk.CTkFrame):
     def __threaded_process(self):
         """Starts the report generation in a separate thread."""
         self.thread_queue = Queue()
+        self.job_control = JobControl()
         process_thread = threading.Thread(target = self.__process, args = (self.thread_queue,))
         self.btn_process.configure(state = tk.DISABLED)
         self.btn_validate.configure(state = tk.DISABLED)
+        if self.mode_var.get() == "all":
+            self.btn_pause.configure(state = tk.NORMAL)
+            self.btn_cancel.configure(state = tk.NORMAL)
         process_thread.start()
         self.master.after(1000, self.__check_threaded_process, process_thread)
 
@@ -602,7 +652,9 @@ class ReportGeneratorFrame(ctk.CTkFrame):
                                    grader_report = self._grader_report, 
                                    date = date, signature_path = signature_file, 
                                    cgen_mode = self.cgen_mode_var.get(), 
-                                   use_watermark = True if self.watermark_var.get() == 1 else False)
+                                   use_watermark = True if self.watermark_var.get() == 1 else False,
+                                   pdf_backend = "word" if self.__office_version else "native",
+                                   manifest_key = batch_manifest.configured_key())
 
         mode = self.mode_var.get()
         autocorrect = True if self.autocorrect_var.get() == 1 else False
@@ -640,7 +692,7 @@ class ReportGeneratorFrame(ctk.CTkFrame):
             if mode == "all":
                 delay = True if self.delay_var.get() == 1 else False
                 proc.generate_all(callback = self.__on_progress_update, autocorrect = autocorrect, force = force, 
-                                  convert_to_pdf = pdf, delay = delay)
+                                  convert_to_pdf = pdf, delay = delay, control = self.job_control)
             elif mode == "student":
                 student_name = self.txt_student_name.get()
                 self.__on_progress_update(0, 1, f"Generating report for {student_name}…")
@@ -653,6 +705,31 @@ class ReportGeneratorFrame(ctk.CTkFrame):
 
         return queue.put(True)  
 
+    def __toggle_pause(self):
+        """Pauses or resumes the running report generation. Students that are being processed finish their current step first."""
+        if self.job_control is None or self.job_control.cancelled:
+            return
+
+        if self.job_control.paused:
+            self.job_control.resume()
+            self.btn_pause.configure(text = "Pause")
+            self.__update_status("Info: Report generation resumed.")
+        else:
+            self.job_control.pause()
+            self.btn_pause.configure(text = "Resume")
+            self.__update_status("Info: Report generation paused. Students in progress will finish their current step first.")
+
+    def __cancel_process(self):
+        """Cancels the running report generation. Reports generated so far and the AI manifest are kept."""
+        if self.job_control is None:
+            return
+
+        if tk.messagebox.askyesno("Cancel Report Generation", "Do you want to stop generating reports?\nReports generated so far will be kept."):
+            self.job_control.cancel()
+            self.btn_pause.configure(state = tk.DISABLED, text = "Pause")
+            self.btn_cancel.configure(state = tk.DISABLED)
+            self.__update_status("Warning: Cancelling report generation… Students in progress will finish their current step first.")
+
     def __toast_button_click(self, toastEvent):
         """Event handler for the toast button click."""
         if toastEvent.arguments == "open_folder":
@@ -743,9 +820,8 @@ class ReportGeneratorFrame(ctk.CTkFrame):
         # Set GUI
         if office_version:
             self.__office_version = office_version
-            self.switch_pdf.configure(state = tk.NORMAL)
-            self.__update_status("Microsoft Office detected. PDF creation is enabled.")
-            print("  Microsoft Office detected. PDF creation is enabled.")
+            self.__update_status("Microsoft Office detected. PDFs are now converted with Microsoft Word.")
+            print("  Microsoft Office detected. PDFs are now converted with Microsoft Word.")
 
     def __test_api_key(self, suppress_dialog = False):
         """
@@ -876,4 +952,67 @@ class ReportGeneratorFrame(ctk.CTkFrame):
         self.txt_status.configure(state = tk.DISABLED)
         self.txt_status.see(tk.END)
 
-        tk.Misc.update_idletasks(self)
\ No newline at end of file
+        tk.Misc.update_idletasks(self)
+
+    def __schedule_preview(self):
+        """
+        Schedules a report preview update for the selected student.
+        Rapid selection changes (e.g. scrolling with the arrow keys) only render the last selected student.
+        """
+        if self.__preview_job is not None:
+            self.after_cancel(self.__preview_job)
+        self.__preview_job = self.after(100, self.__update_preview)
+
+    def __selected_student(self):
+        """
+        Gets the student of the selected tree view item. Any item under a student (e.g. a grade) selects that student.
+
+        Returns:
+            str: The name of the student. None if the selection is not under the student list.
+        """
+        selection = self.treeview.selection()
+        if self.__tv_student_list is None or len(selection) == 0:
+            return None
+
+        item = selection[0]
+        while item != "" and self.treeview.parent(item) != self.__tv_student_list:
+            item = self.treeview.parent(item)
+
+        return self.treeview.item(item)["text"] if item != "" else None
+
+    def __update_preview(self):
+        """
+        Renders the report preview of the selected student in memory. No file is written and MS Word is not used.
+
+        Report cards are cached per student and comment mode. The date and signature are applied on every update
+        so that changes to these options show up right away. AI comments and autocorrect are not previewed
+        as they need network requests.
+        """
+        self.__preview_job = None
+        student_name = self.__selected_student()
+        if student_name is None or self._grader_report is None:
+            return
+
+        cgen_mode = self.cgen_mode_var.get()
+        if (student_name, cgen_mode) not in self.__preview_cache:
+            try:
+                builder = ReportCardBuilder(grader_report = self._grader_report)
+                report_card = builder.prepare(student_name)
+                if cgen_mode == "map":
+                    builder.write_comment(report_card, autocorrect = False)
+                else:
+                    report_card.comment = "(AI-generated comments are written during report generation.)"
+            except Exception as e:
+                self.__update_status(f"Error: Unable to preview the report for {student_name}. Details: {e}")
+                return
+            self.__preview_cache[(student_name, cgen_mode)] = report_card
+
+        report_card = self.__preview_cache[(student_name, cgen_mode)]
+        report_card.date = self.date_report.get_date() if self.inject_date.get() == 1 else None
+        report_card.signature_path = self.txt_signature_path.get() if self.txt_signature_path.get() != "" else None
+
+        self.txt_preview.configure(state = tk.NORMAL)
+        self.txt_preview.delete("1.0", tk.END)
+        for line in text_renderer.render(report_card).split("\n"):
+            self.txt_preview.insert(tk.END, f"{line}\n", tags = "heading" if line in text_renderer.SECTION_TITLES else None)
+        self.txt_preview.configure(state = tk.DISABLED)
@@ -9,6 +9,7 @@ __version__ = "1.3.2"
 __author__ = "Raven Limadinata"
 
 import customtkinter as ctk
+import multiprocessing
 import pyfiglet
 import tkinter as tk
 import tktooltip as tktip
@@ -108,41 +109,45 @@ class Window(ctk.CTk):
 """
 CHECKS
 """
-print(colored(pyfiglet.figlet_format("JARS CReP", font = "slant"), "magenta"))
-print(f"JARS Report Processor v{__version__}\n")
-
-print("> Running system checks…")
-
-# Check if MS Word is running
-print("> Checking Microsoft Word status…")
-is_running, office_version, error = check_word_status()
-if error:
-    print(f"  An error occurred: {error}")
-    print("  Microsoft Office not detected.")
-
-# Check if Moodle database is reachable
-if not config.get_config("skip_moodle_check"):
-    try:
-        if moodle.test_connection(supress = True):
-            moodle_reachable = True
-            print("  Moodle database connection successful.")
-        else:
+# Worker processes (PDF finalization) import this module too, so only the main process runs the checks and the GUI
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+
+    print(colored(pyfiglet.figlet_format("JARS CReP", font = "slant"), "magenta"))
+    print(f"JARS Report Processor v{__version__}\n")
+
+    print("> Running system checks…")
+
+    # Check if MS Word is running
+    print("> Checking Microsoft Word status…")
+    is_running, office_version, error = check_word_status()
+    if error:
+        print(f"  An error occurred: {error}")
+        print("  Microsoft Office not detected.")
+
+    # Check if Moodle database is reachable
+    if not config.get_config("skip_moodle_check"):
+        try:
+            if moodle.test_connection(supress = True):
+                moodle_reachable = True
+                print("  Moodle database connection successful.")
+            else:
+                moodle_reachable = False
+                print("  Cannot reach Moodle database.")
+        except Exception as e:
             moodle_reachable = False
-            print("  Cannot reach Moodle database.")
-    except Exception as e:
+            print(f"  Moodle database connection failed due to excecption: {e}")
+    else:
         moodle_reachable = False
-        print(f"  Moodle database connection failed due to excecption: {e}")
-else:
-    moodle_reachable = False
-    print("  Skipping Moodle database connection check.")
+        print("  Skipping Moodle database connection check.")
 
-print("> System checks completed.")
+    print("> System checks completed.")
 
-# Apply GUI settings
-print("> Applying GUI settings…")
-ctk.set_appearance_mode(config.get_config("appearance_mode"))
-ctk.set_default_color_theme(config.get_config("color_theme"))
+    # Apply GUI settings
+    print("> Applying GUI settings…")
+    ctk.set_appearance_mode(config.get_config("appearance_mode"))
+    ctk.set_default_color_theme(config.get_config("color_theme"))
 
-windll.shcore.SetProcessDpiAwareness(1)
-window = Window()
-window.mainloop()
\ No newline at end of file
+    windll.shcore.SetProcessDpiAwareness(1)
+    window = Window()
+    window.mainloop()
\ No newline at end of file